@@ -0,0 +1,104 @@
+"""Partition visits, messages and notifications by month
+
+Revision ID: 0462f01ec287
+Revises: db7c3230f876
+Create Date: 2026-10-19 14:03:27.551930
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.config.settings import get_settings
+from src.infrastructure.database.partitioning import ensure_partitions
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0462f01ec287'
+down_revision: Union[str, None] = 'db7c3230f876'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Constraints and indexes are not carried over by CREATE TABLE ... (LIKE ...)
+TABLES = {
+    'visits': {
+        'foreign_keys': [
+            ('visitor_id', 'users'),
+            ('visited_user_id', 'users'),
+        ],
+        'indexes': [
+            ('ix_visits_id', ['id'], None),
+            ('ix_visits_visited_user_id_created_at', ['visited_user_id', 'created_at'], None),
+            ('ix_visits_visitor_id_created_at', ['visitor_id', 'created_at'], None),
+        ],
+    },
+    'messages': {
+        'foreign_keys': [
+            ('conversation_id', 'conversations'),
+            ('sender_id', 'users'),
+            ('receiver_id', 'users'),
+        ],
+        'indexes': [
+            ('ix_messages_id', ['id'], None),
+            ('ix_messages_conversation_id_created_at', ['conversation_id', 'created_at'], None),
+            ('ix_messages_sender_id', ['sender_id'], None),
+            ('ix_messages_receiver_id_unread', ['receiver_id'], "status <> 'read'"),
+        ],
+    },
+    'notifications': {
+        'foreign_keys': [
+            ('user_id', 'users'),
+            ('related_user_id', 'users'),
+        ],
+        'indexes': [
+            ('ix_notifications_id', ['id'], None),
+            ('ix_notifications_user_id_created_at', ['user_id', 'created_at'], None),
+            ('ix_notifications_user_id_unread', ['user_id'], 'NOT read'),
+            ('ix_notifications_created_at', ['created_at'], None),
+        ],
+    },
+}
+
+
+def _rebuild(table: str, spec: dict, partitioned: bool) -> None:
+    """Swap table for a (non-)partitioned copy holding the same rows."""
+    bind = op.get_bind()
+    old = f'{table}_old'
+
+    op.rename_table(table, old)
+    if partitioned:
+        op.execute(f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)')
+        op.execute(f"UPDATE {old} SET created_at = now() AT TIME ZONE 'utc' WHERE created_at IS NULL")
+        op.alter_column(table, 'created_at', nullable=False)
+
+        # Every existing row needs a partition, including future-dated ones
+        first, last = bind.execute(sa.text(f'SELECT min(created_at), max(created_at) FROM {old}')).one()
+        first_month = first.date() if first is not None else date.today()
+        last_month = last.date() if last is not None else None
+        ensure_partitions(bind, table, first_month, get_settings().PARTITION_PREMAKE_MONTHS, last_month)
+    else:
+        op.execute(f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS)')
+        op.alter_column(table, 'created_at', nullable=True)
+
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+    op.execute(f'ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id')
+    op.drop_table(old)
+
+    op.create_primary_key(f'{table}_pkey', table, ['id', 'created_at'] if partitioned else ['id'])
+    for column, referred_table in spec['foreign_keys']:
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referred_table, [column], ['id'])
+    for name, columns, where in spec['indexes']:
+        op.create_index(name, table, columns, unique=False, postgresql_where=sa.text(where) if where else None)
+
+
+def upgrade() -> None:
+    for table, spec in TABLES.items():
+        _rebuild(table, spec, partitioned=True)
+
+
+def downgrade() -> None:
+    for table, spec in TABLES.items():
+        _rebuild(table, spec, partitioned=False)
@@ -0,0 +1,49 @@
+"""Notify profile changes for the in-memory profile store
+
+Revision ID: 3e7d9b2c6f14
+Revises: 8c3f5a91e6d2
+Create Date: 2026-10-19 18:21:07.512934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e7d9b2c6f14'
+down_revision: Union[str, None] = '8c3f5a91e6d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Payload is the user id; the listener reloads that profile once the
+# transaction commits (NOTIFY deduplicates identical payloads per transaction)
+NOTIFY_PROFILE_CHANGE = """
+CREATE FUNCTION notify_profile_change() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM pg_notify('profile_changes', OLD.user_id::text);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM pg_notify('profile_changes', NEW.user_id::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_PROFILE_CHANGE)
+    op.execute(
+        'CREATE TRIGGER user_profiles_notify_change '
+        'AFTER INSERT OR UPDATE OR DELETE ON user_profiles '
+        'FOR EACH ROW EXECUTE FUNCTION notify_profile_change()'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER user_profiles_notify_change ON user_profiles')
+    op.execute('DROP FUNCTION notify_profile_change()')
@@ -0,0 +1,29 @@
+"""Add case-insensitive login indexes
+
+Revision ID: 5b8e21c4d7a9
+Revises: 0462f01ec287
+Create Date: 2026-10-19 15:21:08.417362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e21c4d7a9'
+down_revision: Union[str, None] = '0462f01ec287'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Login: get_credentials matches lower(email) / lower(username)
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=False)
+    op.create_index('ix_users_username_lower', 'users', [sa.text('lower(username)')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_username_lower', table_name='users')
+    op.drop_index('ix_users_email_lower', table_name='users')
\ No newline at end of file
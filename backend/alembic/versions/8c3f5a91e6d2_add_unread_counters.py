@@ -0,0 +1,124 @@
+"""Add unread counters maintained by triggers
+
+Revision ID: 8c3f5a91e6d2
+Revises: 5b8e21c4d7a9
+Create Date: 2026-10-19 16:02:44.730215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3f5a91e6d2'
+down_revision: Union[str, None] = '5b8e21c4d7a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Every change to a counter is announced on this channel (payload: user id)
+# so the Redis mirror can refresh it once the transaction commits
+ADJUST_UNREAD_COUNTER = """
+CREATE FUNCTION adjust_unread_counter(p_user_id integer, p_messages integer, p_notifications integer)
+RETURNS void AS $$
+BEGIN
+    INSERT INTO unread_counters AS c (user_id, messages, notifications)
+    VALUES (p_user_id, greatest(p_messages, 0), greatest(p_notifications, 0))
+    ON CONFLICT (user_id) DO UPDATE
+    SET messages = greatest(c.messages + p_messages, 0),
+        notifications = greatest(c.notifications + p_notifications, 0);
+    PERFORM pg_notify('unread_counters', p_user_id::text);
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# A message is unread for its receiver until its status becomes 'read'
+COUNT_UNREAD_MESSAGES = """
+CREATE FUNCTION count_unread_messages() RETURNS trigger AS $$
+DECLARE
+    was_unread boolean := TG_OP <> 'INSERT' AND OLD.status IS DISTINCT FROM 'read';
+    is_unread boolean := TG_OP <> 'DELETE' AND NEW.status IS DISTINCT FROM 'read';
+BEGIN
+    IF was_unread AND is_unread AND OLD.receiver_id = NEW.receiver_id THEN
+        RETURN NULL;
+    END IF;
+    IF was_unread THEN
+        PERFORM adjust_unread_counter(OLD.receiver_id, -1, 0);
+    END IF;
+    IF is_unread THEN
+        PERFORM adjust_unread_counter(NEW.receiver_id, 1, 0);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+COUNT_UNREAD_NOTIFICATIONS = """
+CREATE FUNCTION count_unread_notifications() RETURNS trigger AS $$
+DECLARE
+    was_unread boolean := TG_OP <> 'INSERT' AND OLD.read IS NOT TRUE;
+    is_unread boolean := TG_OP <> 'DELETE' AND NEW.read IS NOT TRUE;
+BEGIN
+    IF was_unread AND is_unread AND OLD.user_id = NEW.user_id THEN
+        RETURN NULL;
+    END IF;
+    IF was_unread THEN
+        PERFORM adjust_unread_counter(OLD.user_id, 0, -1);
+    END IF;
+    IF is_unread THEN
+        PERFORM adjust_unread_counter(NEW.user_id, 0, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.create_table('unread_counters',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('messages', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('notifications', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+    op.execute(ADJUST_UNREAD_COUNTER)
+    op.execute(COUNT_UNREAD_MESSAGES)
+    op.execute(COUNT_UNREAD_NOTIFICATIONS)
+
+    # Row triggers on the partitioned parents apply to every partition
+    op.execute(
+        'CREATE TRIGGER messages_unread_counter '
+        'AFTER INSERT OR DELETE OR UPDATE OF status, receiver_id ON messages '
+        'FOR EACH ROW EXECUTE FUNCTION count_unread_messages()'
+    )
+    op.execute(
+        'CREATE TRIGGER notifications_unread_counter '
+        'AFTER INSERT OR DELETE OR UPDATE OF read, user_id ON notifications '
+        'FOR EACH ROW EXECUTE FUNCTION count_unread_notifications()'
+    )
+
+    # Backfill from existing rows
+    op.execute("""
+        INSERT INTO unread_counters (user_id, messages, notifications)
+        SELECT user_id, sum(messages), sum(notifications) FROM (
+            SELECT receiver_id AS user_id, count(*) AS messages, 0 AS notifications
+            FROM messages WHERE status IS DISTINCT FROM 'read' GROUP BY receiver_id
+            UNION ALL
+            SELECT user_id, 0, count(*)
+            FROM notifications WHERE read IS NOT TRUE GROUP BY user_id
+        ) AS unread
+        GROUP BY user_id
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER notifications_unread_counter ON notifications')
+    op.execute('DROP TRIGGER messages_unread_counter ON messages')
+    op.execute('DROP FUNCTION count_unread_notifications()')
+    op.execute('DROP FUNCTION count_unread_messages()')
+    op.execute('DROP FUNCTION adjust_unread_counter(integer, integer, integer)')
+    op.drop_table('unread_counters')
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""Add email outbox
+
+Revision ID: 9a4c7e1f2b38
+Revises: 3e7d9b2c6f14
+Create Date: 2026-10-19 20:04:51.237716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4c7e1f2b38'
+down_revision: Union[str, None] = '3e7d9b2c6f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Wakes the dispatcher once the inserting transaction commits
+NOTIFY_EMAIL_OUTBOX = """
+CREATE FUNCTION notify_email_outbox() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('email_outbox', NEW.id::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.create_table('email_outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=50), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('status', sa.String(length=20), server_default='pending', nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('available_at', sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_email_outbox_pending', 'email_outbox', ['available_at'], unique=False, postgresql_where=sa.text("status = 'pending'"))
+
+    op.execute(NOTIFY_EMAIL_OUTBOX)
+    op.execute(
+        'CREATE TRIGGER email_outbox_notify '
+        'AFTER INSERT ON email_outbox '
+        'FOR EACH ROW EXECUTE FUNCTION notify_email_outbox()'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER email_outbox_notify ON email_outbox')
+    op.execute('DROP FUNCTION notify_email_outbox()')
+    op.drop_index('ix_email_outbox_pending', table_name='email_outbox', postgresql_where=sa.text("status = 'pending'"))
+    op.drop_table('email_outbox')
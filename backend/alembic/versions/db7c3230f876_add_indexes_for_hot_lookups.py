@@ -0,0 +1,83 @@
+"""Add indexes for hot foreign-key lookups
+
+Revision ID: db7c3230f876
+Revises: 626a29087fa9
+Create Date: 2026-10-19 10:12:41.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'db7c3230f876'
+down_revision: Union[str, None] = '626a29087fa9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Profiles: get_by_user_id runs on nearly every profile request
+    op.create_index('ix_user_profiles_user_id', 'user_profiles', ['user_id'], unique=True)
+
+    # Verification tokens: get_valid_token / invalidate_user_tokens
+    op.create_index('ix_verification_tokens_user_id_token_type', 'verification_tokens', ['user_id', 'token_type'], unique=False)
+
+    # Likes: get_like / delete_like, get_likes_received
+    op.create_index('ix_likes_user_id_target_user_id', 'likes', ['user_id', 'target_user_id'], unique=True)
+    op.create_index('ix_likes_target_user_id_created_at', 'likes', ['target_user_id', 'created_at'], unique=False)
+
+    # Matches: get_match, get_matches_by_user (either side of the pair)
+    op.create_index('ix_matches_user1_id_user2_id', 'matches', ['user1_id', 'user2_id'], unique=True)
+    op.create_index('ix_matches_user2_id', 'matches', ['user2_id'], unique=False)
+
+    # Visits: get_visits_received / get_visits_by_user, newest first
+    op.create_index('ix_visits_visited_user_id_created_at', 'visits', ['visited_user_id', 'created_at'], unique=False)
+    op.create_index('ix_visits_visitor_id_created_at', 'visits', ['visitor_id', 'created_at'], unique=False)
+
+    # Blocked users: is_user_blocked in both directions, get_blocked_users
+    op.create_index('ix_blocked_users_user_id_blocked_user_id', 'blocked_users', ['user_id', 'blocked_user_id'], unique=True)
+    op.create_index('ix_blocked_users_blocked_user_id', 'blocked_users', ['blocked_user_id'], unique=False)
+
+    # Reports: get_reports_by_user
+    op.create_index('ix_reports_reported_user_id', 'reports', ['reported_user_id'], unique=False)
+
+    # Conversations: get_conversation_by_match, get_conversations_by_user
+    op.create_index('ix_conversations_match_id', 'conversations', ['match_id'], unique=True)
+    op.create_index('ix_conversations_user1_id', 'conversations', ['user1_id'], unique=False)
+    op.create_index('ix_conversations_user2_id', 'conversations', ['user2_id'], unique=False)
+
+    # Messages: paginated history, per-sender listing, unread badge
+    op.create_index('ix_messages_conversation_id_created_at', 'messages', ['conversation_id', 'created_at'], unique=False)
+    op.create_index('ix_messages_sender_id', 'messages', ['sender_id'], unique=False)
+    op.create_index('ix_messages_receiver_id_unread', 'messages', ['receiver_id'], unique=False, postgresql_where=sa.text("status <> 'read'"))
+
+    # Notifications: paginated listing, unread badge, retention by age
+    op.create_index('ix_notifications_user_id_created_at', 'notifications', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_notifications_user_id_unread', 'notifications', ['user_id'], unique=False, postgresql_where=sa.text('NOT read'))
+    op.create_index('ix_notifications_created_at', 'notifications', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_created_at', table_name='notifications')
+    op.drop_index('ix_notifications_user_id_unread', table_name='notifications', postgresql_where=sa.text('NOT read'))
+    op.drop_index('ix_notifications_user_id_created_at', table_name='notifications')
+    op.drop_index('ix_messages_receiver_id_unread', table_name='messages', postgresql_where=sa.text("status <> 'read'"))
+    op.drop_index('ix_messages_sender_id', table_name='messages')
+    op.drop_index('ix_messages_conversation_id_created_at', table_name='messages')
+    op.drop_index('ix_conversations_user2_id', table_name='conversations')
+    op.drop_index('ix_conversations_user1_id', table_name='conversations')
+    op.drop_index('ix_conversations_match_id', table_name='conversations')
+    op.drop_index('ix_reports_reported_user_id', table_name='reports')
+    op.drop_index('ix_blocked_users_blocked_user_id', table_name='blocked_users')
+    op.drop_index('ix_blocked_users_user_id_blocked_user_id', table_name='blocked_users')
+    op.drop_index('ix_visits_visitor_id_created_at', table_name='visits')
+    op.drop_index('ix_visits_visited_user_id_created_at', table_name='visits')
+    op.drop_index('ix_matches_user2_id', table_name='matches')
+    op.drop_index('ix_matches_user1_id_user2_id', table_name='matches')
+    op.drop_index('ix_likes_target_user_id_created_at', table_name='likes')
+    op.drop_index('ix_likes_user_id_target_user_id', table_name='likes')
+    op.drop_index('ix_verification_tokens_user_id_token_type', table_name='verification_tokens')
+    op.drop_index('ix_user_profiles_user_id', table_name='user_profiles')
@@ -0,0 +1,46 @@
+"""Make case-insensitive login indexes unique
+
+Revision ID: e3b7d06a9c25
+Revises: c5e2a8d1f703
+Create Date: 2026-10-20 09:12:36.804115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b7d06a9c25'
+down_revision: Union[str, None] = 'c5e2a8d1f703'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _check_no_case_duplicates(column: str) -> None:
+    duplicates = op.get_bind().execute(sa.text(
+        f'SELECT lower({column}) FROM users GROUP BY lower({column}) HAVING count(*) > 1'
+    )).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            f'Accounts whose {column} differs only by case must be merged or '
+            f'renamed before upgrading: {", ".join(duplicates)}'
+        )
+
+
+def upgrade() -> None:
+    _check_no_case_duplicates('email')
+    _check_no_case_duplicates('username')
+
+    op.drop_index('ix_users_email_lower', table_name='users')
+    op.drop_index('ix_users_username_lower', table_name='users')
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+    op.create_index('ix_users_username_lower', 'users', [sa.text('lower(username)')], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_username_lower', table_name='users')
+    op.drop_index('ix_users_email_lower', table_name='users')
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=False)
+    op.create_index('ix_users_username_lower', 'users', [sa.text('lower(username)')], unique=False)
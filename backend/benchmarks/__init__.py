@@ -0,0 +1 @@
+"""Micro-benchmarks. Run from backend/ with: python -m benchmarks.<name>"""
@@ -0,0 +1,55 @@
+"""CPU cost against bytes saved when compressing a 100-profile page.
+
+Renders the page used by benchmarks.json_responses with ORJSONResponse
+and compresses it with each gzip level and brotli quality (if brotli is
+installed), reporting the compressed size, ratio and time per response.
+
+    python -m benchmarks.compression
+"""
+
+import gzip
+from time import perf_counter
+
+from benchmarks.json_responses import page
+from src.presentation.api.responses import ORJSONResponse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROUNDS = 200
+
+
+def measure(label: str, compress, body: bytes) -> None:
+    compressed = compress(body)
+    start = perf_counter()
+    for _ in range(ROUNDS):
+        compress(body)
+    elapsed = (perf_counter() - start) / ROUNDS * 1000
+    print(
+        f"{label:<12} {len(compressed):7d} bytes  "
+        f"{len(body) / len(compressed):5.1f}x  {elapsed:6.3f} ms"
+    )
+
+
+def main() -> None:
+    body = ORJSONResponse(page().model_dump()).body
+    print(f"{'identity':<12} {len(body):7d} bytes")
+
+    for level in (1, 4, 6, 9):
+        measure(f"gzip -{level}", lambda b, lv=level: gzip.compress(b, lv), body)
+
+    if brotli is None:
+        print("brotli not installed, skipped")
+        return
+    for quality in (1, 4, 6, 11):
+        measure(
+            f"br q{quality}",
+            lambda b, q=quality: brotli.compress(b, quality=q),
+            body,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Throughput of SMTPEmailService against an in-process SMTP sink.
+
+Starts an aiosmtpd server on localhost that accepts and discards every
+message, then sends COUNT verification and notification emails (half
+each) with CONCURRENCY concurrent senders, once per SMTP pool size.
+Reports messages per second, SMTP connections the sink saw and send
+latency percentiles. Needs aiosmtpd (dev extra).
+
+    python -m benchmarks.email_throughput [COUNT] [CONCURRENCY]
+"""
+
+import asyncio
+import socket
+import statistics
+import sys
+from time import perf_counter
+
+from aiosmtpd.controller import Controller
+
+from src.config.settings import get_settings
+from src.infrastructure.external.email.smtp_email_service import SMTPEmailService
+
+POOL_SIZES = (1, 3, 10)
+
+
+class CountingSink:
+    """Accepts everything, counts sessions and messages"""
+
+    def __init__(self):
+        self.connections = 0
+        self.messages = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        session.host_name = hostname
+        self.connections += 1
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages += 1
+        return "250 Message accepted"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run(
+    port: int, sink: CountingSink, pool_size: int, count: int, concurrency: int
+):
+    service = SMTPEmailService()
+    service.settings = get_settings().model_copy(
+        update={
+            "SMTP_HOST": "127.0.0.1",
+            "SMTP_PORT": port,
+            "SMTP_TLS": False,
+            "SMTP_USER": "",
+            "SMTP_PASSWORD": "",
+            "SMTP_POOL_SIZE": pool_size,
+        }
+    )
+    sink.connections = sink.messages = 0
+    latencies: list[float] = []
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for n in range(count):
+        queue.put_nowait(n)
+
+    async def sender() -> None:
+        while not queue.empty():
+            n = queue.get_nowait()
+            start = perf_counter()
+            if n % 2:
+                sent = await service.send_notification_email(
+                    f"user{n}@example.com", "New like", f"user{n + 1} liked you"
+                )
+            else:
+                sent = await service.send_verification_email(
+                    f"user{n}@example.com", f"user{n}", f"token-{n}"
+                )
+            assert sent, "send failed"
+            latencies.append((perf_counter() - start) * 1000)
+
+    start = perf_counter()
+    await asyncio.gather(*(sender() for _ in range(concurrency)))
+    elapsed = perf_counter() - start
+    await service.close()
+
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"pool {pool_size:>2}  {count / elapsed:8.0f} msg/s  "
+        f"{sink.connections:4d} connections  "
+        f"p50 {cuts[49]:6.2f} ms  p95 {cuts[94]:6.2f} ms  p99 {cuts[98]:6.2f} ms"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    sink = CountingSink()
+    port = free_port()
+    controller = Controller(sink, hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        print(f"{count} emails, {concurrency} concurrent senders")
+        for pool_size in POOL_SIZES:
+            asyncio.run(run(port, sink, pool_size, count, concurrency))
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    main()
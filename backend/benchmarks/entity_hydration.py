@@ -0,0 +1,133 @@
+"""Validated vs trusted hydration of entities from database rows.
+
+Converts 10k detached ORM instances to UserProfile and User entities,
+once with full pydantic validation (the previous behaviour) and once
+through the repositories' trusted model_construct path.
+
+    python -m benchmarks.entity_hydration
+"""
+
+from datetime import datetime
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.entities.user import User, UserProfile
+from src.core.value_objects.age import Age
+from src.core.value_objects.email import Email
+from src.core.value_objects.fame_rating import FameRating
+from src.core.value_objects.location import Location
+from src.infrastructure.database.models import UserModel, UserProfileModel
+from src.infrastructure.database.repositories.profile_repository_impl import (
+    ProfileRepositoryImpl,
+)
+from src.infrastructure.database.repositories.user_repository_impl import (
+    UserRepositoryImpl,
+)
+
+ROWS = 10_000
+NOW = datetime(2026, 1, 1)
+
+
+def profile_rows() -> list[UserProfileModel]:
+    return [
+        UserProfileModel(
+            id=i,
+            user_id=i,
+            age=18 + i % 60,
+            gender="female",
+            sexual_preference="bisexual",
+            biography="Hiking, cooking and bad puns.",
+            latitude=48.85,
+            longitude=2.35,
+            city="Paris",
+            country="France",
+            fame_rating=3.25,
+            interests=["hiking", "cooking", "music"],
+            pictures=["https://example.com/a.jpg"],
+            profile_completed=True,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        for i in range(ROWS)
+    ]
+
+
+def user_rows() -> list[UserModel]:
+    return [
+        UserModel(
+            id=i,
+            username=f"user{i}",
+            email=f"user{i}@example.com",
+            password_hash="$2b$12$" + "x" * 53,
+            first_name="Jane",
+            last_name="Doe",
+            status="active",
+            email_verified=True,
+            has_completed_profile=True,
+            last_seen=NOW,
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        for i in range(ROWS)
+    ]
+
+
+def validated_profile(model: UserProfileModel) -> UserProfile:
+    return UserProfile(
+        id=model.id,
+        user_id=model.user_id,
+        age=Age(model.age),
+        gender=model.gender,
+        sexual_preference=model.sexual_preference,
+        biography=model.biography,
+        location=Location(
+            latitude=model.latitude,
+            longitude=model.longitude,
+            city=model.city,
+            country=model.country,
+        ),
+        fame_rating=FameRating(model.fame_rating),
+        interests=model.interests,
+        pictures=model.pictures,
+        profile_completed=model.profile_completed,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
+def validated_user(model: UserModel) -> User:
+    return User(
+        id=model.id,
+        username=model.username,
+        email=Email(model.email),
+        password_hash=model.password_hash,
+        first_name=model.first_name,
+        last_name=model.last_name,
+        status=model.status,
+        email_verified=model.email_verified,
+        has_completed_profile=model.has_completed_profile,
+        last_seen=model.last_seen,
+        created_at=model.created_at,
+        updated_at=model.updated_at,
+    )
+
+
+def measure(name: str, convert, rows) -> None:
+    start = perf_counter()
+    for row in rows:
+        convert(row)
+    elapsed = perf_counter() - start
+    print(f"{name:<18} {elapsed * 1000:8.1f} ms / {ROWS} rows")
+
+
+if __name__ == "__main__":
+    session = AsyncSession()
+    profiles, users = profile_rows(), user_rows()
+    profile_repository = ProfileRepositoryImpl(session)
+    user_repository = UserRepositoryImpl(session)
+
+    measure("profile validated", validated_profile, profiles)
+    measure("profile trusted", profile_repository._model_to_entity, profiles)
+    measure("user validated", validated_user, users)
+    measure("user trusted", user_repository._to_entity, users)
@@ -0,0 +1,102 @@
+"""Latency of a 100-profile page through the default and fast response paths.
+
+Serves the same ProfileSearchResponse from two in-process routes and
+requests each through httpx's ASGI transport:
+
+- default: FastAPI validates the DTO against response_model again, runs
+  jsonable_encoder and encodes with the stdlib json module
+- fast: the DTO goes straight to ORJSONResponse via validated_response
+
+    python -m benchmarks.json_responses
+"""
+
+import asyncio
+import statistics
+from datetime import datetime
+from time import perf_counter
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from src.core.entities.user import UserProfile
+from src.core.value_objects.age import Age
+from src.core.value_objects.fame_rating import FameRating
+from src.core.value_objects.location import Location
+from src.presentation.api.responses import validated_response
+from src.presentation.schemas.profile_schemas import (
+    ProfileResponse,
+    ProfileSearchResponse,
+)
+
+PAGE_SIZE = 100
+REQUESTS = 500
+
+
+def page() -> ProfileSearchResponse:
+    now = datetime(2026, 1, 1)
+    profiles = [
+        UserProfile(
+            id=i,
+            user_id=i,
+            age=Age(18 + i % 60),
+            gender="female",
+            sexual_preference="bisexual",
+            biography="Hiking, cooking and bad puns. " * 5,
+            location=Location(48.85, 2.35, "Paris", "France"),
+            fame_rating=FameRating(3.25),
+            interests=["hiking", "cooking", "music", "travel"],
+            pictures=[
+                f"https://res.cloudinary.com/matcha/image/upload/v1/{i}_{n}.jpg"
+                for n in range(5)
+            ],
+            profile_completed=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(PAGE_SIZE)
+    ]
+    return ProfileSearchResponse(
+        profiles=[ProfileResponse.from_entity(p) for p in profiles],
+        total=PAGE_SIZE,
+    )
+
+
+def build_app(content: ProfileSearchResponse) -> FastAPI:
+    app = FastAPI(default_response_class=JSONResponse)
+
+    @app.get("/default", response_model=ProfileSearchResponse)
+    async def default():
+        return content
+
+    @app.get("/fast", response_model=ProfileSearchResponse)
+    async def fast():
+        return validated_response(content)
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str) -> None:
+    await client.get(path)
+    latencies = []
+    for _ in range(REQUESTS):
+        start = perf_counter()
+        response = await client.get(path)
+        latencies.append((perf_counter() - start) * 1000)
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{path:<10} p50 {cuts[49]:6.2f} ms  p99 {cuts[98]:6.2f} ms  "
+        f"{len(response.content)} bytes"
+    )
+
+
+async def main() -> None:
+    app = build_app(page())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        await measure(c, "/default")
+        await measure(c, "/fast")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
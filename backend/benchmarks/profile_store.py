@@ -0,0 +1,129 @@
+"""Memory and scan time of the columnar profile store.
+
+Fills a ProfileStore and a plain list of UserProfile entities with the
+same COUNT synthetic profiles, then compares retained memory (tracemalloc)
+and the time to filter by age, gender and distance around Paris.
+
+    python -m benchmarks.profile_store
+"""
+
+import random
+import tracemalloc
+from datetime import datetime
+from time import perf_counter
+
+from src.core.entities.user import UserProfile
+from src.core.value_objects.age import Age
+from src.core.value_objects.fame_rating import FameRating
+from src.core.value_objects.location import Location
+from src.infrastructure.cache.profile_store import ProfileStore, haversine_km
+
+COUNT = 50_000
+TAGS = [f"tag{n}" for n in range(40)]
+GENDERS = ["male", "female", "non_binary", "other"]
+PREFERENCES = ["heterosexual", "homosexual", "bisexual", "pansexual"]
+PARIS = (48.85, 2.35)
+
+
+def rows(count: int) -> list[tuple]:
+    rng = random.Random(42)
+    return [
+        (
+            user_id,
+            rng.uniform(42.0, 51.0),
+            rng.uniform(-4.5, 8.0),
+            rng.randint(18, 70),
+            rng.uniform(0.0, 5.0),
+            rng.choice(GENDERS),
+            rng.choice(PREFERENCES),
+            rng.sample(TAGS, 5),
+        )
+        for user_id in range(1, count + 1)
+    ]
+
+
+def entities(data: list[tuple]) -> list[UserProfile]:
+    now = datetime(2026, 1, 1)
+    return [
+        UserProfile.trusted(
+            id=user_id,
+            user_id=user_id,
+            age=Age.trusted(age),
+            gender=gender,
+            sexual_preference=preference,
+            biography=None,
+            location=Location.trusted(lat, lon),
+            fame_rating=FameRating.trusted(fame),
+            interests=interests,
+            pictures=[],
+            profile_completed=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for user_id, lat, lon, age, fame, gender, preference, interests in data
+    ]
+
+
+def retained(build) -> tuple[object, int]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return value, size
+
+
+def timed(label: str, scan) -> None:
+    start = perf_counter()
+    matches = 0
+    for _ in range(5):
+        matches = scan()
+    elapsed = (perf_counter() - start) / 5 * 1000
+    print(f"{label:<10} scan {elapsed:7.2f} ms  ({matches} matches)")
+
+
+def main() -> None:
+    data = rows(COUNT)
+
+    def fill_store() -> ProfileStore:
+        store = ProfileStore()
+        store.replace_all(data)
+        return store
+
+    store, store_bytes = retained(fill_store)
+    profiles, entity_bytes = retained(lambda: entities(data))
+    print(f"entities   {entity_bytes / COUNT:7.0f} bytes per profile")
+    print(
+        f"store      {store_bytes / COUNT:7.0f} bytes per profile "
+        f"({store.bytes_per_profile} in columns)"
+    )
+
+    def scan_entities() -> int:
+        return sum(
+            1
+            for p in profiles
+            if 25 <= p.age.value <= 35
+            and p.gender in ("female", "non_binary")
+            and haversine_km(*PARIS, p.location.latitude, p.location.longitude)
+            <= 50
+        )
+
+    def scan_store() -> int:
+        return sum(
+            1
+            for _ in store.filter(
+                age_min=25,
+                age_max=35,
+                genders=["female", "non_binary"],
+                latitude=PARIS[0],
+                longitude=PARIS[1],
+                max_distance_km=50,
+            )
+        )
+
+    timed("entities", scan_entities)
+    timed("store", scan_store)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""ORM vs raw asyncpg reads for the hot profile queries.
+
+Runs the profile card lookup (get_by_user_id) and the radius search
+(get_profiles_by_location_radius, with a radius covering every profile)
+both through the ORM and through the raw asyncpg path, against the
+database in DATABASE_URL. Needs a postgresql+asyncpg URL and a few
+completed profiles; nothing is written.
+
+    python -m benchmarks.raw_reads
+"""
+
+import asyncio
+from time import perf_counter
+
+from sqlalchemy import select
+
+from src.infrastructure.database.models import UserProfileModel
+from src.infrastructure.database.repositories.profile_repository_impl import (
+    ProfileRepositoryImpl,
+)
+from src.infrastructure.database.session import async_session_factory
+
+ITERATIONS = 2_000
+WHOLE_EARTH_KM = 20_040
+
+
+async def measure(name: str, iterations: int, call) -> None:
+    await call()
+    start = perf_counter()
+    for _ in range(iterations):
+        await call()
+    elapsed = perf_counter() - start
+    print(f"{name:<16} {elapsed / iterations * 1e6:10.1f} us/call")
+
+
+async def main() -> None:
+    async with async_session_factory() as session:
+        user_id = (
+            await session.execute(select(UserProfileModel.user_id).limit(1))
+        ).scalar_one_or_none()
+        if user_id is None:
+            raise SystemExit("No profiles in the database to read")
+
+        raw = ProfileRepositoryImpl(session)
+        orm = ProfileRepositoryImpl(session)
+        orm.use_raw_queries = False
+
+        cards = await raw.get_profiles_by_location_radius(0, 0, WHOLE_EARTH_KM, 0)
+        print(f"radius search returns {len(cards)} profiles")
+
+        # Clear the identity map so every ORM load builds fresh instances
+        async def orm_card():
+            session.expunge_all()
+            await orm.get_by_user_id(user_id)
+
+        async def orm_radius():
+            session.expunge_all()
+            await orm.get_profiles_by_location_radius(0, 0, WHOLE_EARTH_KM, 0)
+
+        await measure("orm card", ITERATIONS, orm_card)
+        await measure("raw card", ITERATIONS, lambda: raw.get_by_user_id(user_id))
+        await measure("orm radius", ITERATIONS // 10, orm_radius)
+        await measure(
+            "raw radius",
+            ITERATIONS // 10,
+            lambda: raw.get_profiles_by_location_radius(0, 0, WHOLE_EARTH_KM, 0),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,41 @@
+"""Per-lookup statement overhead for hot repository queries.
+
+With a warm compiled cache, SQLAlchemy still builds the select() and
+generates its cache key on every call. A lambda statement builds the
+construct once and afterwards only extracts closure values as bound
+parameters. This measures that per-call work for get_by_email.
+
+    python -m benchmarks.statement_cache
+"""
+
+from time import perf_counter
+
+from sqlalchemy import lambda_stmt, select
+
+from src.infrastructure.database.models import UserModel
+
+ITERATIONS = 50_000
+
+
+def plain(email: str):
+    stmt = select(UserModel).where(UserModel.email == email)
+    return stmt._generate_cache_key()
+
+
+def cached(email: str):
+    stmt = lambda_stmt(lambda: select(UserModel).where(UserModel.email == email))
+    return stmt._generate_cache_key()
+
+
+def measure(name: str, lookup) -> None:
+    lookup("warmup@example.com")
+    start = perf_counter()
+    for i in range(ITERATIONS):
+        lookup(f"user{i}@example.com")
+    elapsed = perf_counter() - start
+    print(f"{name:<8} {elapsed / ITERATIONS * 1e6:8.2f} us/lookup")
+
+
+if __name__ == "__main__":
+    measure("select", plain)
+    measure("lambda", cached)
@@ -0,0 +1,73 @@
+"""Per-request Unit of Work setup cost.
+
+Compares building every repository and a fresh email service on entry
+(the previous behaviour) with the lazy unit of work touching only the
+users repository, which is what most authenticated requests need. The lazy
+figure also includes entering and leaving the unit of work.
+
+The email service is now a process-wide singleton that compiles its
+templates once at startup, so the eager figure rebuilds the service the
+way its per-request constructor used to: reading the settings, without
+templates.
+
+    python -m benchmarks.uow_setup
+"""
+
+import asyncio
+from time import perf_counter
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.settings import get_settings
+from src.infrastructure.database.repositories.profile_repository_impl import (
+    ProfileRepositoryImpl,
+)
+from src.infrastructure.database.repositories.user_repository_impl import (
+    UserRepositoryImpl,
+)
+from src.infrastructure.database.repositories.verification_token_repository_impl import (
+    VerificationTokenRepositoryImpl,
+)
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.external.email.smtp_email_service import SMTPEmailService
+
+ITERATIONS = 50_000
+
+
+def per_request_email_service() -> SMTPEmailService:
+    """SMTPEmailService() as constructed per request before templates"""
+    service = SMTPEmailService.__new__(SMTPEmailService)
+    service.settings = get_settings()
+    service._pool = None
+    return service
+
+
+async def eager(session: AsyncSession) -> None:
+    UserRepositoryImpl(session)
+    VerificationTokenRepositoryImpl(session)
+    ProfileRepositoryImpl(session)
+    per_request_email_service()
+
+
+async def lazy(session: AsyncSession) -> None:
+    async with SqlAlchemyUnitOfWork(session) as uow:
+        _ = uow.users
+
+
+async def measure(name: str, setup, session: AsyncSession) -> None:
+    start = perf_counter()
+    for _ in range(ITERATIONS):
+        await setup(session)
+    elapsed = perf_counter() - start
+    print(f"{name:<8} {elapsed / ITERATIONS * 1e6:8.2f} us/request")
+
+
+async def main() -> None:
+    # An unbound session never opens a connection, so only setup is measured
+    session = AsyncSession()
+    await measure("eager", eager, session)
+    await measure("lazy", lazy, session)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
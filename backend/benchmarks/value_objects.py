@@ -0,0 +1,106 @@
+"""Construction time and memory of value objects.
+
+Compares the slotted value objects with pydantic BaseModel equivalents of
+the previous implementation: validated construction, trusted construction
+(database rows) and retained memory per instance, measured with
+tracemalloc over COUNT instances of each.
+
+    python -m benchmarks.value_objects
+"""
+
+import tracemalloc
+from time import perf_counter
+
+from pydantic import BaseModel, EmailStr, field_validator
+
+from src.core.value_objects.age import Age
+from src.core.value_objects.email import Email
+from src.core.value_objects.fame_rating import FameRating
+from src.core.value_objects.location import Location
+
+COUNT = 100_000
+
+
+class PydanticAge(BaseModel):
+    value: int
+
+    @field_validator("value")
+    @classmethod
+    def validate_age(cls, v):
+        if not 18 <= v <= 120:
+            raise ValueError("Age must be between 18 and 120")
+        return v
+
+
+class PydanticFameRating(BaseModel):
+    value: float
+
+    @field_validator("value")
+    @classmethod
+    def validate_rating(cls, v):
+        if not 0.0 <= v <= 5.0:
+            raise ValueError("Fame rating must be between 0.0 and 5.0")
+        return round(v, 2)
+
+
+class PydanticEmail(BaseModel):
+    value: EmailStr
+
+
+class PydanticLocation(BaseModel):
+    latitude: float
+    longitude: float
+    city: str | None = None
+    country: str | None = None
+
+
+CASES = {
+    "Age": (
+        lambda i: PydanticAge(value=18 + i % 60),
+        lambda i: Age(18 + i % 60),
+        lambda i: Age.trusted(18 + i % 60),
+    ),
+    "FameRating": (
+        lambda i: PydanticFameRating(value=i % 5),
+        lambda i: FameRating(i % 5),
+        lambda i: FameRating.trusted(float(i % 5)),
+    ),
+    "Email": (
+        lambda i: PydanticEmail(value=f"user{i}@example.com"),
+        lambda i: Email(f"user{i}@example.com"),
+        lambda i: Email.trusted(f"user{i}@example.com"),
+    ),
+    "Location": (
+        lambda i: PydanticLocation(
+            latitude=48.85, longitude=2.35, city="Paris", country="France"
+        ),
+        lambda i: Location(48.85, 2.35, "Paris", "France"),
+        lambda i: Location.trusted(48.85, 2.35, "Paris", "France"),
+    ),
+}
+
+
+def construction_us(build) -> float:
+    start = perf_counter()
+    for i in range(COUNT):
+        build(i)
+    return (perf_counter() - start) / COUNT * 1e6
+
+
+def bytes_per_instance(build) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [build(i) for i in range(COUNT)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (after - before) / COUNT
+
+
+if __name__ == "__main__":
+    print(f"{'':<12}{'pydantic':>12}{'slotted':>12}{'trusted':>12}")
+    for name, builders in CASES.items():
+        times = "".join(f"{construction_us(b):10.2f}us" for b in builders)
+        print(f"{name:<12}{times}")
+        sizes = "".join(f"{bytes_per_instance(b):11.0f}B" for b in builders[:2])
+        print(f"{'':<12}{sizes}")
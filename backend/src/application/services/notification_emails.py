@@ -0,0 +1,54 @@
+"""Email side of notifications: urgent ones now, the rest as digests.
+
+A popular user can collect hundreds of likes and visits an hour; one
+email each would flood their inbox and the SMTP server. Notifications
+are instead buffered per user, and the digest flusher sends everything a
+user received within NOTIFICATION_DIGEST_WINDOW_MINUTES of the first
+buffered one as a single email. URGENT notifications skip the buffer.
+
+Both paths write in the caller's unit of work, so the email exists if
+and only if the notification itself is committed.
+"""
+
+from src.config.settings import get_settings
+from src.core.entities.chat import Notification, NotificationPriority
+from src.core.entities.email_outbox import EmailKind, OutboxEmail
+from src.core.entities.notification_digest import DigestEntry
+from src.core.repositories.unit_of_work import AbstractUnitOfWork
+
+
+async def queue_notification_email(
+    uow: AbstractUnitOfWork, notification: Notification
+) -> bool:
+    """Queue the email for a notification inside an open unit of work.
+
+    Returns False when the recipient no longer exists.
+    """
+    user = await uow.users.get_by_id(notification.user_id)
+    if user is None:
+        return False
+
+    window = get_settings().NOTIFICATION_DIGEST_WINDOW_MINUTES
+    if notification.priority == NotificationPriority.URGENT or window <= 0:
+        await uow.email_outbox.enqueue(
+            OutboxEmail(
+                kind=EmailKind.NOTIFICATION,
+                payload={
+                    "email": str(user.email),
+                    "subject": notification.title,
+                    "message": notification.content,
+                },
+            )
+        )
+    else:
+        await uow.notification_digests.add(
+            DigestEntry(
+                user_id=notification.user_id,
+                email=str(user.email),
+                username=user.username,
+                type=notification.type,
+                title=notification.title,
+                content=notification.content,
+            )
+        )
+    return True
@@ -0,0 +1,128 @@
+"""Streaming top-k selection for ranked listings.
+
+Suggestions and search rank a large candidate pool but only return one
+page of it. top_k consumes candidates one at a time and keeps the best k
+in a bounded min-heap, so it runs in O(n log k) time and O(k) memory and
+never sorts the whole pool.
+
+Order is by score descending, then by key (user id) ascending, which is
+a total order: a page ends at a RankCursor and the next page resumes
+strictly after it, without duplicates or gaps as long as scores did not
+change in between.
+"""
+
+import base64
+import binascii
+import heapq
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class StageTimings:
+    """Wall time spent per named stage, in milliseconds"""
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (perf_counter() - start) * 1000
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def __str__(self) -> str:
+        return " ".join(f"{name}={ms:.2f}ms" for name, ms in self.stages.items())
+
+
+@dataclass(frozen=True, slots=True)
+class RankCursor:
+    """Position of the last item of a page"""
+
+    score: float
+    key: int
+
+    def precedes(self, score: float, key: int) -> bool:
+        """Whether (score, key) ranks strictly after this cursor"""
+        return score < self.score or (score == self.score and key > self.key)
+
+    def encode(self) -> str:
+        # repr round-trips floats exactly, so ties compare equal again
+        raw = f"{self.score!r}:{self.key}".encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "RankCursor":
+        try:
+            score, key = base64.urlsafe_b64decode(token).decode().split(":")
+            return cls(float(score), int(key))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+
+@dataclass(slots=True)
+class Ranked(Generic[T]):
+    item: T
+    score: float
+    key: int
+
+
+@dataclass(slots=True)
+class TopK(Generic[T]):
+    items: list[Ranked[T]]
+    # Candidates seen, including those before the cursor
+    total: int
+    timings: StageTimings = field(default_factory=StageTimings)
+
+    @property
+    def next_cursor(self) -> RankCursor | None:
+        if not self.items:
+            return None
+        last = self.items[-1]
+        return RankCursor(last.score, last.key)
+
+
+def top_k(
+    candidates: Iterable[T],
+    score: Callable[[T], float],
+    key: Callable[[T], int],
+    k: int,
+    after: RankCursor | None = None,
+    timings: StageTimings | None = None,
+) -> TopK[T]:
+    """The k best candidates ranking after the cursor, best first.
+
+    candidates is consumed lazily, so filtering done by a generator is
+    accounted to the "select" stage together with scoring.
+    """
+    timings = timings if timings is not None else StageTimings()
+    # Min-heap whose root is the worst entry kept: lowest score, then
+    # highest key. Keys are unique, so items themselves are never compared.
+    heap: list[tuple[float, int, T]] = []
+    total = 0
+
+    with timings.stage("select"):
+        for candidate in candidates:
+            total += 1
+            value = score(candidate)
+            candidate_key = key(candidate)
+            if after is not None and not after.precedes(value, candidate_key):
+                continue
+            entry = (value, -candidate_key, candidate)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif heap and entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+    with timings.stage("order"):
+        heap.sort(key=lambda entry: (-entry[0], -entry[1]))
+        items = [Ranked(item, value, -neg_key) for value, neg_key, item in heap]
+
+    return TopK(items=items, total=total, timings=timings)
@@ -1,3 +1,4 @@
+from datetime import UTC, datetime
 from typing import Any
 
 from ....core.entities.user import UserStatus
@@ -14,22 +15,19 @@ class LoginUserUseCase:
     def __init__(self, uow: AbstractUnitOfWork):
         self.uow = uow
 
-    async def execute(self, login_data: dict[str, Any]) -> dict[str, Any]:
+    async def execute(
+        self, login_data: dict[str, Any], update_last_seen: bool = True
+    ) -> dict[str, Any]:
         """
         Authenticate user and return tokens
+
+        With update_last_seen=False the caller is responsible for calling
+        users.touch_last_seen, e.g. after the response has been sent.
         """
         try:
             async with self.uow:
-                # Get user by email or username
-                user = None
-                if "@" in login_data["identifier"]:
-                    # Login with email
-                    user = await self.uow.users.get_by_email(login_data["identifier"])
-                else:
-                    # Login with username
-                    user = await self.uow.users.get_by_username(
-                        login_data["identifier"]
-                    )
+                # Only the auth columns, by email or username, ignoring case
+                user = await self.uow.users.get_credentials(login_data["identifier"])
 
                 if not user:
                     raise AuthenticationException("Invalid credentials")
@@ -49,9 +47,10 @@ class LoginUserUseCase:
                     raise AuthenticationException("Account is inactive")
 
                 # Update last seen
-                user.update_last_seen()
-                await self.uow.users.update(user)
-                await self.uow.commit()
+                last_seen = datetime.now(UTC)
+                if update_last_seen:
+                    await self.uow.users.touch_last_seen(user.id)
+                    await self.uow.commit()
 
             # Generate tokens
             access_token = create_access_token(
@@ -71,7 +70,7 @@ class LoginUserUseCase:
                     "last_name": user.last_name,
                     "status": user.status,
                     "email_verified": user.email_verified,
-                    "last_seen": user.last_seen,
+                    "last_seen": last_seen,
                     "created_at": user.created_at,
                 },
             }
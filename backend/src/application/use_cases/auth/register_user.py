@@ -2,8 +2,7 @@ import secrets
 from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import ValidationError
-
+from src.core.entities.email_outbox import EmailKind, OutboxEmail
 from src.core.entities.user import User, UserStatus
 from src.core.entities.verification_token import VerificationToken
 from src.core.repositories.unit_of_work import AbstractUnitOfWork
@@ -25,13 +24,6 @@ class RegisterUserUseCase:
                 # Validate input data
                 email = Email(user_data["email"])
 
-                # Check if user already exists
-                if await self.uow.users.exists_by_email(str(email)):
-                    raise DuplicateResourceException("Email already registered")
-
-                if await self.uow.users.exists_by_username(user_data["username"]):
-                    raise DuplicateResourceException("Username already taken")
-
                 # Hash password
                 password_hash = hash_password(user_data["password"])
 
@@ -48,7 +40,8 @@ class RegisterUserUseCase:
                     updated_at=datetime.now(UTC),
                 )
 
-                # Save user to repository
+                # Save user to repository; the unique indexes on email and
+                # username reject duplicates with DuplicateResourceException
                 created_user = await self.uow.users.create(user)
 
                 # Generate verification token
@@ -60,11 +53,16 @@ class RegisterUserUseCase:
                 # Save verification token
                 await self.uow.verification_tokens.create(verification_token)
 
-                # Send verification email
-                email_sent = await self.uow.email_service.send_verification_email(
-                    email=str(created_user.email),
-                    username=created_user.username,
-                    token=verification_token_str,
+                # Queue the verification email; it is sent once this commits
+                await self.uow.email_outbox.enqueue(
+                    OutboxEmail(
+                        kind=EmailKind.VERIFICATION,
+                        payload={
+                            "email": str(created_user.email),
+                            "username": created_user.username,
+                            "token": verification_token_str,
+                        },
+                    )
                 )
 
                 # Commit the transaction
@@ -75,11 +73,12 @@ class RegisterUserUseCase:
                     "email": str(created_user.email),
                     "username": created_user.username,
                     "verification_token": verification_token_str,
-                    "email_sent": email_sent,
+                    # Queued for delivery by the outbox dispatcher
+                    "email_sent": True,
                     "message": "User registered successfully. Please check your email to verify your account.",
                 }
 
-        except ValidationError as e:
+        except ValueError as e:  # includes pydantic's ValidationError
             raise ValidationException(f"Validation error: {str(e)}") from e
         except (DuplicateResourceException, ValidationException):
             # Re-raise domain exceptions as-is so they can be handled properly by the API layer
@@ -2,6 +2,7 @@ import secrets
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from src.core.entities.email_outbox import EmailKind, OutboxEmail
 from src.core.entities.verification_token import TokenType, VerificationToken
 from src.core.repositories.unit_of_work import AbstractUnitOfWork
 from src.core.value_objects.email import Email
@@ -45,9 +46,16 @@ class ResetPasswordUseCase:
                 )
                 await self.uow.verification_tokens.create(verification_token)
 
-                # Send password reset email
-                await self.uow.email_service.send_password_reset_email(
-                    email=str(user.email), username=user.username, token=reset_token
+                # Queue the password reset email; it is sent once this commits
+                await self.uow.email_outbox.enqueue(
+                    OutboxEmail(
+                        kind=EmailKind.PASSWORD_RESET,
+                        payload={
+                            "email": str(user.email),
+                            "username": user.username,
+                            "token": reset_token,
+                        },
+                    )
                 )
 
                 await self.uow.commit()
@@ -0,0 +1,9 @@
+"""Matching use cases."""
+
+from .browse_profiles import ProfilePage, SearchProfilesUseCase, SuggestProfilesUseCase
+
+__all__ = [
+    "ProfilePage",
+    "SearchProfilesUseCase",
+    "SuggestProfilesUseCase",
+]
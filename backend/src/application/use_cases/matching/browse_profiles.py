@@ -0,0 +1,256 @@
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from src.application.services.ranking import RankCursor, StageTimings, TopK, top_k
+from src.config.settings import get_settings
+from src.core.entities.user import UserProfile
+from src.core.repositories.profile_repository import project_profile
+from src.core.repositories.unit_of_work import AbstractUnitOfWork
+from src.core.services.matching import compatible_profiles, match_score
+from src.core.value_objects.location import Location
+from src.infrastructure.cache.profile_store import ProfileStore
+from src.shared.exceptions import NotFoundException, ValidationException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProfilePage:
+    # Entities, or projections (dicts) when specific fields were requested
+    profiles: list[UserProfile] | list[dict]
+    total: int
+    next_cursor: str | None
+
+
+def _entity_scorer(
+    origin: Location | None, interests: Iterable[str]
+) -> Callable[[UserProfile], float]:
+    """match_score of a candidate entity, when ranking without the store"""
+    wanted = set(interests)
+
+    def score(profile: UserProfile) -> float:
+        distance = None
+        if origin is not None and profile.location is not None:
+            distance = origin.distance_to(profile.location)
+        shared = len(wanted.intersection(profile.interests))
+        return match_score(profile.fame_rating.value, shared, distance)
+
+    return score
+
+
+def _user_id(profile: UserProfile) -> int:
+    return profile.user_id
+
+
+class _RankedProfilesUseCase:
+    """Shared flow of ranked listings: pick the page with top_k, from the
+    in-memory profile store when it is loaded or from a radius query
+    otherwise, then load the full profiles of that page only.
+
+    Subclasses call the helpers inside a read-only unit of work.
+    """
+
+    def __init__(self, uow: AbstractUnitOfWork, store: ProfileStore):
+        self.uow = uow
+        self.store = store
+
+    @staticmethod
+    def _cursor(cursor: str | None) -> RankCursor | None:
+        if cursor is None:
+            return None
+        try:
+            return RankCursor.decode(cursor)
+        except ValueError as e:
+            raise ValidationException(str(e)) from e
+
+    async def _from_store(
+        self,
+        filters: dict,
+        origin: tuple[float, float] | None,
+        interests: Iterable[str],
+        limit: int,
+        after: RankCursor | None,
+        fields: frozenset[str] | None,
+    ) -> ProfilePage:
+        store = self.store
+        latitude, longitude = origin if origin is not None else (None, None)
+        # Synchronous from filter to selection, so store indexes stay valid
+        ranked = top_k(
+            store.filter(**filters),
+            score=store.scorer(latitude, longitude, interests),
+            key=store.user_ids.__getitem__,
+            k=limit,
+            after=after,
+        )
+
+        user_ids = [entry.key for entry in ranked.items]
+        with ranked.timings.stage("hydrate"):
+            if fields is None:
+                found = await self.uow.profiles.get_by_user_ids(user_ids)
+                by_user_id = {profile.user_id: profile for profile in found}
+            else:
+                found = await self.uow.profiles.get_projections_by_user_ids(
+                    user_ids, fields
+                )
+                by_user_id = {profile["user_id"]: profile for profile in found}
+                if "user_id" not in fields:
+                    for profile in found:
+                        del profile["user_id"]
+
+        # Profiles deleted since the store snapshot are dropped from the page
+        profiles = [
+            by_user_id[user_id] for user_id in user_ids if user_id in by_user_id
+        ]
+        return self._page(ranked, profiles, limit)
+
+    def _from_entities(
+        self,
+        candidates: Iterable[UserProfile],
+        score: Callable[[UserProfile], float],
+        limit: int,
+        after: RankCursor | None,
+        timings: StageTimings,
+        fields: frozenset[str] | None,
+    ) -> ProfilePage:
+        ranked = top_k(candidates, score, _user_id, limit, after, timings)
+        profiles = [entry.item for entry in ranked.items]
+        if fields is not None:
+            profiles = [project_profile(profile, fields) for profile in profiles]
+        return self._page(ranked, profiles, limit)
+
+    def _page(
+        self, ranked: TopK, profiles: list[UserProfile] | list[dict], limit: int
+    ) -> ProfilePage:
+        logger.debug(
+            "%s ranked %d candidates: %s",
+            type(self).__name__,
+            ranked.total,
+            ranked.timings,
+        )
+        next_cursor = ranked.next_cursor if len(ranked.items) == limit else None
+        return ProfilePage(
+            profiles=profiles,
+            total=ranked.total,
+            next_cursor=next_cursor.encode() if next_cursor else None,
+        )
+
+
+class SuggestProfilesUseCase(_RankedProfilesUseCase):
+    """Use case for suggesting compatible profiles near the viewer."""
+
+    async def execute(
+        self,
+        user_id: int,
+        limit: int = 20,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> ProfilePage:
+        """Get the best matches for a user, one page at a time.
+
+        With fields, profiles are projections holding only those fields.
+        """
+        after = self._cursor(cursor)
+        radius_km = get_settings().SUGGESTIONS_RADIUS_KM
+
+        async with self.uow.read_only():
+            viewer = await self.uow.profiles.get_by_user_id(user_id)
+            if viewer is None or not viewer.profile_completed:
+                raise NotFoundException("Viewer must have a complete profile")
+
+            location = viewer.location
+            compatible = compatible_profiles(viewer.gender, viewer.sexual_preference)
+
+            if self.store.loaded:
+                return await self._from_store(
+                    filters={
+                        "exclude_user_ids": (user_id,),
+                        "compatible": compatible,
+                        "latitude": location.latitude,
+                        "longitude": location.longitude,
+                        "max_distance_km": radius_km,
+                    },
+                    origin=(location.latitude, location.longitude),
+                    interests=viewer.interests,
+                    limit=limit,
+                    after=after,
+                    fields=fields,
+                )
+
+            timings = StageTimings()
+            with timings.stage("candidates"):
+                nearby = await self.uow.profiles.get_profiles_by_location_radius(
+                    location.latitude, location.longitude, radius_km, user_id
+                )
+        return self._from_entities(
+            (p for p in nearby if (p.gender, p.sexual_preference) in compatible),
+            _entity_scorer(location, viewer.interests),
+            limit,
+            after,
+            timings,
+            fields,
+        )
+
+
+class SearchProfilesUseCase(_RankedProfilesUseCase):
+    """Use case for searching profiles around a point."""
+
+    async def execute(
+        self,
+        user_id: int,
+        latitude: float,
+        longitude: float,
+        radius_km: int,
+        age_min: int | None = None,
+        age_max: int | None = None,
+        gender: str | None = None,
+        limit: int = 20,
+        cursor: str | None = None,
+        fields: frozenset[str] | None = None,
+    ) -> ProfilePage:
+        """Search profiles, ranked by proximity to the search center,
+        shared interests with the viewer and fame."""
+        after = self._cursor(cursor)
+
+        async with self.uow.read_only():
+            viewer = await self.uow.profiles.get_by_user_id(user_id)
+            interests = viewer.interests if viewer is not None else []
+
+            if self.store.loaded:
+                return await self._from_store(
+                    filters={
+                        "exclude_user_ids": (user_id,),
+                        "age_min": age_min,
+                        "age_max": age_max,
+                        "genders": (gender,) if gender is not None else None,
+                        "latitude": latitude,
+                        "longitude": longitude,
+                        "max_distance_km": radius_km,
+                    },
+                    origin=(latitude, longitude),
+                    interests=interests,
+                    limit=limit,
+                    after=after,
+                    fields=fields,
+                )
+
+            timings = StageTimings()
+            with timings.stage("candidates"):
+                nearby = await self.uow.profiles.get_profiles_by_location_radius(
+                    latitude, longitude, radius_km, user_id
+                )
+        low = age_min if age_min is not None else 0
+        high = age_max if age_max is not None else 255
+        return self._from_entities(
+            (
+                p
+                for p in nearby
+                if low <= p.age.value <= high
+                and (gender is None or p.gender == gender)
+            ),
+            _entity_scorer(Location(latitude, longitude), interests),
+            limit,
+            after,
+            timings,
+            fields,
+        )
@@ -11,13 +11,24 @@ class GetProfileUseCase:
 
     async def execute(self, user_id: int) -> UserProfile:
         """Get a user profile by user ID."""
-        async with self.uow:
+        async with self.uow.read_only():
             profile = await self.uow.profiles.get_by_user_id(user_id)
             if profile is None:
                 raise NotFoundException("Profile not found")
 
             return profile
 
+    async def execute_projection(self, user_id: int, fields: frozenset[str]) -> dict:
+        """Get only the given fields of a user profile."""
+        async with self.uow.read_only():
+            profile = await self.uow.profiles.get_projection_by_user_id(
+                user_id, fields
+            )
+            if profile is None:
+                raise NotFoundException("Profile not found")
+
+            return profile
+
 
 class GetUserProfileUseCase:
     """Use case for viewing another user's profile."""
@@ -27,7 +38,7 @@ class GetUserProfileUseCase:
 
     async def execute(self, viewer_user_id: int, target_user_id: int) -> UserProfile:
         """Get another user's profile (for viewing/matching purposes)."""
-        async with self.uow:
+        async with self.uow.read_only():
             # Verify viewer exists and has a complete profile
             viewer_profile = await self.uow.profiles.get_by_user_id(viewer_user_id)
             if viewer_profile is None or not viewer_profile.profile_completed:
@@ -43,3 +54,28 @@ class GetUserProfileUseCase:
                 raise NotFoundException("User profile not available")
 
             return target_profile
+
+    async def execute_projection(
+        self, viewer_user_id: int, target_user_id: int, fields: frozenset[str]
+    ) -> dict:
+        """Get only the given fields of another user's profile."""
+        async with self.uow.read_only():
+            viewer_profile = await self.uow.profiles.get_projection_by_user_id(
+                viewer_user_id, frozenset({"profile_completed"})
+            )
+            if viewer_profile is None or not viewer_profile["profile_completed"]:
+                raise NotFoundException("Viewer must have a complete profile")
+
+            # profile_completed is needed for the visibility check below
+            target_profile = await self.uow.profiles.get_projection_by_user_id(
+                target_user_id, fields | {"profile_completed"}
+            )
+            if target_profile is None:
+                raise NotFoundException("User profile not found")
+
+            if not target_profile["profile_completed"]:
+                raise NotFoundException("User profile not available")
+
+            if "profile_completed" not in fields:
+                del target_profile["profile_completed"]
+            return target_profile
@@ -22,7 +22,8 @@ class UploadProfileImageUseCase:
             if profile is None:
                 raise NotFoundException("Profile not found")
 
-            # Check if user can add more pictures
+            # Check if user can add more pictures (the add itself re-checks
+            # atomically; this avoids a pointless upload)
             if len(profile.pictures) >= 5:
                 raise ValidationException("Maximum 5 pictures allowed")
 
@@ -32,19 +33,15 @@ class UploadProfileImageUseCase:
             )
 
             # Add to profile
-            success = await self.uow.profiles.add_picture(user_id, image_url)
-            if not success:
+            change = await self.uow.profiles.add_picture(user_id, image_url)
+            if change is None:
                 # If database update fails, try to delete from Cloudinary
                 await self.cloudinary_service.delete_image(image_url)
                 raise ValidationException("Failed to save image to profile")
 
-            # Check if profile is now complete and update user completion status
-            updated_profile = await self.uow.profiles.get_by_user_id(user_id)
-            if updated_profile and updated_profile.is_complete():
-                user = await self.uow.users.get_by_id(user_id)
-                if user and not user.has_completed_profile:
-                    user.mark_profile_completed()
-                    await self.uow.users.update(user)
+            # Keep the user's flag in sync with the profile; a no-op when set
+            if change.profile_completed:
+                await self.uow.users.mark_profile_completed(user_id)
 
             await self.uow.commit()
             return image_url
@@ -60,19 +57,17 @@ class DeleteProfileImageUseCase:
     async def execute(self, user_id: int, image_url: str) -> bool:
         """Delete a profile image."""
         async with self.uow:
-            # Get user profile
-            profile = await self.uow.profiles.get_by_user_id(user_id)
-            if profile is None:
-                raise NotFoundException("Profile not found")
-
-            # Check if image belongs to user
-            if image_url not in profile.pictures:
+            # Remove from database first; only fails if the profile is
+            # missing or the image does not belong to it
+            change = await self.uow.profiles.remove_picture(user_id, image_url)
+            if change is None:
+                if await self.uow.profiles.get_by_user_id(user_id) is None:
+                    raise NotFoundException("Profile not found")
                 raise ForbiddenException("Image not found in user's profile")
 
-            # Remove from database first
-            success = await self.uow.profiles.remove_picture(user_id, image_url)
-            if not success:
-                raise ValidationException("Failed to remove image from profile")
+            # Removing the last picture makes the profile incomplete again
+            if not change.profile_completed:
+                await self.uow.users.mark_profile_incomplete(user_id)
 
             # Delete from Cloudinary (don't fail if this fails)
             await self.cloudinary_service.delete_image(image_url)
@@ -87,12 +87,9 @@ class UpdateProfileUseCase:
 
             # Mark user as having completed profile if profile just became complete
             if not was_previously_complete and profile.profile_completed:
-                user = await self.uow.users.get_by_id(user_id)
-                if user:
-                    user.mark_profile_completed()
-                    await self.uow.users.update(user)
+                await self.uow.users.mark_profile_completed(user_id)
 
-            # Save changes
+            # Save changes (no-op when nothing changed)
             updated_profile = await self.uow.profiles.update(profile)
             await self.uow.commit()
 
@@ -14,6 +14,31 @@ class Settings(BaseSettings):
     DATABASE_NAME: str = "matcha"
     DATABASE_USER: str = "matcha_user"
     DATABASE_PASSWORD: str = "matcha_password"
+    DATABASE_REPLICA_URL: str = ""  # optional read replica, empty disables
+    READ_YOUR_WRITES_SECONDS: float = 5.0  # reads stay on primary after a write
+
+    # Database connection pool
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0  # seconds to wait for a free connection
+    DATABASE_POOL_RECYCLE: int = -1  # seconds, -1 disables recycling
+    DATABASE_POOL_PRE_PING: bool = False
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100  # asyncpg only, 0 disables
+    DATABASE_QUERY_CACHE_SIZE: int = 500  # SQLAlchemy compiled statement cache
+
+    # Monthly partitions for visits, messages and notifications
+    PARTITION_PREMAKE_MONTHS: int = 3  # future partitions to keep created
+    PARTITION_MAINTENANCE_INTERVAL_SECONDS: int = 86400
+    # Months of rows to keep; older partitions are dropped with their data.
+    # 0 keeps everything, so dropping is opt-in per table.
+    VISITS_RETENTION_MONTHS: int = 0
+    MESSAGES_RETENTION_MONTHS: int = 0
+    NOTIFICATIONS_RETENTION_MONTHS: int = 0
+
+    # Query logging
+    DATABASE_ECHO: bool = False  # log every statement (very noisy)
+    SLOW_QUERY_THRESHOLD_MS: int = 200  # 0 disables the slow query log
+    SLOW_QUERY_EXPLAIN: bool = False  # capture EXPLAIN (ANALYZE, BUFFERS) plans
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -21,6 +46,15 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
 
+    # Unread badge counters (unread_counters table, mirrored into Redis)
+    UNREAD_COUNTERS_CACHE_TTL_SECONDS: int = 300
+    UNREAD_COUNTERS_RECONCILE_INTERVAL_SECONDS: int = 3600
+    UNREAD_COUNTERS_RECONCILE_BATCH_SIZE: int = 500  # users fixed per transaction
+
+    # Columnar in-memory snapshot of completed profiles used for ranking
+    PROFILE_STORE_ENABLED: bool = True
+    SUGGESTIONS_RADIUS_KM: int = 100
+
     # Application
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
@@ -28,12 +62,14 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    LOGIN_DEFER_LAST_SEEN: bool = False  # bump last_seen after the response
 
     # API
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "Matcha"
     VERSION: str = "1.0.0"
     DESCRIPTION: str = "Dating website backend with Clean Architecture"
+    SKIP_RESPONSE_REVALIDATION: bool = True  # render validated DTOs directly
 
     # CORS
     BACKEND_CORS_ORIGINS: list[str] = [
@@ -42,6 +78,11 @@ class Settings(BaseSettings):
         "http://localhost:8080",
     ]
 
+    # Response compression (br needs the optional brotli package)
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # bytes, smaller bodies are sent as-is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
     # Email
     SMTP_HOST: str = "smtp.gmail.com"
     SMTP_PORT: int = 587
@@ -51,6 +92,25 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     EMAILS_FROM_EMAIL: str = "noreply@matcha.com"
     EMAILS_FROM_NAME: str = "Matcha"
+    SMTP_POOL_SIZE: int = 3  # persistent connections kept to the server
+    SMTP_POOL_HEALTH_CHECK_SECONDS: float = 30  # NOOP before reusing idler ones
+    SMTP_POOL_MAX_MESSAGES: int = 100  # per connection before reconnecting
+    SMTP_TIMEOUT_SECONDS: float = 30
+
+    # Email outbox (written with the triggering transaction, sent in background)
+    EMAIL_OUTBOX_BATCH_SIZE: int = 50
+    EMAIL_OUTBOX_POLL_INTERVAL_SECONDS: float = 5
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = 30  # doubled after each failure
+    EMAIL_OUTBOX_RETENTION_DAYS: int = 7  # sent emails kept for inspection
+    # Claimed emails become due again after this, should a dispatcher die
+    # mid-batch; sends still running after half of it are abandoned
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 600
+
+    # Notification emails are coalesced into one digest per user and window;
+    # urgent ones are sent right away. 0 sends every notification on its own.
+    NOTIFICATION_DIGEST_WINDOW_MINUTES: int = 60
+    NOTIFICATION_DIGEST_BATCH_SIZE: int = 200  # users flushed per transaction
 
     # Cloudinary
     CLOUDINARY_CLOUD_NAME: str = ""
@@ -0,0 +1,39 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class EmailKind(str, Enum):
+    VERIFICATION = "verification"
+    PASSWORD_RESET = "password_reset"
+    NOTIFICATION = "notification"
+    NOTIFICATION_DIGEST = "notification_digest"
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"  # gave up after the maximum number of attempts
+
+
+class OutboxEmail(BaseModel):
+    """An email recorded in the same transaction as the change that causes
+    it, and delivered afterwards by the outbox dispatcher.
+
+    payload holds the keyword arguments of the EmailService method for
+    kind, recipient included.
+    """
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    id: int | None = None
+    kind: EmailKind
+    payload: dict[str, Any]
+    status: OutboxStatus = OutboxStatus.PENDING
+    attempts: int = 0
+    last_error: str | None = None
+    available_at: datetime | None = None
+    created_at: datetime | None = None
+    sent_at: datetime | None = None
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from src.core.entities.chat import NotificationType
+
+
+class DigestEntry(BaseModel):
+    """A notification waiting to be emailed in its recipient's next digest.
+
+    The recipient's address and name are captured when the notification
+    is queued, like outbox payloads.
+    """
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    id: int | None = None
+    user_id: int
+    email: str
+    username: str
+    type: NotificationType
+    title: str
+    content: str
+    created_at: datetime | None = None
@@ -0,0 +1,80 @@
+from collections.abc import Mapping
+from typing import Any, Self
+
+from pydantic import BaseModel, PrivateAttr
+
+_object_setattr = object.__setattr__
+
+
+class ChangeTrackedModel(BaseModel):
+    """Entity base that records which fields changed since it was loaded.
+
+    Assigning a field a value different from its current one marks it as
+    changed; construction does not. Methods that mutate a field in place
+    (e.g. appending to a list) must call mark_changed themselves.
+    Repositories use changed_fields to write only what changed.
+    """
+
+    _changed_fields: set[str] = PrivateAttr(default_factory=set)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in type(self).model_fields and getattr(self, name) != value:
+            self._changed_fields.add(name)
+        super().__setattr__(name, value)
+
+    def __copy__(self) -> Self:
+        # pydantic copies the private attributes dict shallowly, which
+        # would share one change set between the original and the copy
+        copy = super().__copy__()
+        _object_setattr(
+            copy,
+            "__pydantic_private__",
+            {**copy.__pydantic_private__, "_changed_fields": set(self._changed_fields)},
+        )
+        return copy
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy with its own change set, where fields given a new value
+        through update count as changed, like assignments"""
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            fields = type(self).model_fields
+            copy.mark_changed(
+                *(
+                    name
+                    for name, value in update.items()
+                    if name in fields and getattr(self, name) != value
+                )
+            )
+        return copy
+
+    @classmethod
+    def trusted(cls, **values: Any) -> Self:
+        """Build from already validated values (e.g. a database row).
+
+        Skips validation like model_construct, but when every field is
+        given it also skips model_construct's per-field default handling,
+        which makes it several times cheaper than validating. Subclasses
+        adding private attributes must extend __pydantic_private__ here.
+        """
+        if values.keys() != cls.model_fields.keys():
+            return cls.model_construct(**values)
+
+        entity = cls.__new__(cls)
+        _object_setattr(entity, "__dict__", values)
+        _object_setattr(entity, "__pydantic_fields_set__", set(values))
+        _object_setattr(entity, "__pydantic_extra__", None)
+        _object_setattr(entity, "__pydantic_private__", {"_changed_fields": set()})
+        return entity
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        return frozenset(self._changed_fields)
+
+    def mark_changed(self, *names: str) -> None:
+        self._changed_fields.update(names)
+
+    def mark_clean(self) -> None:
+        self._changed_fields.clear()
@@ -1,8 +1,9 @@
 from datetime import UTC, datetime
 from enum import Enum
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import ConfigDict, field_validator
 
+from src.core.entities.tracking import ChangeTrackedModel
 from src.core.value_objects.age import Age
 from src.core.value_objects.email import Email
 from src.core.value_objects.fame_rating import FameRating
@@ -16,7 +17,7 @@ class UserStatus(str, Enum):
     PENDING_VERIFICATION = "pending_verification"
 
 
-class User(BaseModel):
+class User(ChangeTrackedModel):
     model_config = ConfigDict(use_enum_values=True, arbitrary_types_allowed=True)
 
     id: int | None = None
@@ -96,7 +97,23 @@ class SexualPreference(str, Enum):
     ASEXUAL = "asexual"
 
 
-class UserProfile(BaseModel):
+def accepts_gender(gender: str, preference: str, other_gender: str) -> bool:
+    """Whether someone of gender and preference is interested in other_gender"""
+    if preference == SexualPreference.HETEROSEXUAL:
+        return (gender == Gender.MALE and other_gender == Gender.FEMALE) or (
+            gender == Gender.FEMALE and other_gender == Gender.MALE
+        )
+    elif preference == SexualPreference.HOMOSEXUAL:
+        return gender == other_gender
+    elif preference in [
+        SexualPreference.BISEXUAL,
+        SexualPreference.PANSEXUAL,
+    ]:
+        return True
+    return False
+
+
+class UserProfile(ChangeTrackedModel):
     model_config = ConfigDict(use_enum_values=True, arbitrary_types_allowed=True)
 
     id: int | None = None
@@ -139,21 +156,25 @@ class UserProfile(BaseModel):
     def add_interest(self, interest: str) -> None:
         if interest not in self.interests and len(self.interests) < 10:
             self.interests.append(interest)
+            self.mark_changed("interests")
 
     def remove_interest(self, interest: str) -> None:
         if interest in self.interests:
             self.interests.remove(interest)
+            self.mark_changed("interests")
 
     def add_picture(self, picture_url: str) -> None:
         if len(self.pictures) < 5:
             self.pictures.append(picture_url)
+            self.mark_changed("pictures")
 
     def remove_picture(self, picture_url: str) -> None:
         if picture_url in self.pictures:
             self.pictures.remove(picture_url)
+            self.mark_changed("pictures")
 
     def is_complete(self) -> bool:
-        return (
+        return bool(
             self.age is not None
             and self.gender is not None
             and self.sexual_preference is not None
@@ -166,15 +187,4 @@ class UserProfile(BaseModel):
         self.fame_rating = FameRating(new_rating)
 
     def matches_preference(self, other_gender: Gender) -> bool:
-        if self.sexual_preference == SexualPreference.HETEROSEXUAL:
-            return (self.gender == Gender.MALE and other_gender == Gender.FEMALE) or (
-                self.gender == Gender.FEMALE and other_gender == Gender.MALE
-            )
-        elif self.sexual_preference == SexualPreference.HOMOSEXUAL:
-            return self.gender == other_gender
-        elif self.sexual_preference in [
-            SexualPreference.BISEXUAL,
-            SexualPreference.PANSEXUAL,
-        ]:
-            return True
-        return False
+        return accepts_gender(self.gender, self.sexual_preference, other_gender)
@@ -75,7 +75,10 @@ class ChatRepository(ABC):
 
     @abstractmethod
     async def get_unread_message_count(self, user_id: int) -> int:
-        """Get count of unread messages for user"""
+        """Get count of unread messages for user.
+
+        Implementations read UnreadCounterRepository rather than counting.
+        """
         pass
 
 
@@ -126,7 +129,10 @@ class NotificationRepository(ABC):
 
     @abstractmethod
     async def get_unread_count(self, user_id: int) -> int:
-        """Get count of unread notifications for user"""
+        """Get count of unread notifications for user.
+
+        Implementations read UnreadCounterRepository rather than counting.
+        """
         pass
 
     @abstractmethod
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+from src.core.entities.email_outbox import OutboxEmail
+
+
+class EmailOutboxRepository(ABC):
+    """Emails waiting for delivery, written in the caller's transaction"""
+
+    @abstractmethod
+    async def enqueue(self, email: OutboxEmail) -> None:
+        """Record an email to send once the transaction commits"""
+        pass
+
+    @abstractmethod
+    async def claim_batch(self, limit: int, lease: timedelta) -> list[OutboxEmail]:
+        """Count an attempt for up to limit due pending emails and hide them
+        from other dispatchers for lease, once the transaction commits"""
+        pass
+
+    @abstractmethod
+    async def mark_sent(self, emails: list[OutboxEmail]) -> int:
+        """Mark claimed emails as delivered, return how many were still
+        claimed by the caller"""
+        pass
+
+    @abstractmethod
+    async def mark_failed(
+        self, email: OutboxEmail, error: str, retry_in: timedelta | None
+    ) -> bool:
+        """Record why a claimed email failed; retry after retry_in, or give
+        up if None. False if the claim was lost meanwhile."""
+        pass
+
+    @abstractmethod
+    async def delete_sent_older_than(self, age: timedelta) -> int:
+        """Delete emails delivered more than age ago, return how many"""
+        pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+from src.core.entities.notification_digest import DigestEntry
+
+
+class NotificationDigestRepository(ABC):
+    """Notifications buffered per user until their digest email is due"""
+
+    @abstractmethod
+    async def add(self, entry: DigestEntry) -> None:
+        """Buffer a notification in the caller's transaction"""
+        pass
+
+    @abstractmethod
+    async def take_due(self, window: timedelta, max_users: int) -> list[DigestEntry]:
+        """Remove and return every buffered notification of up to max_users
+        users whose oldest one is at least window old, ordered by user then
+        age, so each user's entries are contiguous"""
+        pass
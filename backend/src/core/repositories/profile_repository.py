@@ -1,7 +1,36 @@
 from abc import ABC, abstractmethod
 
+from pydantic import BaseModel
+
 from src.core.entities.user import UserProfile
 
+# Entity fields a projection can select. Values come back in their plain
+# form: age and fame_rating as numbers, location as a dict of coordinates,
+# city and country (or None)
+PROFILE_FIELDS = tuple(UserProfile.model_fields)
+
+
+def project_profile(profile: UserProfile, fields: frozenset[str]) -> dict:
+    """Projection of an already loaded entity, in PROFILE_FIELDS order"""
+    data = {}
+    for field in PROFILE_FIELDS:
+        if field not in fields:
+            continue
+        value = getattr(profile, field)
+        if field in ("age", "fame_rating"):
+            value = value.value
+        elif field == "location" and value is not None:
+            value = value._serialize()
+        data[field] = value
+    return data
+
+
+class PictureChange(BaseModel):
+    """Profile state after an atomic picture attach or detach."""
+
+    pictures: list[str]
+    profile_completed: bool
+
 
 class ProfileRepository(ABC):
     """Repository interface for user profile operations."""
@@ -16,6 +45,26 @@ class ProfileRepository(ABC):
         """Get a user profile by user ID."""
         pass
 
+    @abstractmethod
+    async def get_by_user_ids(self, user_ids: list[int]) -> list[UserProfile]:
+        """Get the profiles of several users, in no particular order."""
+        pass
+
+    @abstractmethod
+    async def get_projection_by_user_id(
+        self, user_id: int, fields: frozenset[str]
+    ) -> dict | None:
+        """Get only the given PROFILE_FIELDS of a user's profile."""
+        pass
+
+    @abstractmethod
+    async def get_projections_by_user_ids(
+        self, user_ids: list[int], fields: frozenset[str]
+    ) -> list[dict]:
+        """Get the given PROFILE_FIELDS of several profiles, in no particular
+        order. user_id is always included."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, profile_id: int) -> UserProfile | None:
         """Get a user profile by profile ID."""
@@ -32,13 +81,22 @@ class ProfileRepository(ABC):
         pass
 
     @abstractmethod
-    async def add_picture(self, user_id: int, picture_url: str) -> bool:
-        """Add a picture to user's profile."""
+    async def add_picture(self, user_id: int, picture_url: str) -> PictureChange | None:
+        """Add a picture to user's profile.
+
+        Returns None if the profile does not exist, already has the picture,
+        or is at the picture limit.
+        """
         pass
 
     @abstractmethod
-    async def remove_picture(self, user_id: int, picture_url: str) -> bool:
-        """Remove a picture from user's profile."""
+    async def remove_picture(
+        self, user_id: int, picture_url: str
+    ) -> PictureChange | None:
+        """Remove a picture from user's profile.
+
+        Returns None if the profile does not exist or lacks the picture.
+        """
         pass
 
     @abstractmethod
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from src.core.repositories.email_outbox_repository import EmailOutboxRepository
+from src.core.repositories.notification_digest_repository import (
+    NotificationDigestRepository,
+)
 from src.core.repositories.profile_repository import ProfileRepository
+from src.core.repositories.unread_counter_repository import UnreadCounterRepository
 from src.core.repositories.user_repository import UserRepository
 from src.core.repositories.verification_token_repository import (
     VerificationTokenRepository,
@@ -15,10 +20,22 @@ class AbstractUnitOfWork(ABC):
     users: UserRepository
     verification_tokens: VerificationTokenRepository
     profiles: ProfileRepository
+    unread_counters: UnreadCounterRepository
+    email_outbox: EmailOutboxRepository
+    notification_digests: NotificationDigestRepository
     email_service: EmailService
     # matchings: MatchingRepository
     # chats: ChatRepository
 
+    # User acting in this unit of work, when known (set after authentication)
+    user_id: int | None = None
+    _read_only: bool = False
+
+    def read_only(self) -> "AbstractUnitOfWork":
+        """Mark the next unit of work as read-only so it may use a read replica"""
+        self._read_only = True
+        return self
+
     def __enter__(self) -> "AbstractUnitOfWork":
         return self
 
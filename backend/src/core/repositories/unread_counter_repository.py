@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+from pydantic import BaseModel
+
+
+class UnreadCounts(BaseModel):
+    """Badge counters of a user."""
+
+    user_id: int
+    messages: int = 0
+    notifications: int = 0
+
+
+class UnreadCounterRepository(ABC):
+    """Per-user unread counters, maintained as messages and notifications
+    are written so badges never need a COUNT(*)"""
+
+    @abstractmethod
+    async def get(self, user_id: int) -> UnreadCounts:
+        """Get unread counters for a user"""
+        pass
+
+    @abstractmethod
+    async def find_drift(self) -> list[UnreadCounts]:
+        """Recount from messages and notifications and return, per drifted
+        user, how far the counters are off (actual minus counter)"""
+        pass
+
+    @abstractmethod
+    async def correct(self, drift: list[UnreadCounts]) -> list[UnreadCounts]:
+        """Add drift found by find_drift to the counters, return them"""
+        pass
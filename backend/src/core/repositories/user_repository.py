@@ -1,8 +1,26 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+
+from pydantic import BaseModel
 
 from src.core.entities.user import User, UserProfile
 
 
+class UserCredentials(BaseModel):
+    """The columns login needs, without building a full User entity."""
+
+    id: int
+    username: str
+    email: str
+    password_hash: str
+    first_name: str
+    last_name: str
+    status: str
+    email_verified: bool
+    last_seen: datetime | None = None
+    created_at: datetime | None = None
+
+
 class UserRepository(ABC):
     """Abstract repository for User entity operations"""
 
@@ -26,11 +44,31 @@ class UserRepository(ABC):
         """Get user by username"""
         pass
 
+    @abstractmethod
+    async def get_credentials(self, identifier: str) -> UserCredentials | None:
+        """Get login columns by email or username, ignoring case"""
+        pass
+
     @abstractmethod
     async def update(self, user: User) -> User:
         """Update user"""
         pass
 
+    @abstractmethod
+    async def touch_last_seen(self, user_id: int) -> None:
+        """Set last_seen to now without loading the user"""
+        pass
+
+    @abstractmethod
+    async def mark_profile_completed(self, user_id: int) -> bool:
+        """Flag the user's profile as completed, returns False if already set"""
+        pass
+
+    @abstractmethod
+    async def mark_profile_incomplete(self, user_id: int) -> bool:
+        """Clear the profile completed flag, returns False if already clear"""
+        pass
+
     @abstractmethod
     async def delete(self, user_id: int) -> bool:
         """Delete user"""
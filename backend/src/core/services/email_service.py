@@ -24,3 +24,10 @@ class EmailService(ABC):
     ) -> bool:
         """Send a general notification email"""
         pass
+
+    @abstractmethod
+    async def send_notification_digest_email(
+        self, email: str, username: str, notifications: list[dict[str, str]]
+    ) -> bool:
+        """Send several notifications (title and content) as one email"""
+        pass
@@ -0,0 +1,30 @@
+from src.core.entities.user import Gender, SexualPreference, accepts_gender
+
+# Weights of match_score; fame ratings are on a 0-5 scale
+SHARED_INTEREST_WEIGHT = 2.0
+PROXIMITY_WEIGHT = 10.0
+PROXIMITY_SCALE_KM = 10.0
+
+
+def compatible_profiles(gender: str, preference: str) -> set[tuple[str, str]]:
+    """(gender, preference) pairs mutually compatible with the given one"""
+    return {
+        (other_gender.value, other_preference.value)
+        for other_gender in Gender
+        for other_preference in SexualPreference
+        if accepts_gender(gender, preference, other_gender)
+        and accepts_gender(other_gender, other_preference, gender)
+    }
+
+
+def match_score(
+    fame_rating: float, shared_interests: int, distance_km: float | None
+) -> float:
+    """Rank of a candidate for a viewer, higher is better.
+
+    Nearby profiles dominate, then common interests, then fame.
+    """
+    score = fame_rating + SHARED_INTEREST_WEIGHT * shared_interests
+    if distance_km is not None:
+        score += PROXIMITY_WEIGHT / (1.0 + distance_km / PROXIMITY_SCALE_KM)
+    return score
@@ -1,9 +1,13 @@
 from datetime import date, datetime
 
-from pydantic import BaseModel, field_validator
+from pydantic_core import CoreSchema, core_schema
 
+from src.core.value_objects.base import ValueObject
+
+
+class Age(ValueObject):
+    __slots__ = ("value",)
 
-class Age(BaseModel):
     value: int
 
     def __init__(self, value: int | date | datetime):
@@ -18,14 +22,35 @@ class Age(BaseModel):
         else:
             age_value = value
 
-        super().__init__(value=age_value)
+        if not 18 <= age_value <= 120:
+            raise ValueError("Age must be between 18 and 120")
+        object.__setattr__(self, "value", age_value)
+
+    @classmethod
+    def trusted(cls, value: int) -> "Age":
+        """Build from an already validated value (e.g. a database row)"""
+        age = object.__new__(cls)
+        object.__setattr__(age, "value", value)
+        return age
 
-    @field_validator("value")
     @classmethod
-    def validate_age(cls, v):
-        if not 18 <= v <= 120:
-            raise ValueError("Age must be between 18 and 120")
-        return v
+    def _input_schema(cls) -> CoreSchema:
+        return core_schema.union_schema(
+            [
+                core_schema.int_schema(),
+                core_schema.datetime_schema(),
+                core_schema.date_schema(),
+            ]
+        )
+
+    def _serialize(self) -> int:
+        return self.value
+
+    def __reduce__(self):
+        return (type(self).trusted, (self.value,))
+
+    def __repr__(self) -> str:
+        return f"Age({self.value})"
 
     def __str__(self) -> str:
         return str(self.value)
@@ -33,6 +58,9 @@ class Age(BaseModel):
     def __int__(self) -> int:
         return self.value
 
+    def __hash__(self) -> int:
+        return hash(self.value)
+
     def __eq__(self, other) -> bool:
         if isinstance(other, Age):
             return self.value == other.value
@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import CoreSchema, core_schema
+
+
+class ValueObject(ABC):
+    """Immutable, slotted base for value objects.
+
+    Subclasses declare __slots__, validate in __init__ and assign through
+    object.__setattr__. trusted() builds an instance from values that are
+    already known to be valid (database rows) without validating again.
+
+    For pydantic models using them as field types, subclasses describe the
+    accepted raw input with _input_schema() and their serialized form with
+    _serialize(); instances are accepted as-is.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __copy__(self) -> "ValueObject":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "ValueObject":
+        return self
+
+    @classmethod
+    @abstractmethod
+    def _input_schema(cls) -> CoreSchema:
+        pass
+
+    @classmethod
+    def _from_input(cls, value: Any) -> "ValueObject":
+        return cls(value)  # type: ignore[call-arg]
+
+    @abstractmethod
+    def _serialize(self) -> Any:
+        pass
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        from_input = core_schema.no_info_after_validator_function(
+            cls._from_input, cls._input_schema()
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_input,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_input]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize
+            ),
+        )
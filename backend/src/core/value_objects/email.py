@@ -1,18 +1,40 @@
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic.networks import validate_email
+from pydantic_core import CoreSchema, core_schema
 
+from src.core.value_objects.base import ValueObject
 
-class Email(BaseModel):
-    value: EmailStr
+
+class Email(ValueObject):
+    __slots__ = ("value",)
+
+    value: str
 
     def __init__(self, value: str):
-        super().__init__(value=value)
+        if not value:
+            raise ValueError("Email cannot be empty")
+        # Same checks and normalisation as pydantic's EmailStr
+        _, normalized = validate_email(value)
+        object.__setattr__(self, "value", normalized)
 
-    @field_validator("value")
     @classmethod
-    def validate_email(cls, v):
-        if not v:
-            raise ValueError("Email cannot be empty")
-        return v
+    def trusted(cls, value: str) -> "Email":
+        """Build from an already validated value (e.g. a database row)"""
+        email = object.__new__(cls)
+        object.__setattr__(email, "value", value)
+        return email
+
+    @classmethod
+    def _input_schema(cls) -> CoreSchema:
+        return core_schema.str_schema()
+
+    def _serialize(self) -> str:
+        return self.value
+
+    def __reduce__(self):
+        return (type(self).trusted, (self.value,))
+
+    def __repr__(self) -> str:
+        return f"Email({self.value!r})"
 
     def __str__(self) -> str:
         return self.value
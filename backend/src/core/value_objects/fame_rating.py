@@ -1,6 +1,8 @@
 from enum import Enum
 
-from pydantic import BaseModel, field_validator
+from pydantic_core import CoreSchema, core_schema
+
+from src.core.value_objects.base import ValueObject
 
 
 class FameLevel(Enum):
@@ -11,18 +13,35 @@ class FameLevel(Enum):
     LEGENDARY = "legendary"
 
 
-class FameRating(BaseModel):
+class FameRating(ValueObject):
+    __slots__ = ("value",)
+
     value: float
 
     def __init__(self, value: float):
-        super().__init__(value=value)
+        if not 0.0 <= value <= 5.0:
+            raise ValueError("Fame rating must be between 0.0 and 5.0")
+        object.__setattr__(self, "value", round(float(value), 2))
 
-    @field_validator("value")
     @classmethod
-    def validate_rating(cls, v):
-        if not 0.0 <= v <= 5.0:
-            raise ValueError("Fame rating must be between 0.0 and 5.0")
-        return round(v, 2)
+    def trusted(cls, value: float) -> "FameRating":
+        """Build from an already validated value (e.g. a database row)"""
+        rating = object.__new__(cls)
+        object.__setattr__(rating, "value", value)
+        return rating
+
+    @classmethod
+    def _input_schema(cls) -> CoreSchema:
+        return core_schema.float_schema()
+
+    def _serialize(self) -> float:
+        return self.value
+
+    def __reduce__(self):
+        return (type(self).trusted, (self.value,))
+
+    def __repr__(self) -> str:
+        return f"FameRating({self.value})"
 
     def __str__(self) -> str:
         return f"{self.value:.2f}"
@@ -30,6 +49,9 @@ class FameRating(BaseModel):
     def __float__(self) -> float:
         return self.value
 
+    def __hash__(self) -> int:
+        return hash(self.value)
+
     def __eq__(self, other) -> bool:
         if isinstance(other, FameRating):
             return self.value == other.value
@@ -1,27 +1,99 @@
 import math
 
-from pydantic import BaseModel, field_validator
+from pydantic_core import CoreSchema, core_schema
 
+from src.core.value_objects.base import ValueObject
+
+
+class Location(ValueObject):
+    __slots__ = ("latitude", "longitude", "city", "country")
 
-class Location(BaseModel):
     latitude: float
     longitude: float
-    city: str | None = None
-    country: str | None = None
+    city: str | None
+    country: str | None
 
-    @field_validator("latitude")
-    @classmethod
-    def validate_latitude(cls, v):
-        if not -90 <= v <= 90:
+    def __init__(
+        self,
+        latitude: float,
+        longitude: float,
+        city: str | None = None,
+        country: str | None = None,
+    ):
+        if not -90 <= latitude <= 90:
             raise ValueError("Latitude must be between -90 and 90")
-        return v
+        if not -180 <= longitude <= 180:
+            raise ValueError("Longitude must be between -180 and 180")
+        self._set(float(latitude), float(longitude), city, country)
+
+    def _set(
+        self,
+        latitude: float,
+        longitude: float,
+        city: str | None,
+        country: str | None,
+    ) -> None:
+        object.__setattr__(self, "latitude", latitude)
+        object.__setattr__(self, "longitude", longitude)
+        object.__setattr__(self, "city", city)
+        object.__setattr__(self, "country", country)
 
-    @field_validator("longitude")
     @classmethod
-    def validate_longitude(cls, v):
-        if not -180 <= v <= 180:
-            raise ValueError("Longitude must be between -180 and 180")
-        return v
+    def trusted(
+        cls,
+        latitude: float,
+        longitude: float,
+        city: str | None = None,
+        country: str | None = None,
+    ) -> "Location":
+        """Build from already validated values (e.g. a database row)"""
+        location = object.__new__(cls)
+        location._set(latitude, longitude, city, country)
+        return location
+
+    @classmethod
+    def _input_schema(cls) -> CoreSchema:
+        optional_str = core_schema.nullable_schema(core_schema.str_schema())
+        return core_schema.typed_dict_schema(
+            {
+                "latitude": core_schema.typed_dict_field(core_schema.float_schema()),
+                "longitude": core_schema.typed_dict_field(core_schema.float_schema()),
+                "city": core_schema.typed_dict_field(optional_str, required=False),
+                "country": core_schema.typed_dict_field(optional_str, required=False),
+            }
+        )
+
+    @classmethod
+    def _from_input(cls, value: dict) -> "Location":
+        return cls(**value)
+
+    def _serialize(self) -> dict:
+        return {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "city": self.city,
+            "country": self.country,
+        }
+
+    def __reduce__(self):
+        return (
+            type(self).trusted,
+            (self.latitude, self.longitude, self.city, self.country),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Location(latitude={self.latitude}, longitude={self.longitude}, "
+            f"city={self.city!r}, country={self.country!r})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Location):
+            return self._serialize() == other._serialize()
+        return False
+
+    def __hash__(self) -> int:
+        return hash((self.latitude, self.longitude, self.city, self.country))
 
     def distance_to(self, other: "Location") -> float:
         """Calculate distance in kilometers using Haversine formula"""
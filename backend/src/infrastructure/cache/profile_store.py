@@ -0,0 +1,400 @@
+"""Columnar in-memory snapshot of matchable profiles for ranking.
+
+Browse and search rank many candidates per request but only need a few
+numbers per profile. Instead of one UserProfile object per candidate the
+store keeps parallel typed arrays (struct of arrays), one entry per
+completed profile:
+
+    user_ids     int32     latitudes/longitudes  float32
+    ages         uint8     fame                  float32
+    genders      uint8     preferences           uint8
+    tags         uint64 x tag_words (interest bitset)
+
+which is 19 + 8 * tag_words bytes per profile. Filters and scorers scan
+the columns directly, and only the user ids that survive ranking are
+loaded as full entities.
+
+The snapshot is loaded from user_profiles and kept current from the
+profile_changes channel, which a trigger on user_profiles notifies on
+every committed change (see keep_profile_store_current).
+"""
+
+import logging
+import math
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ...core.entities.user import Gender, SexualPreference, UserProfile
+from ...core.services.matching import match_score
+from ..database.listener import listen_for_ids
+from ..database.models.user_model import UserProfileModel
+
+logger = logging.getLogger(__name__)
+
+PROFILE_CHANGES_CHANNEL = "profile_changes"
+
+GENDER_CODES = {gender.value: code for code, gender in enumerate(Gender)}
+PREFERENCE_CODES = {
+    preference.value: code for code, preference in enumerate(SexualPreference)
+}
+
+_EARTH_RADIUS_KM = 6371.0
+_WORD_BITS = 64
+_AGE_MAX = 255  # ages column is uint8
+
+# Columns read per profile, in ProfileStore.upsert argument order
+_COLUMNS = (
+    UserProfileModel.user_id,
+    UserProfileModel.latitude,
+    UserProfileModel.longitude,
+    UserProfileModel.age,
+    UserProfileModel.fame_rating,
+    UserProfileModel.gender,
+    UserProfileModel.sexual_preference,
+    UserProfileModel.interests,
+)
+
+
+def _code(value) -> str:
+    return getattr(value, "value", value)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = (
+        math.sin(dlat / 2) ** 2
+        + math.cos(math.radians(lat1))
+        * math.cos(math.radians(lat2))
+        * math.sin(dlon / 2) ** 2
+    )
+    return 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class ProfileStore:
+    """Struct-of-arrays snapshot of matchable profiles.
+
+    Indexes into the arrays are only stable until the next upsert or
+    remove; callers hold on to user ids, not indexes, across awaits.
+    _index maps each user id to its current index.
+    """
+
+    def __init__(self):
+        self.tag_bits: dict[str, int] = {}
+        self.tag_words = 1
+        self._reset()
+        self.loaded = False
+
+    def _reset(self) -> None:
+        self.user_ids = array("i")
+        self._index: dict[int, int] = {}
+        self.latitudes = array("f")
+        self.longitudes = array("f")
+        self.ages = array("B")
+        self.fame = array("f")
+        self.genders = array("B")
+        self.preferences = array("B")
+        self.tags = array("Q")
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    @property
+    def bytes_per_profile(self) -> int:
+        return 4 + 4 + 4 + 1 + 4 + 1 + 1 + 8 * self.tag_words
+
+    # Interest bitsets
+
+    def _tag_bit(self, tag: str) -> int:
+        bit = self.tag_bits.get(tag)
+        if bit is None:
+            bit = self.tag_bits[tag] = len(self.tag_bits)
+            if bit >= self.tag_words * _WORD_BITS:
+                self._widen_tags()
+        return bit
+
+    def _widen_tags(self) -> None:
+        """Add one word to every bitset once the vocabulary outgrows them"""
+        old_words = self.tag_words
+        widened = array("Q")
+        for index in range(len(self)):
+            widened.extend(self.tags[index * old_words : (index + 1) * old_words])
+            widened.append(0)
+        self.tags = widened
+        self.tag_words = old_words + 1
+
+    def tag_mask(self, interests: Iterable[str], assign: bool = False) -> int:
+        """Bitset of interests; unknown tags are ignored unless assigned"""
+        mask = 0
+        for tag in interests:
+            bit = self._tag_bit(tag) if assign else self.tag_bits.get(tag)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def profile_tags(self, index: int) -> int:
+        words = self.tag_words
+        mask = 0
+        for offset, word in enumerate(self.tags[index * words : (index + 1) * words]):
+            mask |= word << (offset * _WORD_BITS)
+        return mask
+
+    def _tag_words_of(self, mask: int) -> list[int]:
+        return [
+            (mask >> (offset * _WORD_BITS)) & 0xFFFFFFFFFFFFFFFF
+            for offset in range(self.tag_words)
+        ]
+
+    # Maintenance
+
+    def _encode(
+        self,
+        latitude: float | None,
+        longitude: float | None,
+        age: int,
+        fame_rating: float | None,
+        gender: str,
+        sexual_preference: str,
+        interests: Iterable[str] | None,
+    ) -> tuple:
+        mask = self.tag_mask(interests or (), assign=True)
+        return (
+            math.nan if latitude is None else latitude,
+            math.nan if longitude is None else longitude,
+            min(max(age, 0), _AGE_MAX),
+            fame_rating or 0.0,
+            GENDER_CODES[_code(gender)],
+            PREFERENCE_CODES[_code(sexual_preference)],
+            self._tag_words_of(mask),
+        )
+
+    def _append(self, user_id: int, *fields) -> None:
+        lat, lon, age, fame, gender, preference, words = self._encode(*fields)
+        self._index[user_id] = len(self.user_ids)
+        self.user_ids.append(user_id)
+        self.latitudes.append(lat)
+        self.longitudes.append(lon)
+        self.ages.append(age)
+        self.fame.append(fame)
+        self.genders.append(gender)
+        self.preferences.append(preference)
+        self.tags.extend(words)
+
+    def upsert(
+        self,
+        user_id: int,
+        latitude: float | None,
+        longitude: float | None,
+        age: int,
+        fame_rating: float | None,
+        gender: str,
+        sexual_preference: str,
+        interests: Iterable[str] | None,
+    ) -> None:
+        """Insert or overwrite the entry of user_id"""
+        fields = (
+            latitude,
+            longitude,
+            age,
+            fame_rating,
+            gender,
+            sexual_preference,
+            interests,
+        )
+        index = self._index.get(user_id)
+        if index is None:
+            self._append(user_id, *fields)
+            return
+
+        lat, lon, age, fame, gender, preference, words = self._encode(*fields)
+        self.latitudes[index] = lat
+        self.longitudes[index] = lon
+        self.ages[index] = age
+        self.fame[index] = fame
+        self.genders[index] = gender
+        self.preferences[index] = preference
+        stride = self.tag_words
+        self.tags[index * stride : (index + 1) * stride] = array("Q", words)
+
+    def upsert_profile(self, profile: UserProfile) -> None:
+        location = profile.location
+        self.upsert(
+            profile.user_id,
+            location.latitude if location else None,
+            location.longitude if location else None,
+            profile.age.value,
+            profile.fame_rating.value,
+            profile.gender,
+            profile.sexual_preference,
+            profile.interests,
+        )
+
+    def remove(self, user_id: int) -> bool:
+        """Drop user_id by moving the last entry into its slot"""
+        index = self._index.pop(user_id, None)
+        if index is None:
+            return False
+
+        last = len(self) - 1
+        if index != last:
+            self._index[self.user_ids[last]] = index
+        stride = self.tag_words
+        for column in (
+            self.user_ids,
+            self.latitudes,
+            self.longitudes,
+            self.ages,
+            self.fame,
+            self.genders,
+            self.preferences,
+        ):
+            column[index] = column[last]
+            column.pop()
+        self.tags[index * stride : (index + 1) * stride] = self.tags[
+            last * stride : (last + 1) * stride
+        ]
+        del self.tags[last * stride :]
+        return True
+
+    def replace_all(self, rows: Iterable[tuple]) -> None:
+        """Rebuild from rows in upsert argument order, one row per user"""
+        self._reset()
+        for row in rows:
+            self._append(*row)
+        self.loaded = True
+
+    # Column scans
+
+    def filter(
+        self,
+        exclude_user_ids: Iterable[int] = (),
+        age_min: int | None = None,
+        age_max: int | None = None,
+        genders: Iterable[str] | None = None,
+        compatible: Iterable[tuple[str, str]] | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        max_distance_km: float | None = None,
+    ) -> Iterator[int]:
+        """Indexes of profiles passing every given filter, in store order.
+
+        compatible restricts (gender, sexual_preference) pairs, see
+        core.services.matching.compatible_profiles.
+        """
+        excluded = set(exclude_user_ids)
+        low = age_min if age_min is not None else 0
+        high = age_max if age_max is not None else 255
+        gender_codes = (
+            {GENDER_CODES[_code(gender)] for gender in genders}
+            if genders is not None
+            else set(GENDER_CODES.values())
+        )
+        pair_codes = (
+            {
+                (GENDER_CODES[_code(gender)], PREFERENCE_CODES[_code(preference)])
+                for gender, preference in compatible
+            }
+            if compatible is not None
+            else None
+        )
+
+        by_distance = (
+            latitude is not None
+            and longitude is not None
+            and max_distance_km is not None
+        )
+        if by_distance:
+            # Cheap bounding box before the exact great-circle distance
+            lat_span = math.degrees(max_distance_km / _EARTH_RADIUS_KM)
+            cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+            lon_span = min(180.0, lat_span / cos_lat)
+
+        rows = zip(
+            self.user_ids,
+            self.ages,
+            self.genders,
+            self.preferences,
+            self.latitudes,
+            self.longitudes,
+            strict=True,
+        )
+        for index, (user_id, age, gender, preference, lat, lon) in enumerate(rows):
+            if not low <= age <= high or gender not in gender_codes:
+                continue
+            if pair_codes is not None and (gender, preference) not in pair_codes:
+                continue
+            if user_id in excluded:
+                continue
+            if by_distance:
+                if not abs(lat - latitude) <= lat_span:  # also skips NaN
+                    continue
+                dlon = abs(lon - longitude)
+                if min(dlon, 360.0 - dlon) > lon_span:
+                    continue
+                if haversine_km(latitude, longitude, lat, lon) > max_distance_km:
+                    continue
+            yield index
+
+    def scorer(
+        self,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        interests: Iterable[str] = (),
+    ) -> Callable[[int], float]:
+        """core.services.matching.match_score of a profile index for a
+        viewer at latitude/longitude with the given interests"""
+        mask = self.tag_mask(interests)
+        fame = self.fame
+        latitudes, longitudes = self.latitudes, self.longitudes
+        has_origin = latitude is not None and longitude is not None
+
+        def score(index: int) -> float:
+            shared = (mask & self.profile_tags(index)).bit_count() if mask else 0
+            distance = None
+            if has_origin:
+                lat, lon = latitudes[index], longitudes[index]
+                if lat == lat:  # not NaN
+                    distance = haversine_km(latitude, longitude, lat, lon)
+            return match_score(fame[index], shared, distance)
+
+        return score
+
+
+profile_store = ProfileStore()
+
+
+async def load_profile_store(engine: AsyncEngine, store: ProfileStore) -> None:
+    """Replace the snapshot with every completed profile"""
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(*_COLUMNS).where(UserProfileModel.profile_completed.is_(True))
+        )
+        store.replace_all(result.all())
+    logger.info("Profile store loaded %d profiles", len(store))
+
+
+async def keep_profile_store_current(engine: AsyncEngine, store: ProfileStore) -> None:
+    """Load the snapshot, then apply committed profile changes as they come"""
+
+    async def refresh(user_ids: set[int]) -> None:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                select(*_COLUMNS).where(
+                    UserProfileModel.user_id.in_(user_ids),
+                    UserProfileModel.profile_completed.is_(True),
+                )
+            )
+            rows = result.all()
+
+        for row in rows:
+            store.upsert(*row)
+        for user_id in user_ids - {row.user_id for row in rows}:
+            store.remove(user_id)
+
+    async def reload() -> None:
+        await load_profile_store(engine, store)
+
+    await listen_for_ids(engine, PROFILE_CHANGES_CHANNEL, refresh, on_connect=reload)
@@ -0,0 +1,11 @@
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from ...config.settings import get_settings
+
+
+@lru_cache
+def get_redis() -> Redis:
+    """Process-wide Redis client; connections come from its own pool"""
+    return Redis.from_url(get_settings().REDIS_URL, decode_responses=True)
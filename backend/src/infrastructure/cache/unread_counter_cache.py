@@ -0,0 +1,66 @@
+import logging
+from collections.abc import Iterable
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from ...config.settings import get_settings
+from ...core.repositories.unread_counter_repository import UnreadCounts
+from .redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class UnreadCounterCache:
+    """Redis mirror of unread_counters, one hash per user.
+
+    Redis is an accelerator only: errors are logged and reported as a miss,
+    so badge reads fall back to the database row.
+    """
+
+    def __init__(self, redis: Redis, ttl_seconds: int):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key(user_id: int) -> str:
+        return f"unread:{user_id}"
+
+    async def get(self, user_id: int) -> UnreadCounts | None:
+        try:
+            values = await self.redis.hgetall(self.key(user_id))
+        except Exception as e:
+            logger.warning("Unread counter cache read failed: %s", e)
+            return None
+
+        if not values:
+            return None
+        return UnreadCounts(
+            user_id=user_id,
+            messages=int(values.get("messages", 0)),
+            notifications=int(values.get("notifications", 0)),
+        )
+
+    async def set_many(self, counters: Iterable[UnreadCounts]) -> None:
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for counts in counters:
+                    key = self.key(counts.user_id)
+                    pipe.hset(
+                        key,
+                        mapping={
+                            "messages": counts.messages,
+                            "notifications": counts.notifications,
+                        },
+                    )
+                    pipe.expire(key, self.ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Unread counter cache write failed: %s", e)
+
+
+@lru_cache
+def get_unread_counter_cache() -> UnreadCounterCache:
+    return UnreadCounterCache(
+        get_redis(), get_settings().UNREAD_COUNTERS_CACHE_TTL_SECONDS
+    )
@@ -0,0 +1,78 @@
+"""LISTEN on a Postgres channel and hand batches of payloads to a callback.
+
+Triggers announce row changes with pg_notify; NOTIFY is delivered only
+once the writing transaction commits. Each listener holds a dedicated
+asyncpg connection outside the pool and reconnects on failure.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# How often an idle listener checks that its connection is still alive
+_HEALTH_CHECK_SECONDS = 30
+_RECONNECT_DELAY_SECONDS = 5
+
+
+async def _listen(
+    conn: asyncpg.Connection,
+    channel: str,
+    on_batch: Callable[[set[int]], Awaitable[None]],
+    on_connect: Callable[[], Awaitable[None]] | None,
+) -> None:
+    changed: asyncio.Queue[int] = asyncio.Queue()
+
+    def on_notify(connection, pid, channel, payload):
+        changed.put_nowait(int(payload))
+
+    await conn.add_listener(channel, on_notify)
+    if on_connect is not None:
+        await on_connect()
+
+    while not conn.is_closed():
+        try:
+            ids = {await asyncio.wait_for(changed.get(), _HEALTH_CHECK_SECONDS)}
+        except TimeoutError:
+            continue
+
+        # Coalesce bursts into a single callback
+        while not changed.empty():
+            ids.add(changed.get_nowait())
+        await on_batch(ids)
+
+
+async def listen_for_ids(
+    engine: AsyncEngine,
+    channel: str,
+    on_batch: Callable[[set[int]], Awaitable[None]],
+    on_connect: Callable[[], Awaitable[None]] | None = None,
+) -> None:
+    """Call on_batch with the integer payloads announced on channel.
+
+    Notifications sent while disconnected are lost. on_connect runs each
+    time listening (re)starts, after LISTEN is in place, so a full reload
+    there misses nothing; otherwise callers need their own way to catch
+    up (expiry, periodic reconciliation).
+    """
+    if engine.dialect.driver != "asyncpg":
+        logger.info("Listening on %s needs asyncpg, skipped", channel)
+        return
+
+    dsn = engine.url.set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+    while True:
+        try:
+            conn = await asyncpg.connect(dsn)
+            try:
+                await _listen(conn, channel, on_batch, on_connect)
+            finally:
+                await conn.close()
+        except Exception:
+            logger.exception("Listener on %s failed, reconnecting", channel)
+        await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
@@ -1,4 +1,10 @@
-from .chat_model import ConversationModel, MessageModel, NotificationModel
+from .chat_model import (
+    ConversationModel,
+    MessageModel,
+    NotificationModel,
+    UnreadCounterModel,
+)
+from .email_outbox_model import EmailOutboxModel
 from .matching_model import (
     BlockedUserModel,
     LikeModel,
@@ -6,6 +12,7 @@ from .matching_model import (
     ReportModel,
     VisitModel,
 )
+from .notification_digest_model import NotificationDigestEntryModel
 from .user_model import UserModel, UserProfileModel
 from .verification_token_model import VerificationTokenModel
 
@@ -20,5 +27,8 @@ __all__ = [
     "ConversationModel",
     "MessageModel",
     "NotificationModel",
+    "UnreadCounterModel",
     "VerificationTokenModel",
+    "EmailOutboxModel",
+    "NotificationDigestEntryModel",
 ]
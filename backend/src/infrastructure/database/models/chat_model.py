@@ -1,6 +1,16 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 
 from ..session import Base
 
@@ -9,9 +19,11 @@ class ConversationModel(Base):
     __tablename__ = "conversations"
 
     id = Column(Integer, primary_key=True, index=True)
-    match_id = Column(Integer, ForeignKey("matches.id"), nullable=False)
-    user1_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    user2_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    match_id = Column(
+        Integer, ForeignKey("matches.id"), unique=True, index=True, nullable=False
+    )
+    user1_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    user2_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
     status = Column(String(20), default="active")
     last_message_id = Column(Integer, nullable=True)
     last_message_at = Column(DateTime, nullable=True)
@@ -21,23 +33,44 @@ class ConversationModel(Base):
 
 class MessageModel(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        Index(
+            "ix_messages_conversation_id_created_at", "conversation_id", "created_at"
+        ),
+        Index(
+            "ix_messages_receiver_id_unread",
+            "receiver_id",
+            postgresql_where=text("status <> 'read'"),
+        ),
+        # Monthly partitions, see infrastructure/database/partitioning.py
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     conversation_id = Column(Integer, ForeignKey("conversations.id"), nullable=False)
-    sender_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    sender_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
     receiver_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     message_type = Column(String(20), default="text")
     status = Column(String(20), default="sent")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     read_at = Column(DateTime, nullable=True)
 
 
 class NotificationModel(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+        Index(
+            "ix_notifications_user_id_unread",
+            "user_id",
+            postgresql_where=text("NOT read"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     type = Column(String(20), nullable=False)
     title = Column(String(100), nullable=False)
@@ -46,5 +79,23 @@ class NotificationModel(Base):
     read = Column(Boolean, default=False)
     related_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     related_entity_id = Column(Integer, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(
+        DateTime, primary_key=True, default=datetime.utcnow, index=True
+    )
     read_at = Column(DateTime, nullable=True)
+
+
+class UnreadCounterModel(Base):
+    """Unread messages/notifications per user.
+
+    Maintained by triggers on messages and notifications in the same
+    transaction as the write (migration 8c3f5a91e6d2).
+    """
+
+    __tablename__ = "unread_counters"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    messages = Column(Integer, nullable=False, server_default="0")
+    notifications = Column(Integer, nullable=False, server_default="0")
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from ..session import Base
+
+
+class EmailOutboxModel(Base):
+    """Transactional outbox of emails (see outbox_dispatcher)"""
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Only due pending rows are ever scanned by the dispatcher
+        Index(
+            "ix_email_outbox_pending",
+            "available_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    status = Column(String(20), nullable=False, server_default="pending")
+    attempts = Column(Integer, nullable=False, server_default="0")
+    last_error = Column(Text, nullable=True)
+    available_at = Column(
+        DateTime, nullable=False, server_default=text("timezone('utc', now())")
+    )
+    created_at = Column(
+        DateTime, nullable=False, server_default=text("timezone('utc', now())")
+    )
+    sent_at = Column(DateTime, nullable=True)
@@ -1,12 +1,27 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 
 from ..session import Base
 
 
 class LikeModel(Base):
     __tablename__ = "likes"
+    __table_args__ = (
+        Index(
+            "ix_likes_user_id_target_user_id", "user_id", "target_user_id", unique=True
+        ),
+        Index("ix_likes_target_user_id_created_at", "target_user_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -17,10 +32,13 @@ class LikeModel(Base):
 
 class MatchModel(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        Index("ix_matches_user1_id_user2_id", "user1_id", "user2_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user1_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    user2_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user2_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
     status = Column(String(20), default="active")
     matched_at = Column(DateTime, default=datetime.utcnow)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -29,21 +47,37 @@ class MatchModel(Base):
 
 class VisitModel(Base):
     __tablename__ = "visits"
-
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        Index("ix_visits_visited_user_id_created_at", "visited_user_id", "created_at"),
+        Index("ix_visits_visitor_id_created_at", "visitor_id", "created_at"),
+        # Monthly partitions, see infrastructure/database/partitioning.py
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     visitor_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     visited_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     visit_type = Column(String(20), default="profile_view")
     duration_seconds = Column(Integer, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
 
 
 class BlockedUserModel(Base):
     __tablename__ = "blocked_users"
+    __table_args__ = (
+        Index(
+            "ix_blocked_users_user_id_blocked_user_id",
+            "user_id",
+            "blocked_user_id",
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    blocked_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    blocked_user_id = Column(
+        Integer, ForeignKey("users.id"), index=True, nullable=False
+    )
     reason = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
@@ -53,7 +87,9 @@ class ReportModel(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     reporter_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    reported_user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    reported_user_id = Column(
+        Integer, ForeignKey("users.id"), index=True, nullable=False
+    )
     report_type = Column(String(30), nullable=False)
     description = Column(Text, nullable=False)
     resolved = Column(Boolean, default=False)
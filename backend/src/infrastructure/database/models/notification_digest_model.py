@@ -0,0 +1,25 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, text
+
+from ..session import Base
+
+
+class NotificationDigestEntryModel(Base):
+    """Notifications waiting to be emailed as a digest (see notification_digests)"""
+
+    __tablename__ = "notification_digest_entries"
+    __table_args__ = (
+        Index("ix_notification_digest_entries_user_id", "user_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    email = Column(String(255), nullable=False)
+    username = Column(String(50), nullable=False)
+    type = Column(String(50), nullable=False)
+    title = Column(String(100), nullable=False)
+    content = Column(String(500), nullable=False)
+    created_at = Column(
+        DateTime, nullable=False, server_default=text("timezone('utc', now())")
+    )
@@ -6,9 +6,11 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    func,
 )
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
@@ -32,6 +34,12 @@ class UserModel(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Case-insensitive login lookups; unique so a login matches one account
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+        Index("ix_users_username_lower", func.lower(username), unique=True),
+    )
+
     # Relationships
     profile = relationship("UserProfileModel", back_populates="user", uselist=False)
     verification_tokens = relationship(
@@ -43,7 +51,9 @@ class UserProfileModel(Base):
     __tablename__ = "user_profiles"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(
+        Integer, ForeignKey("users.id"), unique=True, index=True, nullable=False
+    )
     age = Column(Integer, nullable=False)
     gender = Column(String(20), nullable=False)
     sexual_preference = Column(String(20), nullable=False)
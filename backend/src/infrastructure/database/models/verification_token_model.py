@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from ..session import Base
@@ -8,6 +8,9 @@ from ..session import Base
 
 class VerificationTokenModel(Base):
     __tablename__ = "verification_tokens"
+    __table_args__ = (
+        Index("ix_verification_tokens_user_id_token_type", "user_id", "token_type"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -0,0 +1,160 @@
+"""Monthly range partitioning for append-heavy tables.
+
+visits, messages and notifications are partitioned by RANGE (created_at)
+with one partition per calendar month, named <table>_pYYYYMM. Future
+partitions are created ahead of time and retention drops whole partitions
+(DETACH + DROP) instead of running DELETE scans.
+"""
+
+import asyncio
+import logging
+import re
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ...config.settings import Settings, get_settings
+from .unread_counters import reconcile_unread_counters
+
+logger = logging.getLogger(__name__)
+
+# Partitioned table -> setting holding its retention in months (0 keeps all)
+PARTITIONED_TABLES = {
+    "visits": "VISITS_RETENTION_MONTHS",
+    "messages": "MESSAGES_RETENTION_MONTHS",
+    "notifications": "NOTIFICATIONS_RETENTION_MONTHS",
+}
+
+# Tables whose rows feed the unread counters; dropping a partition bypasses
+# the counter triggers, so counters are recounted afterwards
+_COUNTED_TABLES = ("messages", "notifications")
+
+# Serialises maintenance across workers
+_ADVISORY_LOCK_KEY = 0x6D617463  # "matc"
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def create_partition(conn: Connection, table: str, month: date) -> None:
+    """Create the partition holding rows of the given month, if missing"""
+    month = month_start(month)
+    conn.execute(
+        text(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+            f"PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{add_months(month, 1).isoformat()}')"
+        )
+    )
+
+
+def ensure_partitions(
+    conn: Connection,
+    table: str,
+    first_month: date,
+    months_ahead: int,
+    last_month: date | None = None,
+) -> None:
+    """Create partitions from first_month through months_ahead past today,
+    or through last_month if that is later"""
+    month = month_start(first_month)
+    last = add_months(month_start(date.today()), months_ahead)
+    if last_month is not None:
+        last = max(last, month_start(last_month))
+    while month <= last:
+        create_partition(conn, table, month)
+        month = add_months(month, 1)
+
+
+def list_partitions(conn: Connection, table: str) -> list[tuple[str, date]]:
+    """Monthly partitions of table with the month each one holds"""
+    rows = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    )
+
+    partitions = []
+    for (name,) in rows:
+        match = _PARTITION_SUFFIX.search(name)
+        if match:
+            partitions.append((name, date(int(match[1]), int(match[2]), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def drop_partitions_before(conn: Connection, table: str, cutoff: date) -> list[str]:
+    """Detach and drop partitions whose rows are all older than cutoff"""
+    dropped = []
+    for name, month in list_partitions(conn, table):
+        if add_months(month, 1) > cutoff:
+            break
+        conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+        conn.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    return dropped
+
+
+def maintain(conn: Connection, settings: Settings) -> list[str]:
+    """Create upcoming partitions and drop expired ones for every table,
+    return the tables that lost partitions"""
+    conn.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY}
+    )
+
+    this_month = month_start(date.today())
+    pruned = []
+    for table, retention_setting in PARTITIONED_TABLES.items():
+        ensure_partitions(conn, table, this_month, settings.PARTITION_PREMAKE_MONTHS)
+
+        retention_months = getattr(settings, retention_setting)
+        if retention_months > 0:
+            cutoff = add_months(this_month, -retention_months)
+            dropped = drop_partitions_before(conn, table, cutoff)
+            for name in dropped:
+                logger.info("Dropped expired partition %s", name)
+            if dropped:
+                pruned.append(table)
+    return pruned
+
+
+async def maintain_partitions(engine: AsyncEngine) -> None:
+    settings = get_settings()
+    async with engine.begin() as conn:
+        pruned = await conn.run_sync(maintain, settings)
+
+    if any(table in _COUNTED_TABLES for table in pruned):
+        corrected = await reconcile_unread_counters(engine)
+        logger.info(
+            "Recounted unread counters after dropping partitions, %d corrected",
+            len(corrected),
+        )
+
+
+async def partition_maintenance_loop(engine: AsyncEngine) -> None:
+    """Run partition maintenance now and then on a fixed interval"""
+    interval = get_settings().PARTITION_MAINTENANCE_INTERVAL_SECONDS
+    while True:
+        try:
+            await maintain_partitions(engine)
+        except Exception:
+            logger.exception("Partition maintenance failed")
+        await asyncio.sleep(interval)
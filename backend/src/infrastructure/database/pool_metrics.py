@@ -0,0 +1,123 @@
+from bisect import bisect_left
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Seconds spent waiting for a connection to become available
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Connections in use / overflow connections open at checkout time
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 10, 15, 20, 30, 50)
+
+
+class Histogram:
+    """Fixed-bucket histogram with cumulative bucket counts"""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        cumulative: dict[str, int] = {}
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            cumulative[str(bound)] = running
+        cumulative["+Inf"] = self.count
+        return {"count": self.count, "sum": round(self.sum, 6), "buckets": cumulative}
+
+
+class PoolMetrics:
+    """Connection pool instrumentation fed by SQLAlchemy pool events"""
+
+    def __init__(self):
+        self.wait_seconds = Histogram(WAIT_BUCKETS)
+        self.checked_out = Histogram(COUNT_BUCKETS)
+        self.overflow = Histogram(COUNT_BUCKETS)
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+        self.timeouts = 0
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Register pool event listeners on the engine"""
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            self.connects += 1
+
+        @event.listens_for(engine.sync_engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            self.checkouts += 1
+            pool = engine.sync_engine.pool
+            if isinstance(pool, AsyncAdaptedQueuePool):
+                self.checked_out.observe(pool.checkedout())
+                self.overflow.observe(max(pool.overflow(), 0))
+
+        @event.listens_for(engine.sync_engine, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception):
+            self.invalidations += 1
+
+    def snapshot(self, engine: AsyncEngine) -> dict[str, Any]:
+        """Current pool state plus the accumulated histograms"""
+        pool = engine.sync_engine.pool
+        state: dict[str, Any] = {"pool_class": type(pool).__name__}
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            state.update(
+                {
+                    "size": pool.size(),
+                    "checked_in": pool.checkedin(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": pool.overflow(),
+                }
+            )
+
+        return {
+            "pool": state,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_seconds": self.wait_seconds.snapshot(),
+            "checked_out": self.checked_out.snapshot(),
+            "overflow": self.overflow.snapshot(),
+        }
+
+
+# Process-wide metrics for the application engine
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection.
+
+    SQLAlchemy has no pool event that fires before a checkout starts waiting,
+    so the wait is timed around the pool's own acquisition step.
+    """
+
+    metrics: PoolMetrics = pool_metrics
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.wait_seconds.observe(perf_counter() - start)
+
+
+def instrumented_pool_class(metrics: PoolMetrics) -> type[InstrumentedQueuePool]:
+    """Pool class that reports into the given metrics"""
+    return type("InstrumentedQueuePool", (InstrumentedQueuePool,), {"metrics": metrics})
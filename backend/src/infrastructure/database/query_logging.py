@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import re
+import reprlib
+import sys
+from collections.abc import Iterator
+from time import perf_counter
+from types import FrameType
+from typing import Any
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger("matcha.sql.slow")
+
+_REPOSITORY_PATH = "/infrastructure/database/repositories/"
+_START_TIME_KEY = "slow_query_start_time"
+
+_params_repr = reprlib.Repr()
+_params_repr.maxstring = 80
+_params_repr.maxother = 80
+
+# SELECTs that have effects beyond reading when executed again: row locks,
+# notifications, advisory locks, sequence bumps. Their plan is captured
+# without ANALYZE, which plans the statement but does not run it.
+_SIDE_EFFECTS = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+)?UPDATE\b"
+    r"|\bFOR\s+(?:KEY\s+)?SHARE\b"
+    r"|\b(?:pg_notify|pg_advisory_\w*|pg_try_advisory_\w*|nextval|setval"
+    r"|pg_sleep\w*|dblink\w*|lo_\w+|set_config)\s*\(",
+    re.IGNORECASE,
+)
+
+# Keep references to in-flight EXPLAIN tasks so they are not garbage collected
+_explain_tasks: set[asyncio.Task] = set()
+
+
+def _frames() -> Iterator[FrameType]:
+    """Walk the current stack, continuing into the awaiting coroutine.
+
+    Cursor events run inside the greenlet SQLAlchemy spawns for sync work;
+    the repository coroutine that issued the query lives on the parent
+    greenlet's stack.
+    """
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+    parent = greenlet.getcurrent().parent
+    frame = parent.gr_frame if parent is not None else None
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+
+def _originating_method() -> str | None:
+    """Find the repository method that issued the current statement"""
+    for frame in _frames():
+        if _REPOSITORY_PATH in frame.f_code.co_filename.replace("\\", "/"):
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                return f"{type(owner).__name__}.{frame.f_code.co_name}"
+            return frame.f_code.co_name
+    return None
+
+
+async def _explain(
+    engine: AsyncEngine, statement: str, parameters: Any, origin: str | None
+) -> None:
+    """Capture the plan of a slow SELECT on a separate connection"""
+    if _SIDE_EFFECTS.search(statement):
+        options = "EXPLAIN"
+    else:
+        options = "EXPLAIN (ANALYZE, BUFFERS)"
+    try:
+        async with engine.connect() as conn:
+            result = await conn.exec_driver_sql(f"{options} {statement}", parameters)
+            plan = "\n".join(row[0] for row in result)
+            await conn.rollback()
+    except Exception as e:
+        logger.warning("EXPLAIN failed for slow query from %s: %s", origin, e)
+        return
+
+    logger.warning("Plan for slow query from %s:\n%s", origin, plan)
+
+
+def _schedule_explain(
+    engine: AsyncEngine, statement: str, parameters: Any, origin: str | None
+) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    task = loop.create_task(_explain(engine, statement, parameters, origin))
+    _explain_tasks.add(task)
+    task.add_done_callback(_explain_tasks.discard)
+
+
+def install_slow_query_log(
+    engine: AsyncEngine, threshold_ms: int, explain: bool = False
+) -> None:
+    """Log statements slower than threshold_ms, optionally with their plan.
+
+    ANALYZE executes the statement again, so plans are only captured for
+    SELECTs, never for writes or executemany batches, and SELECTs that
+    lock rows or call functions with side effects are only planned.
+    """
+    threshold = threshold_ms / 1000
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info[_START_TIME_KEY] = perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop(_START_TIME_KEY, None)
+        if start is None:
+            return
+
+        elapsed = perf_counter() - start
+        if elapsed < threshold:
+            return
+
+        origin = _originating_method()
+        logger.warning(
+            "Slow query (%.1f ms) from %s: %s | parameters: %s",
+            elapsed * 1000,
+            origin or "<unknown>",
+            statement,
+            _params_repr.repr(parameters),
+        )
+
+        if (
+            explain
+            and not executemany
+            and statement.lstrip().upper().startswith("SELECT")
+        ):
+            _schedule_explain(engine, statement, parameters, origin)
@@ -0,0 +1,52 @@
+"""Fast path for hot reads: SQL run directly on the session's asyncpg connection.
+
+For read-heavy repository methods, building ORM model instances and then
+converting them to entities costs more CPU than the query itself. A
+RawQuery executes fixed SQL on the asyncpg connection underneath the
+session - same transaction, same pool - and returns asyncpg Records that
+repositories hydrate into entities directly.
+
+asyncpg prepares each distinct SQL string once per connection and reuses
+it through its statement cache. Statements on this path bypass the
+SQLAlchemy cursor events, so they do not show up in the slow query log.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from asyncpg import Connection, Record
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def is_available(session: AsyncSession) -> bool:
+    """Whether the session is bound to an asyncpg engine"""
+    bind = session.bind
+    return bind is not None and bind.dialect.driver == "asyncpg"
+
+
+async def driver_connection(session: AsyncSession) -> Connection:
+    """The asyncpg connection behind the session's current transaction"""
+    # Keep read-after-write semantics of the ORM's autoflush
+    if session.new or session.dirty or session.deleted:
+        await session.flush()
+
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    return raw.driver_connection
+
+
+class RawQuery:
+    """A fixed SQL statement with $n placeholders"""
+
+    __slots__ = ("sql",)
+
+    def __init__(self, sql: str):
+        self.sql = sql
+
+    async def fetch(self, session: AsyncSession, *args: Any) -> Sequence[Record]:
+        conn = await driver_connection(session)
+        return await conn.fetch(self.sql, *args)
+
+    async def fetchrow(self, session: AsyncSession, *args: Any) -> Record | None:
+        conn = await driver_connection(session)
+        return await conn.fetchrow(self.sql, *args)
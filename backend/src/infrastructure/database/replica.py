@@ -0,0 +1,40 @@
+from time import monotonic
+
+from ...config.settings import get_settings
+
+
+class ReadYourWritesTracker:
+    """Remembers which users wrote recently so their reads skip the replica.
+
+    Replication lag means a replica may not yet show a user's own changes.
+    For a short window after a user commits, their read-only units of work
+    stay on the primary. State is per process; run workers with sticky
+    sessions or keep the window above the worst expected lag.
+    """
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._last_write: dict[int, float] = {}
+
+    def record_write(self, user_id: int) -> None:
+        now = monotonic()
+        self._last_write[user_id] = now
+        if len(self._last_write) > 10_000:
+            self._prune(now)
+
+    def recently_wrote(self, user_id: int | None) -> bool:
+        if user_id is None:
+            return False
+        last_write = self._last_write.get(user_id)
+        return last_write is not None and monotonic() - last_write < self.window_seconds
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        self._last_write = {
+            user_id: written_at
+            for user_id, written_at in self._last_write.items()
+            if written_at >= cutoff
+        }
+
+
+read_your_writes = ReadYourWritesTracker(get_settings().READ_YOUR_WRITES_SECONDS)
@@ -0,0 +1,122 @@
+from datetime import timedelta
+
+from sqlalchemy import delete, func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....core.entities.email_outbox import OutboxEmail, OutboxStatus
+from ....core.repositories.email_outbox_repository import EmailOutboxRepository
+from ..models.email_outbox_model import EmailOutboxModel
+
+# Channel an insert trigger notifies so dispatchers wake up immediately,
+# payload is the outbox id
+EMAIL_OUTBOX_CHANNEL = "email_outbox"
+
+_UTC_NOW = func.timezone("utc", func.now())
+
+
+class EmailOutboxRepositoryImpl(EmailOutboxRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _to_entity(model: EmailOutboxModel) -> OutboxEmail:
+        return OutboxEmail.model_construct(
+            id=model.id,
+            kind=model.kind,
+            payload=model.payload,
+            status=model.status,
+            attempts=model.attempts,
+            last_error=model.last_error,
+            available_at=model.available_at,
+            created_at=model.created_at,
+            sent_at=model.sent_at,
+        )
+
+    async def enqueue(self, email: OutboxEmail) -> None:
+        """Record an email to send once the transaction commits"""
+        await self.session.execute(
+            insert(EmailOutboxModel).values(kind=email.kind, payload=email.payload)
+        )
+
+    async def claim_batch(self, limit: int, lease: timedelta) -> list[OutboxEmail]:
+        """Claim up to limit due pending emails, oldest first.
+
+        Claimed rows stay pending but are pushed out of reach for lease, so
+        the caller can commit and send without holding row locks; a
+        dispatcher that dies mid-batch leaves them due again afterwards.
+        The attempt is counted here so such crashes still use one up.
+        """
+        due = (
+            select(EmailOutboxModel.id)
+            .where(
+                EmailOutboxModel.status == OutboxStatus.PENDING.value,
+                EmailOutboxModel.available_at <= _UTC_NOW,
+            )
+            .order_by(EmailOutboxModel.available_at, EmailOutboxModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(due))
+            .values(
+                attempts=EmailOutboxModel.attempts + 1,
+                available_at=_UTC_NOW + lease,
+            )
+            .returning(EmailOutboxModel)
+            .execution_options(synchronize_session=False)
+        )
+        models = sorted(result.scalars(), key=lambda model: model.id)
+        return [self._to_entity(model) for model in models]
+
+    # Every claim counts an attempt, so a row whose attempts moved on since
+    # the caller claimed it has been claimed again after the lease ran out;
+    # only the latest claim may record the outcome
+
+    async def mark_sent(self, emails: list[OutboxEmail]) -> int:
+        """Mark claimed emails as delivered, return how many were still
+        claimed by the caller"""
+        if not emails:
+            return 0
+        result = await self.session.execute(
+            update(EmailOutboxModel)
+            .where(
+                tuple_(EmailOutboxModel.id, EmailOutboxModel.attempts).in_(
+                    [(email.id, email.attempts) for email in emails]
+                )
+            )
+            .values(status=OutboxStatus.SENT.value, sent_at=_UTC_NOW)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def mark_failed(
+        self, email: OutboxEmail, error: str, retry_in: timedelta | None
+    ) -> bool:
+        """Record why a claimed email failed; retry after retry_in, or give
+        up if None. False if the claim was lost meanwhile."""
+        values = {"last_error": error}
+        if retry_in is None:
+            values["status"] = OutboxStatus.FAILED.value
+        else:
+            values["available_at"] = _UTC_NOW + retry_in
+        result = await self.session.execute(
+            update(EmailOutboxModel)
+            .where(
+                EmailOutboxModel.id == email.id,
+                EmailOutboxModel.attempts == email.attempts,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def delete_sent_older_than(self, age: timedelta) -> int:
+        """Delete emails delivered more than age ago, return how many"""
+        result = await self.session.execute(
+            delete(EmailOutboxModel).where(
+                EmailOutboxModel.status == OutboxStatus.SENT.value,
+                EmailOutboxModel.sent_at < _UTC_NOW - age,
+            )
+        )
+        return result.rowcount
@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....core.entities.notification_digest import DigestEntry
+from ....core.repositories.notification_digest_repository import (
+    NotificationDigestRepository,
+)
+from ..models.notification_digest_model import NotificationDigestEntryModel
+
+_UTC_NOW = func.timezone("utc", func.now())
+
+
+class NotificationDigestRepositoryImpl(NotificationDigestRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _to_entity(model: NotificationDigestEntryModel) -> DigestEntry:
+        return DigestEntry.model_construct(
+            id=model.id,
+            user_id=model.user_id,
+            email=model.email,
+            username=model.username,
+            type=model.type,
+            title=model.title,
+            content=model.content,
+            created_at=model.created_at,
+        )
+
+    async def add(self, entry: DigestEntry) -> None:
+        """Buffer a notification in the caller's transaction"""
+        await self.session.execute(
+            insert(NotificationDigestEntryModel).values(
+                user_id=entry.user_id,
+                email=entry.email,
+                username=entry.username,
+                type=entry.type,
+                title=entry.title,
+                content=entry.content,
+            )
+        )
+
+    async def take_due(self, window: timedelta, max_users: int) -> list[DigestEntry]:
+        """Delete and return the entries of users with a due digest.
+
+        Entries are deleted rather than locked: a concurrent flusher
+        blocks on the same rows and then skips them, so every entry is
+        taken exactly once. Entries added meanwhile open the next window.
+        """
+        model = NotificationDigestEntryModel
+        oldest = func.min(model.created_at)
+        due_users = (
+            select(model.user_id)
+            .group_by(model.user_id)
+            .having(oldest <= _UTC_NOW - window)
+            .order_by(oldest)
+            .limit(max_users)
+        )
+        result = await self.session.execute(
+            delete(model)
+            .where(model.user_id.in_(due_users))
+            .returning(model)
+            .execution_options(synchronize_session=False)
+        )
+        entries = [self._to_entity(row) for row in result.scalars()]
+        entries.sort(key=lambda entry: (entry.user_id, entry.created_at, entry.id))
+        return entries
@@ -1,38 +1,130 @@
-from sqlalchemy import and_, func, select, update
+from collections.abc import Mapping
+from enum import Enum
+
+from sqlalchemy import and_, func, lambda_stmt, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
 from src.core.entities.user import UserProfile
-from src.core.repositories.profile_repository import ProfileRepository
+from src.core.repositories.profile_repository import (
+    PROFILE_FIELDS,
+    PictureChange,
+    ProfileRepository,
+)
 from src.core.value_objects.age import Age
 from src.core.value_objects.fame_rating import FameRating
 from src.core.value_objects.location import Location
 from src.infrastructure.database.models.user_model import UserProfileModel
+from src.infrastructure.database.raw_queries import RawQuery, is_available
+
+MAX_PICTURES = 5
+
+# Entity fields stored across several columns
+FIELD_COLUMNS = {"location": ("latitude", "longitude", "city", "country")}
+
+# Raw asyncpg queries for the hottest reads, see raw_queries
+_PROFILE_COLUMNS = ", ".join(
+    column.name for column in UserProfileModel.__table__.columns
+)
+
+PROFILE_BY_USER_ID = RawQuery(
+    f"SELECT {_PROFILE_COLUMNS} FROM user_profiles WHERE user_id = $1"
+)
+
+PROFILES_BY_USER_IDS = RawQuery(
+    f"SELECT {_PROFILE_COLUMNS} FROM user_profiles WHERE user_id = ANY($1::int[])"
+)
+
+# $2/$3: origin latitude/longitude, $4: radius in km (Haversine, as below)
+PROFILES_WITHIN_RADIUS = RawQuery(
+    f"SELECT {_PROFILE_COLUMNS} FROM user_profiles "
+    "WHERE user_id <> $1 "
+    "AND latitude IS NOT NULL AND longitude IS NOT NULL "
+    "AND profile_completed = true "
+    "AND 2 * asin(sqrt("
+    "sin((radians(latitude) - radians($2)) / 2) ^ 2 "
+    "+ cos(radians($2)) * cos(radians(latitude)) "
+    "* sin((radians(longitude) - radians($3)) / 2) ^ 2"
+    ")) * 6371 <= $4"
+)
+
+
+def _enum_value(value):
+    return value.value if isinstance(value, Enum) else value
+
+
+def _projection_columns(fields: frozenset[str]) -> list[ColumnElement]:
+    return [
+        UserProfileModel.__table__.c[column]
+        for field in PROFILE_FIELDS
+        if field in fields
+        for column in FIELD_COLUMNS.get(field, (field,))
+    ]
+
+
+def _row_to_projection(row: Mapping, fields: frozenset[str]) -> dict:
+    """Shape selected columns like project_profile does for entities"""
+    data = {}
+    for field in PROFILE_FIELDS:
+        if field not in fields:
+            continue
+        if field == "location":
+            located = row["latitude"] is not None and row["longitude"] is not None
+            data[field] = (
+                {column: row[column] for column in FIELD_COLUMNS[field]}
+                if located
+                else None
+            )
+        elif field in ("interests", "pictures"):
+            data[field] = row[field] or []
+        else:
+            data[field] = row[field]
+    return data
+
+
+def _is_complete(pictures: ColumnElement) -> ColumnElement:
+    """SQL counterpart of UserProfile.is_complete for a new pictures value"""
+    return and_(
+        UserProfileModel.biography != "",
+        UserProfileModel.latitude.isnot(None),
+        UserProfileModel.longitude.isnot(None),
+        func.coalesce(func.cardinality(pictures), 0) >= 1,
+    )
 
 
 class ProfileRepositoryImpl(ProfileRepository):
+    # Serve hot reads through raw_queries when the session runs on asyncpg
+    use_raw_queries = True
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    def _raw(self) -> bool:
+        return self.use_raw_queries and is_available(self.session)
+
+    # Rows come from our own database and were validated on the way in, so
+    # entities are hydrated with trusted() instead of re-validating
+
     def _model_to_entity(self, model: UserProfileModel) -> UserProfile:
         """Convert database model to domain entity."""
         location = None
         if model.latitude is not None and model.longitude is not None:
-            location = Location(
+            location = Location.trusted(
                 latitude=model.latitude,
                 longitude=model.longitude,
                 city=model.city,
                 country=model.country,
             )
 
-        return UserProfile(
+        return UserProfile.trusted(
             id=model.id,
             user_id=model.user_id,
-            age=Age(model.age),
+            age=Age.trusted(model.age),
             gender=model.gender,
             sexual_preference=model.sexual_preference,
             biography=model.biography,
             location=location,
-            fame_rating=FameRating(model.fame_rating),
+            fame_rating=FameRating.trusted(model.fame_rating),
             interests=model.interests or [],
             pictures=model.pictures or [],
             profile_completed=model.profile_completed,
@@ -40,32 +132,52 @@ class ProfileRepositoryImpl(ProfileRepository):
             updated_at=model.updated_at,
         )
 
+    def _record_to_entity(self, record: Mapping) -> UserProfile:
+        """Convert a raw row (e.g. an asyncpg Record) to domain entity."""
+        location = None
+        if record["latitude"] is not None and record["longitude"] is not None:
+            location = Location.trusted(
+                latitude=record["latitude"],
+                longitude=record["longitude"],
+                city=record["city"],
+                country=record["country"],
+            )
+
+        return UserProfile.trusted(
+            id=record["id"],
+            user_id=record["user_id"],
+            age=Age.trusted(record["age"]),
+            gender=record["gender"],
+            sexual_preference=record["sexual_preference"],
+            biography=record["biography"],
+            location=location,
+            fame_rating=FameRating.trusted(record["fame_rating"]),
+            interests=record["interests"] or [],
+            pictures=record["pictures"] or [],
+            profile_completed=record["profile_completed"],
+            created_at=record["created_at"],
+            updated_at=record["updated_at"],
+        )
+
     def _entity_to_model_data(self, profile: UserProfile) -> dict:
         """Convert domain entity to database model data."""
-        data = {
+        location = profile.location
+        return {
             "user_id": profile.user_id,
             "age": profile.age.value,
-            "gender": profile.gender.value,
-            "sexual_preference": profile.sexual_preference.value,
+            "gender": _enum_value(profile.gender),
+            "sexual_preference": _enum_value(profile.sexual_preference),
             "biography": profile.biography,
+            "latitude": location.latitude if location else None,
+            "longitude": location.longitude if location else None,
+            "city": location.city if location else None,
+            "country": location.country if location else None,
             "fame_rating": profile.fame_rating.value,
             "interests": profile.interests,
             "pictures": profile.pictures,
-            "profile_completed": profile.profile_completed,
+            "profile_completed": bool(profile.profile_completed),
         }
 
-        if profile.location:
-            data.update(
-                {
-                    "latitude": profile.location.latitude,
-                    "longitude": profile.location.longitude,
-                    "city": profile.location.city,
-                    "country": profile.location.country,
-                }
-            )
-
-        return data
-
     async def create(self, profile: UserProfile) -> UserProfile:
         """Create a new user profile."""
         model_data = self._entity_to_model_data(profile)
@@ -76,11 +188,18 @@ class ProfileRepositoryImpl(ProfileRepository):
 
         # Update entity with generated ID
         profile.id = model.id
+        profile.mark_clean()
         return profile
 
     async def get_by_user_id(self, user_id: int) -> UserProfile | None:
         """Get a user profile by user ID."""
-        stmt = select(UserProfileModel).where(UserProfileModel.user_id == user_id)
+        if self._raw():
+            record = await PROFILE_BY_USER_ID.fetchrow(self.session, user_id)
+            return self._record_to_entity(record) if record else None
+
+        stmt = lambda_stmt(
+            lambda: select(UserProfileModel).where(UserProfileModel.user_id == user_id)
+        )
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
 
@@ -89,9 +208,52 @@ class ProfileRepositoryImpl(ProfileRepository):
 
         return self._model_to_entity(model)
 
+    async def get_by_user_ids(self, user_ids: list[int]) -> list[UserProfile]:
+        """Get the profiles of several users, in no particular order."""
+        if not user_ids:
+            return []
+
+        if self._raw():
+            records = await PROFILES_BY_USER_IDS.fetch(self.session, user_ids)
+            return [self._record_to_entity(record) for record in records]
+
+        result = await self.session.execute(
+            select(UserProfileModel).where(UserProfileModel.user_id.in_(user_ids))
+        )
+        return [self._model_to_entity(model) for model in result.scalars()]
+
+    async def get_projection_by_user_id(
+        self, user_id: int, fields: frozenset[str]
+    ) -> dict | None:
+        """Get only the given fields of a user's profile."""
+        result = await self.session.execute(
+            select(*_projection_columns(fields)).where(
+                UserProfileModel.user_id == user_id
+            )
+        )
+        row = result.mappings().one_or_none()
+        return _row_to_projection(row, fields) if row is not None else None
+
+    async def get_projections_by_user_ids(
+        self, user_ids: list[int], fields: frozenset[str]
+    ) -> list[dict]:
+        """Get the given fields of several profiles, in no particular order."""
+        if not user_ids:
+            return []
+
+        fields = fields | {"user_id"}
+        result = await self.session.execute(
+            select(*_projection_columns(fields)).where(
+                UserProfileModel.user_id.in_(user_ids)
+            )
+        )
+        return [_row_to_projection(row, fields) for row in result.mappings()]
+
     async def get_by_id(self, profile_id: int) -> UserProfile | None:
         """Get a user profile by profile ID."""
-        stmt = select(UserProfileModel).where(UserProfileModel.id == profile_id)
+        stmt = lambda_stmt(
+            lambda: select(UserProfileModel).where(UserProfileModel.id == profile_id)
+        )
         result = await self.session.execute(stmt)
         model = result.scalar_one_or_none()
 
@@ -101,16 +263,27 @@ class ProfileRepositoryImpl(ProfileRepository):
         return self._model_to_entity(model)
 
     async def update(self, profile: UserProfile) -> UserProfile:
-        """Update an existing user profile."""
+        """Update an existing user profile, writing only the changed columns."""
+        columns = {
+            column
+            for field in profile.changed_fields
+            for column in FIELD_COLUMNS.get(field, (field,))
+        }
         model_data = self._entity_to_model_data(profile)
+        values = {column: model_data[column] for column in columns & model_data.keys()}
+
+        if values:
+            stmt = (
+                update(UserProfileModel)
+                .where(UserProfileModel.id == profile.id)
+                .values(**values)
+                .returning(UserProfileModel.updated_at)
+            )
+            updated_at = await self.session.scalar(stmt)
+            if updated_at is not None:
+                profile.updated_at = updated_at
 
-        stmt = (
-            update(UserProfileModel)
-            .where(UserProfileModel.id == profile.id)
-            .values(**model_data)
-        )
-        await self.session.execute(stmt)
-
+        profile.mark_clean()
         return profile
 
     async def delete(self, profile_id: int) -> bool:
@@ -125,42 +298,60 @@ class ProfileRepositoryImpl(ProfileRepository):
         await self.session.delete(model)
         return True
 
-    async def add_picture(self, user_id: int, picture_url: str) -> bool:
-        """Add a picture to user's profile."""
-        # Get current profile
-        profile = await self.get_by_user_id(user_id)
-        if profile is None:
-            return False
-
-        # Check if picture already exists or limit exceeded
-        if picture_url in profile.pictures or len(profile.pictures) >= 5:
-            return False
+    async def _change_pictures(
+        self, user_id: int, pictures: ColumnElement, *conditions: ColumnElement
+    ) -> PictureChange | None:
+        """Rewrite the pictures array in one guarded UPDATE ... RETURNING."""
+        stmt = (
+            update(UserProfileModel)
+            .where(UserProfileModel.user_id == user_id, *conditions)
+            .values(pictures=pictures, profile_completed=_is_complete(pictures))
+            .returning(UserProfileModel.pictures, UserProfileModel.profile_completed)
+            .execution_options(synchronize_session=False)
+        )
+        row = (await self.session.execute(stmt)).one_or_none()
 
-        # Add picture and update
-        profile.add_picture(picture_url)
-        await self.update(profile)
-        return True
+        if row is None:
+            return None
 
-    async def remove_picture(self, user_id: int, picture_url: str) -> bool:
-        """Remove a picture from user's profile."""
-        # Get current profile
-        profile = await self.get_by_user_id(user_id)
-        if profile is None:
-            return False
+        return PictureChange(
+            pictures=row.pictures or [], profile_completed=row.profile_completed
+        )
 
-        # Check if picture exists
-        if picture_url not in profile.pictures:
-            return False
+    async def add_picture(self, user_id: int, picture_url: str) -> PictureChange | None:
+        """Add a picture to user's profile.
+
+        The duplicate and limit checks run in the UPDATE itself, so concurrent
+        uploads cannot push a profile past the limit.
+        """
+        return await self._change_pictures(
+            user_id,
+            func.array_append(UserProfileModel.pictures, picture_url),
+            func.array_position(UserProfileModel.pictures, picture_url).is_(None),
+            func.coalesce(func.cardinality(UserProfileModel.pictures), 0)
+            < MAX_PICTURES,
+        )
 
-        # Remove picture and update
-        profile.remove_picture(picture_url)
-        await self.update(profile)
-        return True
+    async def remove_picture(
+        self, user_id: int, picture_url: str
+    ) -> PictureChange | None:
+        """Remove a picture from user's profile."""
+        return await self._change_pictures(
+            user_id,
+            func.array_remove(UserProfileModel.pictures, picture_url),
+            func.array_position(UserProfileModel.pictures, picture_url).isnot(None),
+        )
 
     async def get_profiles_by_location_radius(
         self, latitude: float, longitude: float, radius_km: int, exclude_user_id: int
     ) -> list[UserProfile]:
         """Get profiles within a geographic radius using Haversine formula."""
+        if self._raw():
+            records = await PROFILES_WITHIN_RADIUS.fetch(
+                self.session, exclude_user_id, latitude, longitude, float(radius_km)
+            )
+            return [self._record_to_entity(record) for record in records]
+
         # Haversine formula to calculate distance
         lat1_rad = func.radians(latitude)
         lng1_rad = func.radians(longitude)
@@ -0,0 +1,132 @@
+from sqlalchemy import lambda_stmt, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ....core.repositories.unread_counter_repository import (
+    UnreadCounterRepository,
+    UnreadCounts,
+)
+from ...cache.unread_counter_cache import UnreadCounterCache
+from ..models.chat_model import UnreadCounterModel
+
+# Channel the counter triggers notify on, payload is the user id
+UNREAD_COUNTERS_CHANNEL = "unread_counters"
+
+# Recount every user with unread rows or an existing counter and compare
+# with the counters. One statement reads both tables from one snapshot, so
+# a message and the counter update of its trigger are seen together and
+# the difference is exact without locking anything.
+DRIFT_SQL = text(
+    """
+    WITH actual AS (
+        SELECT user_id, sum(messages) AS messages,
+               sum(notifications) AS notifications
+        FROM (
+            SELECT receiver_id AS user_id, count(*) AS messages,
+                   0 AS notifications
+            FROM messages WHERE status IS DISTINCT FROM 'read'
+            GROUP BY receiver_id
+            UNION ALL
+            SELECT user_id, 0, count(*)
+            FROM notifications WHERE read IS NOT TRUE
+            GROUP BY user_id
+            UNION ALL
+            SELECT user_id, 0, 0 FROM unread_counters
+        ) AS unread
+        GROUP BY user_id
+    )
+    SELECT a.user_id,
+           a.messages - coalesce(c.messages, 0) AS messages,
+           a.notifications - coalesce(c.notifications, 0) AS notifications
+    FROM actual AS a
+    LEFT JOIN unread_counters AS c USING (user_id)
+    WHERE (a.messages, a.notifications)
+          IS DISTINCT FROM (c.messages, c.notifications)
+    ORDER BY a.user_id
+    """
+)
+
+# Drift is added like any trigger adjustment, so counter changes committed
+# since the recount are kept; adjust_unread_counter also notifies the mirror
+CORRECT_SQL = text(
+    """
+    SELECT adjust_unread_counter(user_id, messages, notifications)
+    FROM unnest(
+        CAST(:user_ids AS integer[]),
+        CAST(:messages AS integer[]),
+        CAST(:notifications AS integer[])
+    ) AS drift (user_id, messages, notifications)
+    """
+)
+
+
+class UnreadCounterRepositoryImpl(UnreadCounterRepository):
+    def __init__(self, session: AsyncSession, cache: UnreadCounterCache | None = None):
+        self.session = session
+        self.cache = cache
+
+    async def get(self, user_id: int) -> UnreadCounts:
+        """Get unread counters for a user, from Redis when mirrored"""
+        if self.cache is not None:
+            counts = await self.cache.get(user_id)
+            if counts is not None:
+                return counts
+
+        result = await self.session.execute(
+            lambda_stmt(
+                lambda: select(
+                    UnreadCounterModel.messages, UnreadCounterModel.notifications
+                ).where(UnreadCounterModel.user_id == user_id)
+            )
+        )
+        row = result.one_or_none()
+        counts = UnreadCounts(
+            user_id=user_id,
+            messages=row.messages if row else 0,
+            notifications=row.notifications if row else 0,
+        )
+
+        if self.cache is not None:
+            await self.cache.set_many([counts])
+        return counts
+
+    async def find_drift(self) -> list[UnreadCounts]:
+        """Recount from messages and notifications, return actual minus
+        counter for every drifted user; takes no locks"""
+        result = await self.session.execute(DRIFT_SQL)
+        return [
+            UnreadCounts(
+                user_id=row.user_id,
+                messages=row.messages,
+                notifications=row.notifications,
+            )
+            for row in result
+        ]
+
+    async def correct(self, drift: list[UnreadCounts]) -> list[UnreadCounts]:
+        """Add drift to the counters, return the corrected counters"""
+        if not drift:
+            return []
+        user_ids = [counts.user_id for counts in drift]
+        await self.session.execute(
+            CORRECT_SQL,
+            {
+                "user_ids": user_ids,
+                "messages": [counts.messages for counts in drift],
+                "notifications": [counts.notifications for counts in drift],
+            },
+        )
+        result = await self.session.execute(
+            select(
+                UnreadCounterModel.user_id,
+                UnreadCounterModel.messages,
+                UnreadCounterModel.notifications,
+            ).where(UnreadCounterModel.user_id.in_(user_ids))
+        )
+        return [
+            UnreadCounts(
+                user_id=row.user_id,
+                messages=row.messages,
+                notifications=row.notifications,
+            )
+            for row in result
+        ]
@@ -1,50 +1,103 @@
-from sqlalchemy import select
+from enum import Enum
+
+from sqlalchemy import func, insert, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....core.entities.user import User, UserProfile
-from ....core.repositories.user_repository import UserProfileRepository, UserRepository
+from ....core.repositories.user_repository import (
+    UserCredentials,
+    UserProfileRepository,
+    UserRepository,
+)
 from ....core.value_objects.age import Age
 from ....core.value_objects.email import Email
 from ....core.value_objects.fame_rating import FameRating
 from ....core.value_objects.location import Location
+from ....shared.exceptions import DuplicateResourceException
 from ..models.user_model import UserModel, UserProfileModel
 
+# Unique index -> message raised when an insert collides with it
+UNIQUE_CONSTRAINT_MESSAGES = {
+    "ix_users_email": "Email already registered",
+    "ix_users_username": "Username already taken",
+    "ix_users_email_lower": "Email already registered",
+    "ix_users_username_lower": "Username already taken",
+}
+
+# Columns read on login, see UserCredentials
+CREDENTIAL_COLUMNS = tuple(UserCredentials.model_fields)
+
+
+def _violated_constraint(error: IntegrityError) -> str | None:
+    """Name of the constraint behind an IntegrityError, if it can be found"""
+    # asyncpg exposes it on the driver exception wrapped by the DBAPI adapter
+    driver_error = getattr(error.orig, "__cause__", None)
+    name = getattr(driver_error, "constraint_name", None)
+    if name:
+        return name
+
+    message = str(error.orig)
+    for constraint in UNIQUE_CONSTRAINT_MESSAGES:
+        if f'"{constraint}"' in message:
+            return constraint
+    return None
+
 
 class UserRepositoryImpl(UserRepository):
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def create(self, user: User) -> User:
-        """Create a new user"""
-        db_user = UserModel(
-            username=user.username,
-            email=str(user.email),
-            password_hash=user.password_hash,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            status=user.status,
-            email_verified=user.email_verified,
-            last_seen=user.last_seen,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
-
-        self.db.add(db_user)
-        await self.db.commit()
-        await self.db.refresh(db_user)
+        """Create a new user.
+
+        Uniqueness of email and username is left to the unique indexes, so
+        concurrent signups cannot both pass a pre-check; a collision is
+        raised as DuplicateResourceException. The insert is not committed:
+        the caller's unit of work commits it together with the verification
+        token and the queued email.
+        """
+        try:
+            result = await self.db.execute(
+                insert(UserModel)
+                .values(
+                    username=user.username,
+                    email=str(user.email),
+                    password_hash=user.password_hash,
+                    first_name=user.first_name,
+                    last_name=user.last_name,
+                    status=user.status,
+                    email_verified=user.email_verified,
+                    last_seen=user.last_seen,
+                    created_at=user.created_at,
+                    updated_at=user.updated_at,
+                )
+                .returning(UserModel)
+            )
+            db_user = result.scalar_one()
+        except IntegrityError as e:
+            message = UNIQUE_CONSTRAINT_MESSAGES.get(_violated_constraint(e))
+            if message is None:
+                raise
+            raise DuplicateResourceException(message) from None
 
         return self._to_entity(db_user)
 
+    # Hot lookups use lambda statements: the select() is built and analysed
+    # once, later calls only extract the closure values as bound parameters
+
     async def get_by_id(self, user_id: int) -> User | None:
         """Get user by ID"""
-        result = await self.db.execute(select(UserModel).where(UserModel.id == user_id))
+        result = await self.db.execute(
+            lambda_stmt(lambda: select(UserModel).where(UserModel.id == user_id))
+        )
         db_user = result.scalar_one_or_none()
         return self._to_entity(db_user) if db_user else None
 
     async def get_by_email(self, email: str) -> User | None:
         """Get user by email"""
         result = await self.db.execute(
-            select(UserModel).where(UserModel.email == email)
+            lambda_stmt(lambda: select(UserModel).where(UserModel.email == email))
         )
         db_user = result.scalar_one_or_none()
         return self._to_entity(db_user) if db_user else None
@@ -52,34 +105,85 @@ class UserRepositoryImpl(UserRepository):
     async def get_by_username(self, username: str) -> User | None:
         """Get user by username"""
         result = await self.db.execute(
-            select(UserModel).where(UserModel.username == username)
+            lambda_stmt(
+                lambda: select(UserModel).where(UserModel.username == username)
+            )
         )
         db_user = result.scalar_one_or_none()
         return self._to_entity(db_user) if db_user else None
 
+    async def get_credentials(self, identifier: str) -> UserCredentials | None:
+        """Get login columns by email or username, ignoring case.
+
+        Served by the unique lower(email) / lower(username) indexes, so at
+        most one account matches.
+        """
+        column = UserModel.email if "@" in identifier else UserModel.username
+        result = await self.db.execute(
+            select(*(getattr(UserModel, name) for name in CREDENTIAL_COLUMNS)).where(
+                func.lower(column) == identifier.lower()
+            )
+        )
+        row = result.first()
+        return UserCredentials.model_construct(**row._mapping) if row else None
+
     async def update(self, user: User) -> User:
-        """Update user"""
-        result = await self.db.execute(select(UserModel).where(UserModel.id == user.id))
-        db_user = result.scalar_one_or_none()
+        """Update user, writing only the changed columns"""
+        model_data = self._to_model_data(user)
+        values = {
+            field: model_data[field]
+            for field in user.changed_fields
+            if field in model_data
+        }
+
+        if values:
+            # updated_at is set by the column's onupdate; return what was stored
+            updated_at = await self.db.scalar(
+                update(UserModel)
+                .where(UserModel.id == user.id)
+                .values(**values)
+                .returning(UserModel.updated_at)
+            )
+            if updated_at is None:
+                raise ValueError(f"User with ID {user.id} not found")
 
-        if not db_user:
-            raise ValueError(f"User with ID {user.id} not found")
+            await self.db.commit()
+            user.updated_at = updated_at
 
-        # Update fields
-        db_user.username = user.username
-        db_user.email = str(user.email)
-        db_user.password_hash = user.password_hash
-        db_user.first_name = user.first_name
-        db_user.last_name = user.last_name
-        db_user.status = user.status
-        db_user.email_verified = user.email_verified
-        db_user.last_seen = user.last_seen
-        db_user.updated_at = user.updated_at
+        user.mark_clean()
+        return user
 
-        await self.db.commit()
-        await self.db.refresh(db_user)
+    async def touch_last_seen(self, user_id: int) -> None:
+        """Set last_seen to now without loading the user"""
+        await self.db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(last_seen=func.timezone("utc", func.now()))
+        )
 
-        return self._to_entity(db_user)
+    async def mark_profile_completed(self, user_id: int) -> bool:
+        """Flag the user's profile as completed, returns False if already set"""
+        result = await self.db.execute(
+            update(UserModel)
+            .where(
+                UserModel.id == user_id,
+                UserModel.has_completed_profile.isnot(True),
+            )
+            .values(has_completed_profile=True)
+        )
+        return result.rowcount > 0
+
+    async def mark_profile_incomplete(self, user_id: int) -> bool:
+        """Clear the profile completed flag, returns False if already clear"""
+        result = await self.db.execute(
+            update(UserModel)
+            .where(
+                UserModel.id == user_id,
+                UserModel.has_completed_profile.is_(True),
+            )
+            .values(has_completed_profile=False)
+        )
+        return result.rowcount > 0
 
     async def delete(self, user_id: int) -> bool:
         """Delete user"""
@@ -113,17 +217,37 @@ class UserRepositoryImpl(UserRepository):
         )
         return result.scalar_one_or_none() is not None
 
+    def _to_model_data(self, user: User) -> dict:
+        """Convert domain entity to updatable column values"""
+        status = user.status
+        return {
+            "username": user.username,
+            "email": str(user.email),
+            "password_hash": user.password_hash,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "status": status.value if isinstance(status, Enum) else status,
+            "email_verified": user.email_verified,
+            "has_completed_profile": user.has_completed_profile,
+            "last_seen": user.last_seen,
+            "updated_at": user.updated_at,
+        }
+
     def _to_entity(self, db_user: UserModel) -> User:
-        """Convert database model to domain entity"""
-        return User(
+        """Convert database model to domain entity.
+
+        Rows were validated on the way in, so validation is skipped here.
+        """
+        return User.trusted(
             id=db_user.id,
             username=db_user.username,
-            email=Email(db_user.email),
+            email=Email.trusted(db_user.email),
             password_hash=db_user.password_hash,
             first_name=db_user.first_name,
             last_name=db_user.last_name,
             status=db_user.status,
             email_verified=db_user.email_verified,
+            has_completed_profile=bool(db_user.has_completed_profile),
             last_seen=db_user.last_seen,
             created_at=db_user.created_at,
             updated_at=db_user.updated_at,
@@ -274,22 +398,22 @@ class UserProfileRepositoryImpl(UserProfileRepository):
         """Convert database model to domain entity"""
         location = None
         if db_profile.latitude and db_profile.longitude:
-            location = Location(
+            location = Location.trusted(
                 latitude=db_profile.latitude,
                 longitude=db_profile.longitude,
                 city=db_profile.city,
                 country=db_profile.country,
             )
 
-        return UserProfile(
+        return UserProfile.trusted(
             id=db_profile.id,
             user_id=db_profile.user_id,
-            age=Age(db_profile.age),
+            age=Age.trusted(db_profile.age),
             gender=db_profile.gender,
             sexual_preference=db_profile.sexual_preference,
             biography=db_profile.biography,
             location=location,
-            fame_rating=FameRating(db_profile.fame_rating),
+            fame_rating=FameRating.trusted(db_profile.fame_rating),
             interests=db_profile.interests or [],
             pictures=db_profile.pictures or [],
             profile_completed=db_profile.profile_completed,
@@ -32,8 +32,10 @@ class VerificationTokenRepositoryImpl(VerificationTokenRepository):
             created_at=token.created_at,
         )
 
+        # Flush only: the caller's unit of work commits the token together
+        # with the user and the queued email
         self.db.add(db_token)
-        await self.db.commit()
+        await self.db.flush()
         await self.db.refresh(db_token)
 
         return self._to_entity(db_token)
@@ -1,16 +1,62 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
-from ...config.settings import get_settings
+from ...config.settings import Settings, get_settings
+from .pool_metrics import PoolMetrics, instrumented_pool_class, pool_metrics
+from .query_logging import install_slow_query_log
 
 settings = get_settings()
 
+
+def engine_options(
+    settings: Settings, url: str, metrics: PoolMetrics = pool_metrics
+) -> dict:
+    """Pool and driver options for create_async_engine"""
+    options = {
+        "poolclass": instrumented_pool_class(metrics),
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "query_cache_size": settings.DATABASE_QUERY_CACHE_SIZE,
+    }
+
+    if url.startswith("postgresql+asyncpg"):
+        # asyncpg keeps its own per-connection statement cache underneath
+        # SQLAlchemy's prepared statement cache; size both to hold every
+        # hot query so each is prepared once per connection
+        options["connect_args"] = {
+            "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+        }
+
+    return options
+
+
+def create_engine(url: str, metrics: PoolMetrics = pool_metrics) -> AsyncEngine:
+    """Create an instrumented async engine"""
+    new_engine = create_async_engine(
+        url,
+        echo=settings.DATABASE_ECHO,
+        future=True,
+        **engine_options(settings, url, metrics),
+    )
+    metrics.attach(new_engine)
+    if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+        install_slow_query_log(
+            new_engine, settings.SLOW_QUERY_THRESHOLD_MS, settings.SLOW_QUERY_EXPLAIN
+        )
+    return new_engine
+
+
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-)
+engine = create_engine(settings.DATABASE_URL)
 
 # Create async session factory
 async_session_factory = async_sessionmaker(
@@ -19,6 +65,19 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Optional read replica for read-only units of work
+replica_pool_metrics = PoolMetrics()
+replica_engine: AsyncEngine | None = None
+replica_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_engine(settings.DATABASE_REPLICA_URL, replica_pool_metrics)
+    replica_session_factory = async_sessionmaker(
+        bind=replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
 
 # Base class for all models
 class Base(DeclarativeBase):
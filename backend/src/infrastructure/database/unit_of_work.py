@@ -1,39 +1,120 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ...core.repositories.unit_of_work import AbstractUnitOfWork
-from ..external.email.smtp_email_service import SMTPEmailService
+from ...core.services.email_service import EmailService
+from ..cache.unread_counter_cache import get_unread_counter_cache
+from ..external.email.smtp_email_service import get_email_service
+from .replica import read_your_writes
+from .repositories.email_outbox_repository_impl import EmailOutboxRepositoryImpl
+from .repositories.notification_digest_repository_impl import (
+    NotificationDigestRepositoryImpl,
+)
 from .repositories.profile_repository_impl import ProfileRepositoryImpl
+from .repositories.unread_counter_repository_impl import (
+    UnreadCounterRepositoryImpl,
+)
 from .repositories.user_repository_impl import UserRepositoryImpl
 from .repositories.verification_token_repository_impl import (
     VerificationTokenRepositoryImpl,
 )
 
+RepositoryT = TypeVar("RepositoryT")
+
 
 class SqlAlchemyUnitOfWork(AbstractUnitOfWork):
     """SQLAlchemy implementation of Unit of Work"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        replica_session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
         self.session = session
+        self.replica_session_factory = replica_session_factory
+        self._replica_session: AsyncSession | None = None
+        self._repositories: dict[type, object] = {}
+
+    def _use_replica(self) -> bool:
+        return (
+            self._read_only
+            and self.replica_session_factory is not None
+            and not read_your_writes.recently_wrote(self.user_id)
+        )
+
+    @property
+    def _active_session(self) -> AsyncSession:
+        return self._replica_session or self.session
+
+    def _repository(self, repository_class: type[RepositoryT]) -> RepositoryT:
+        """Build a repository on first use and reuse it for this unit of work"""
+        repository = self._repositories.get(repository_class)
+        if repository is None:
+            repository = repository_class(self._active_session)  # type: ignore[call-arg]
+            self._repositories[repository_class] = repository
+        return repository  # type: ignore[return-value]
+
+    @property
+    def users(self) -> UserRepositoryImpl:
+        return self._repository(UserRepositoryImpl)
+
+    @property
+    def verification_tokens(self) -> VerificationTokenRepositoryImpl:
+        return self._repository(VerificationTokenRepositoryImpl)
+
+    @property
+    def profiles(self) -> ProfileRepositoryImpl:
+        return self._repository(ProfileRepositoryImpl)
+
+    @property
+    def unread_counters(self) -> UnreadCounterRepositoryImpl:
+        repository = self._repositories.get(UnreadCounterRepositoryImpl)
+        if repository is None:
+            repository = UnreadCounterRepositoryImpl(
+                self._active_session, get_unread_counter_cache()
+            )
+            self._repositories[UnreadCounterRepositoryImpl] = repository
+        return repository
+
+    @property
+    def email_outbox(self) -> EmailOutboxRepositoryImpl:
+        return self._repository(EmailOutboxRepositoryImpl)
+
+    @property
+    def notification_digests(self) -> NotificationDigestRepositoryImpl:
+        return self._repository(NotificationDigestRepositoryImpl)
+
+    # Add other repositories here when we add them
+    # @property
+    # def matchings(self) -> MatchingRepositoryImpl:
+    #     return self._repository(MatchingRepositoryImpl)
+
+    @property
+    def email_service(self) -> EmailService:
+        return get_email_service()
 
     async def __aenter__(self) -> "SqlAlchemyUnitOfWork":
-        self.users = UserRepositoryImpl(self.session)
-        self.verification_tokens = VerificationTokenRepositoryImpl(self.session)
-        self.profiles = ProfileRepositoryImpl(self.session)
-        self.email_service = SMTPEmailService()
-        # Initialize other repositories here when we add them
-        # self.matchings = MatchingRepositoryImpl(self.session)
-        # self.chats = ChatRepositoryImpl(self.session)
+        if self._use_replica():
+            self._replica_session = self.replica_session_factory()
+
+        # Repositories are bound to the session chosen for this unit of work
+        self._repositories.clear()
         await super().__aenter__()  # type: ignore[misc]
         return self
 
     async def __aexit__(self, *args: object) -> None:
         await super().__aexit__(*args)
-        await self.session.close()
+        await self._active_session.close()
+        self._replica_session = None
+        self._read_only = False
 
     async def commit(self) -> None:
         """Commit the current transaction"""
-        await self.session.commit()
+        await self._active_session.commit()
+        if not self._read_only and self.user_id is not None:
+            read_your_writes.record_write(self.user_id)
 
     async def rollback(self) -> None:
         """Rollback the current transaction"""
-        await self.session.rollback()
+        await self._active_session.rollback()
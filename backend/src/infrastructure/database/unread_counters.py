@@ -0,0 +1,92 @@
+"""Background jobs keeping unread badge counters exact and mirrored.
+
+The counters themselves live in unread_counters and are maintained by
+triggers on messages and notifications. Each change is announced with
+NOTIFY once its transaction commits; the mirror task LISTENs on a
+dedicated asyncpg connection and copies the changed rows into Redis.
+The reconciliation task periodically recounts from the source tables
+and fixes any drift.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ...config.settings import get_settings
+from ...core.repositories.unread_counter_repository import UnreadCounts
+from ..cache.unread_counter_cache import UnreadCounterCache
+from .listener import listen_for_ids
+from .models.chat_model import UnreadCounterModel
+from .repositories.unread_counter_repository_impl import (
+    UNREAD_COUNTERS_CHANNEL,
+    UnreadCounterRepositoryImpl,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _load(engine: AsyncEngine, user_ids: set[int]) -> list[UnreadCounts]:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(
+                UnreadCounterModel.user_id,
+                UnreadCounterModel.messages,
+                UnreadCounterModel.notifications,
+            ).where(UnreadCounterModel.user_id.in_(user_ids))
+        )
+        return [
+            UnreadCounts(
+                user_id=row.user_id,
+                messages=row.messages,
+                notifications=row.notifications,
+            )
+            for row in result
+        ]
+
+
+async def mirror_unread_counters(
+    engine: AsyncEngine, cache: UnreadCounterCache
+) -> None:
+    """Copy counters changed by committed transactions into Redis.
+
+    Entries missed while disconnected expire with the cache TTL.
+    """
+
+    async def refresh(user_ids: set[int]) -> None:
+        await cache.set_many(await _load(engine, user_ids))
+
+    await listen_for_ids(engine, UNREAD_COUNTERS_CHANNEL, refresh)
+
+
+async def reconcile_unread_counters(engine: AsyncEngine) -> list[UnreadCounts]:
+    """Recount without locks, then fix drifted counters in small batches,
+    each its own short transaction, so counter triggers are never held up
+    for long"""
+    async with AsyncSession(engine) as session:
+        drift = await UnreadCounterRepositoryImpl(session).find_drift()
+
+    batch_size = get_settings().UNREAD_COUNTERS_RECONCILE_BATCH_SIZE
+    corrected: list[UnreadCounts] = []
+    for start in range(0, len(drift), batch_size):
+        async with AsyncSession(engine) as session:
+            corrected += await UnreadCounterRepositoryImpl(session).correct(
+                drift[start : start + batch_size]
+            )
+            await session.commit()
+    return corrected
+
+
+async def unread_counter_reconciliation_loop(engine: AsyncEngine) -> None:
+    """Recount unread counters on a fixed interval"""
+    interval = get_settings().UNREAD_COUNTERS_RECONCILE_INTERVAL_SECONDS
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            corrected = await reconcile_unread_counters(engine)
+        except Exception:
+            logger.exception("Unread counter reconciliation failed")
+            continue
+        if corrected:
+            logger.warning("Corrected %d drifted unread counters", len(corrected))
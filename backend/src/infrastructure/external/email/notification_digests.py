@@ -0,0 +1,99 @@
+"""Background flushing of notification digests into the email outbox.
+
+Notifications buffered by queue_notification_email wait until the oldest
+one of a user is NOTIFICATION_DIGEST_WINDOW_MINUTES old. The flusher then
+removes all of that user's entries and enqueues one outbox email in the
+same transaction, so a digest is neither lost nor sent twice; delivery
+and retries are the outbox dispatcher's job.
+"""
+
+import asyncio
+import logging
+from datetime import timedelta
+from itertools import groupby
+from operator import attrgetter
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ....config.settings import get_settings
+from ....core.entities.email_outbox import EmailKind, OutboxEmail
+from ....core.entities.notification_digest import DigestEntry
+from ...database.repositories.email_outbox_repository_impl import (
+    EmailOutboxRepositoryImpl,
+)
+from ...database.repositories.notification_digest_repository_impl import (
+    NotificationDigestRepositoryImpl,
+)
+
+logger = logging.getLogger(__name__)
+
+_MAX_FLUSH_INTERVAL_SECONDS = 60
+
+
+def digest_email(entries: list[DigestEntry]) -> OutboxEmail:
+    """The email for one user's buffered notifications, oldest first"""
+    latest = entries[-1]
+    if len(entries) == 1:
+        # A digest of one reads better as the plain notification
+        return OutboxEmail(
+            kind=EmailKind.NOTIFICATION,
+            payload={
+                "email": latest.email,
+                "subject": latest.title,
+                "message": latest.content,
+            },
+        )
+    return OutboxEmail(
+        kind=EmailKind.NOTIFICATION_DIGEST,
+        payload={
+            "email": latest.email,
+            "username": latest.username,
+            "notifications": [
+                {"type": entry.type, "title": entry.title, "content": entry.content}
+                for entry in entries
+            ],
+        },
+    )
+
+
+async def flush_due_digests(engine: AsyncEngine) -> int:
+    """Enqueue one batch of due digests, return how many users were flushed"""
+    settings = get_settings()
+    window = timedelta(minutes=settings.NOTIFICATION_DIGEST_WINDOW_MINUTES)
+    async with AsyncSession(engine) as session:
+        entries = await NotificationDigestRepositoryImpl(session).take_due(
+            window, settings.NOTIFICATION_DIGEST_BATCH_SIZE
+        )
+        outbox = EmailOutboxRepositoryImpl(session)
+        users = 0
+        for _, user_entries in groupby(entries, key=attrgetter("user_id")):
+            await outbox.enqueue(digest_email(list(user_entries)))
+            users += 1
+        await session.commit()
+    if users:
+        logger.info(
+            "Flushed %d notification digests (%d notifications)", users, len(entries)
+        )
+    return users
+
+
+async def notification_digest_loop(engine: AsyncEngine) -> None:
+    """Flush digests as their windows close"""
+    settings = get_settings()
+    # A digest goes out at most this late after its window closes
+    window_seconds = settings.NOTIFICATION_DIGEST_WINDOW_MINUTES * 60
+    interval = min(window_seconds, _MAX_FLUSH_INTERVAL_SECONDS)
+    while True:
+        try:
+            flushed = await flush_due_digests(engine)
+        except Exception:
+            logger.exception("Notification digest flush failed")
+            flushed = 0
+        # A full batch means more users may be due right away
+        if flushed >= settings.NOTIFICATION_DIGEST_BATCH_SIZE:
+            continue
+        # With digests disabled nothing new is buffered; once the entries
+        # left from before are flushed there is nothing to wait for
+        if window_seconds <= 0:
+            return
+        await asyncio.sleep(interval)
@@ -0,0 +1,166 @@
+"""Background delivery of the transactional email outbox.
+
+Use cases never talk to the mail server: they add an OutboxEmail in the
+same transaction as the change that causes it (signup, password reset),
+so an email exists if and only if that change committed, and the HTTP
+response does not wait for SMTP.
+
+The dispatcher claims due rows with FOR UPDATE SKIP LOCKED, so several
+workers can run side by side without sending an email twice, and commits
+the claim: claimed rows are leased for EMAIL_OUTBOX_LEASE_SECONDS rather
+than locked, so no row lock or database connection is held while SMTP
+is slow. Sends still running after half the lease are abandoned, and the
+outcome is recorded in a second transaction, only for rows no other
+dispatcher has claimed since. Failed attempts are retried with
+exponential backoff until EMAIL_OUTBOX_MAX_ATTEMPTS. An
+insert trigger NOTIFYs the email_outbox channel to wake the dispatcher
+right away; polling covers missed notifications and due retries.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ....config.settings import get_settings
+from ....core.entities.email_outbox import EmailKind, OutboxEmail
+from ....core.services.email_service import EmailService
+from ...database.listener import listen_for_ids
+from ...database.repositories.email_outbox_repository_impl import (
+    EMAIL_OUTBOX_CHANNEL,
+    EmailOutboxRepositoryImpl,
+)
+
+logger = logging.getLogger(__name__)
+
+_SENDERS = {
+    EmailKind.VERIFICATION.value: "send_verification_email",
+    EmailKind.PASSWORD_RESET.value: "send_password_reset_email",
+    EmailKind.NOTIFICATION.value: "send_notification_email",
+    EmailKind.NOTIFICATION_DIGEST.value: "send_notification_digest_email",
+}
+
+_MAX_RETRY_DELAY = timedelta(hours=1)
+_PRUNE_INTERVAL_SECONDS = 3600
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff after the given number of failed attempts"""
+    base = get_settings().EMAIL_OUTBOX_RETRY_BASE_SECONDS
+    return min(timedelta(seconds=base * 2 ** (attempts - 1)), _MAX_RETRY_DELAY)
+
+
+async def _deliver(
+    email_service: EmailService, email: OutboxEmail, deadline: float
+) -> str | None:
+    """Send one email before the event loop time deadline, return the error
+    on failure"""
+    sender = getattr(email_service, _SENDERS[email.kind])
+    try:
+        async with asyncio.timeout_at(deadline):
+            sent = await sender(**email.payload)
+    except TimeoutError:
+        return "Not sent before the claim deadline"
+    except Exception as e:
+        return repr(e)
+    return None if sent else "Email service reported a failed delivery"
+
+
+async def dispatch_batch(engine: AsyncEngine, email_service: EmailService) -> int:
+    """Send one batch of due emails, return how many were claimed"""
+    settings = get_settings()
+    lease = settings.EMAIL_OUTBOX_LEASE_SECONDS
+    async with AsyncSession(engine) as session:
+        emails = await EmailOutboxRepositoryImpl(session).claim_batch(
+            settings.EMAIL_OUTBOX_BATCH_SIZE, timedelta(seconds=lease)
+        )
+        await session.commit()
+    if not emails:
+        return 0
+
+    # Outside any transaction; the SMTP pool bounds how many of these are
+    # on the wire at once. Half the lease leaves ample time to record the
+    # outcomes before another dispatcher may claim the same rows.
+    deadline = asyncio.get_running_loop().time() + lease / 2
+    errors = await asyncio.gather(
+        *(_deliver(email_service, email, deadline) for email in emails)
+    )
+
+    async with AsyncSession(engine) as session:
+        outbox = EmailOutboxRepositoryImpl(session)
+        sent = [email for email, error in zip(emails, errors) if error is None]
+        if await outbox.mark_sent(sent) < len(sent):
+            logger.warning("Outbox claims expired before sent emails were recorded")
+        for email, error in zip(emails, errors):
+            if error is None:
+                continue
+            attempts = email.attempts  # counted when claimed
+            retry_in = None
+            if attempts < settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                retry_in = retry_delay(attempts)
+            logger.warning(
+                "Outbox email %s failed (attempt %d, %s): %s",
+                email.id,
+                attempts,
+                f"retry in {retry_in}" if retry_in else "giving up",
+                error,
+            )
+            if not await outbox.mark_failed(email, error, retry_in):
+                logger.warning("Outbox email %s was claimed again meanwhile", email.id)
+
+        await session.commit()
+    return len(emails)
+
+
+async def prune_sent_emails(engine: AsyncEngine) -> int:
+    retention = timedelta(days=get_settings().EMAIL_OUTBOX_RETENTION_DAYS)
+    async with AsyncSession(engine) as session:
+        deleted = await EmailOutboxRepositoryImpl(session).delete_sent_older_than(
+            retention
+        )
+        await session.commit()
+    return deleted
+
+
+async def email_outbox_dispatch_loop(
+    engine: AsyncEngine, email_service: EmailService
+) -> None:
+    """Deliver outbox emails as they are committed"""
+    settings = get_settings()
+    wake = asyncio.Event()
+
+    async def on_insert(email_ids: set[int]) -> None:
+        wake.set()
+
+    listener = asyncio.create_task(
+        listen_for_ids(engine, EMAIL_OUTBOX_CHANNEL, on_insert)
+    )
+    last_prune = 0.0
+    try:
+        while True:
+            wake.clear()
+            try:
+                claimed = await dispatch_batch(engine, email_service)
+            except Exception:
+                logger.exception("Email outbox dispatch failed")
+                claimed = 0
+            # A full batch means more may be due right away
+            if claimed >= settings.EMAIL_OUTBOX_BATCH_SIZE:
+                continue
+
+            if time.monotonic() - last_prune > _PRUNE_INTERVAL_SECONDS:
+                last_prune = time.monotonic()
+                try:
+                    await prune_sent_emails(engine)
+                except Exception:
+                    logger.exception("Email outbox pruning failed")
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    wake.wait(), settings.EMAIL_OUTBOX_POLL_INTERVAL_SECONDS
+                )
+    finally:
+        listener.cancel()
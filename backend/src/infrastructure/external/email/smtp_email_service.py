@@ -1,10 +1,41 @@
-import smtplib
-import ssl
+from email.message import Message
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from email.policy import compat32
+from functools import lru_cache
 
 from ....config.settings import get_settings
 from ....core.services.email_service import EmailService
+from .smtp_pool import SMTPConnectionPool
+from .templates import EmailTemplates, RenderedEmail
+
+# The legacy policy serializes several times faster than email.policy.SMTP
+_SMTP_COMPAT = compat32.clone(linesep="\r\n")
+
+
+def _mime_entity(text_body: str, html_body: str) -> bytes:
+    """multipart/alternative body of a message, serialized with its
+    Content-Type and MIME-Version headers"""
+    entity = MIMEMultipart("alternative")
+    entity.attach(MIMEText(text_body, "plain"))
+    entity.attach(MIMEText(html_body, "html"))
+    return entity.as_bytes(policy=_SMTP_COMPAT)
+
+
+# Bodies shared by many recipients are encoded and serialized only once.
+# Only for content without secrets: verification and reset links are
+# unique anyway and should not linger in memory.
+_cached_mime_entity = lru_cache(maxsize=256)(_mime_entity)
+
+
+def _recipient_headers(sender: str, to_email: str, subject: str) -> bytes:
+    """Per-recipient headers, to be followed by a MIME entity"""
+    headers = Message()
+    headers["Subject"] = subject
+    headers["From"] = sender
+    headers["To"] = to_email
+    # Drop the blank line ending the header block; the entity's headers follow
+    return headers.as_bytes(policy=_SMTP_COMPAT)[:-2]
 
 
 class SMTPEmailService(EmailService):
@@ -12,6 +43,38 @@ class SMTPEmailService(EmailService):
 
     def __init__(self):
         self.settings = get_settings()
+        # Compiled once here, at startup, and reused for every email
+        self.templates = EmailTemplates()
+        self._pool: SMTPConnectionPool | None = None
+
+    @property
+    def pool(self) -> SMTPConnectionPool:
+        """Connections to the configured server, opened on first send"""
+        if self._pool is None:
+            settings = self.settings
+            self._pool = SMTPConnectionPool(
+                hostname=settings.SMTP_HOST,
+                port=settings.SMTP_PORT,
+                username=settings.SMTP_USER,
+                password=settings.SMTP_PASSWORD,
+                use_tls=settings.SMTP_SSL,
+                # No STARTTLS for MailHog (port 1025)
+                start_tls=(
+                    settings.SMTP_TLS
+                    and not settings.SMTP_SSL
+                    and settings.SMTP_PORT != 1025
+                ),
+                size=settings.SMTP_POOL_SIZE,
+                health_check_after=settings.SMTP_POOL_HEALTH_CHECK_SECONDS,
+                max_messages_per_connection=settings.SMTP_POOL_MAX_MESSAGES,
+                timeout=settings.SMTP_TIMEOUT_SECONDS,
+            )
+        return self._pool
+
+    async def close(self) -> None:
+        """Close pooled SMTP connections"""
+        if self._pool is not None:
+            await self._pool.close()
 
     async def send_verification_email(
         self, email: str, username: str, token: str
@@ -23,38 +86,11 @@ class SMTPEmailService(EmailService):
         verification_url = (
             f"http://localhost:5174/verify-email?token={token}&email={email}"
         )
+        rendered = self.templates.render(
+            "verification", username=username, verification_url=verification_url
+        )
 
-        html_body = f"""
-        <html>
-        <body>
-            <h2>Welcome to Matcha, {username}!</h2>
-            <p>Thank you for registering with Matcha. Please verify your email address by clicking the link below:</p>
-            <p><a href="{verification_url}" style="background-color: #4CAF50; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Verify Email</a></p>
-            <p>If the button doesn't work, copy and paste this link into your browser:</p>
-            <p>{verification_url}</p>
-            <p>This link will expire in 24 hours.</p>
-            <p>If you didn't create an account with Matcha, please ignore this email.</p>
-            <br>
-            <p>Best regards,<br>The Matcha Team</p>
-        </body>
-        </html>
-        """
-
-        text_body = f"""
-        Welcome to Matcha, {username}!
-
-        Thank you for registering with Matcha. Please verify your email address by visiting:
-        {verification_url}
-
-        This link will expire in 24 hours.
-
-        If you didn't create an account with Matcha, please ignore this email.
-
-        Best regards,
-        The Matcha Team
-        """
-
-        return await self._send_email(email, subject, text_body, html_body)
+        return await self._send_email(email, subject, rendered)
 
     async def send_password_reset_email(
         self, email: str, username: str, token: str
@@ -63,107 +99,68 @@ class SMTPEmailService(EmailService):
         subject = "Reset Your Password - Matcha"
 
         reset_url = f"http://localhost:5174/reset-password?token={token}&email={email}"
+        rendered = self.templates.render(
+            "password_reset", username=username, reset_url=reset_url
+        )
 
-        html_body = f"""
-        <html>
-        <body>
-            <h2>Password Reset Request</h2>
-            <p>Hi {username},</p>
-            <p>We received a request to reset your password for your Matcha account.</p>
-            <p><a href="{reset_url}" style="background-color: #ff6b6b; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">Reset Password</a></p>
-            <p>If the button doesn't work, copy and paste this link into your browser:</p>
-            <p>{reset_url}</p>
-            <p>This link will expire in 1 hour.</p>
-            <p>If you didn't request a password reset, please ignore this email.</p>
-            <br>
-            <p>Best regards,<br>The Matcha Team</p>
-        </body>
-        </html>
-        """
-
-        text_body = f"""
-        Password Reset Request
-
-        Hi {username},
-
-        We received a request to reset your password for your Matcha account.
-
-        Please visit: {reset_url}
-
-        This link will expire in 1 hour.
-
-        If you didn't request a password reset, please ignore this email.
-
-        Best regards,
-        The Matcha Team
-        """
-
-        return await self._send_email(email, subject, text_body, html_body)
+        return await self._send_email(email, subject, rendered)
 
     async def send_notification_email(
         self, email: str, subject: str, message: str
     ) -> bool:
         """Send a general notification email"""
-        html_body = f"""
-        <html>
-        <body>
-            <h2>Matcha Notification</h2>
-            <p>{message}</p>
-            <br>
-            <p>Best regards,<br>The Matcha Team</p>
-        </body>
-        </html>
-        """
+        rendered = self.templates.render("notification", message=message)
 
-        return await self._send_email(email, subject, message, html_body)
+        # The same notification text often goes out to many users
+        return await self._send_email(email, subject, rendered, cache_body=True)
+
+    async def send_notification_digest_email(
+        self, email: str, username: str, notifications: list[dict[str, str]]
+    ) -> bool:
+        """Send several notifications as one email"""
+        subject = f"You have {len(notifications)} new notifications - Matcha"
+        rendered = self.templates.render(
+            "notification_digest", username=username, notifications=notifications
+        )
+
+        return await self._send_email(email, subject, rendered)
 
     async def _send_email(
-        self, to_email: str, subject: str, text_body: str, html_body: str
+        self,
+        to_email: str,
+        subject: str,
+        rendered: RenderedEmail,
+        cache_body: bool = False,
     ) -> bool:
-        """Send email using SMTP"""
-        try:
-            # Check if SMTP is configured (MailHog or real SMTP)
-            if not self.settings.SMTP_HOST or self.settings.SMTP_HOST.strip() == "":
-                # Fallback to console logging if no SMTP configured
-                print("\n📧 EMAIL WOULD BE SENT (NO SMTP):")
-                print(f"To: {to_email}")
-                print(f"Subject: {subject}")
-                print(f"Body: {text_body}")
-                print(f"HTML Body: {html_body}")
-                print("=" * 50)
-                return True
-
-            # For production, use actual SMTP
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = self.settings.EMAILS_FROM_EMAIL
-            msg["To"] = to_email
-
-            # Create the plain-text and HTML version of your message
-            text_part = MIMEText(text_body, "plain")
-            html_part = MIMEText(html_body, "html")
-
-            # Add HTML/plain-text parts to MIMEMultipart message
-            msg.attach(text_part)
-            msg.attach(html_part)
-
-            # Create connection with server and send email
-            with smtplib.SMTP(
-                self.settings.SMTP_HOST, self.settings.SMTP_PORT
-            ) as server:
-                # Use TLS only if not MailHog (port 1025 = MailHog)
-                if self.settings.SMTP_PORT != 1025:
-                    context = ssl.create_default_context()
-                    server.starttls(context=context)
-
-                # Login only if credentials provided
-                if self.settings.SMTP_USER and self.settings.SMTP_PASSWORD:
-                    server.login(self.settings.SMTP_USER, self.settings.SMTP_PASSWORD)
-
-                server.send_message(msg)
+        """Send email using SMTP.
 
+        SMTP errors propagate, so the outbox dispatcher records the actual
+        cause of a failed delivery.
+        """
+        # Check if SMTP is configured (MailHog or real SMTP)
+        if not self.settings.SMTP_HOST or self.settings.SMTP_HOST.strip() == "":
+            # Fallback to console logging if no SMTP configured
+            print("\n📧 EMAIL WOULD BE SENT (NO SMTP):")
+            print(f"To: {to_email}")
+            print(f"Subject: {subject}")
+            print(f"Body: {rendered.text}")
+            print(f"HTML Body: {rendered.html}")
+            print("=" * 50)
             return True
 
-        except Exception as e:
-            print(f"Failed to send email: {e}")
-            return False
+        entity = _cached_mime_entity if cache_body else _mime_entity
+        sender = self.settings.EMAILS_FROM_EMAIL
+        message = _recipient_headers(sender, to_email, subject) + entity(
+            rendered.text, rendered.html
+        )
+
+        # Send over a pooled, already authenticated connection
+        await self.pool.sendmail(sender, [to_email], message)
+
+        return True
+
+
+@lru_cache
+def get_email_service() -> SMTPEmailService:
+    """Process-wide email service; it holds no per-request state"""
+    return SMTPEmailService()
@@ -0,0 +1,167 @@
+"""Pool of persistent, authenticated SMTP connections.
+
+Opening an SMTP session costs a TCP handshake, the greeting, EHLO,
+STARTTLS (another handshake) and AUTH before the first message. The pool
+keeps up to `size` sessions open and hands them out one sender at a
+time, so consecutive emails reuse an established session.
+
+A session idle for longer than the health check interval is probed with
+NOOP before reuse, since servers drop idle clients. A session that fails
+a probe or loses its connection is discarded, and the send is retried
+once on a fresh one; a message the server refuses only resets (RSET) the
+session, which stays pooled.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from email.message import Message
+
+import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledSMTP:
+    __slots__ = ("client", "last_used", "messages_sent")
+
+    def __init__(self, client: aiosmtplib.SMTP):
+        self.client = client
+        self.last_used = time.monotonic()
+        self.messages_sent = 0
+
+
+class SMTPConnectionPool:
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        use_tls: bool = False,
+        start_tls: bool = False,
+        size: int = 3,
+        health_check_after: float = 30.0,
+        max_messages_per_connection: int = 100,
+        timeout: float = 30.0,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.start_tls = start_tls
+        self.health_check_after = health_check_after
+        self.max_messages_per_connection = max_messages_per_connection
+        self.timeout = timeout
+
+        self._idle: list[_PooledSMTP] = []
+        self._slots = asyncio.Semaphore(size)
+        # Sessions opened over the pool's lifetime, for metrics and benchmarks
+        self.connections_opened = 0
+
+    async def _connect(self) -> _PooledSMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        if self.username and self.password:
+            await client.login(self.username, self.password)
+        self.connections_opened += 1
+        return _PooledSMTP(client)
+
+    @staticmethod
+    async def _discard(connection: _PooledSMTP) -> None:
+        try:
+            await connection.client.quit()
+        except Exception:
+            connection.client.close()
+
+    @staticmethod
+    async def _reset(connection: _PooledSMTP) -> bool:
+        try:
+            await connection.client.rset()
+        except aiosmtplib.SMTPException:
+            return False
+        return True
+
+    async def _healthy(self, connection: _PooledSMTP) -> bool:
+        if not connection.client.is_connected:
+            return False
+        if time.monotonic() - connection.last_used < self.health_check_after:
+            return True
+        try:
+            await connection.client.noop()
+        except aiosmtplib.SMTPException:
+            return False
+        return True
+
+    async def _checkout(self) -> _PooledSMTP:
+        while self._idle:
+            connection = self._idle.pop()
+            if await self._healthy(connection):
+                return connection
+            await self._discard(connection)
+        return await self._connect()
+
+    def _checkin(self, connection: _PooledSMTP) -> None:
+        connection.last_used = time.monotonic()
+        self._idle.append(connection)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """A connected, authenticated session for the caller's exclusive use"""
+        async with self._slots:
+            connection = await self._checkout()
+            try:
+                yield connection.client
+            except (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused):
+                # The server refused this message; the session itself is fine
+                if await self._reset(connection):
+                    self._checkin(connection)
+                else:
+                    await self._discard(connection)
+                raise
+            except BaseException:
+                await self._discard(connection)
+                raise
+
+            connection.messages_sent += 1
+            if connection.messages_sent >= self.max_messages_per_connection:
+                await self._discard(connection)
+            else:
+                self._checkin(connection)
+
+    async def _with_retry(
+        self, send: Callable[[aiosmtplib.SMTP], Awaitable[object]]
+    ) -> None:
+        try:
+            async with self.connection() as client:
+                await send(client)
+        except (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError):
+            # Dropped by the server between the health check and the send
+            logger.info("SMTP session lost, retrying on a new connection")
+            async with self.connection() as client:
+                await send(client)
+
+    async def send_message(self, message: Message) -> None:
+        await self._with_retry(lambda client: client.send_message(message))
+
+    async def sendmail(self, sender: str, recipients: list[str], data: bytes) -> None:
+        """Send an already serialized message"""
+        await self._with_retry(
+            lambda client: client.sendmail(sender, recipients, data)
+        )
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        await asyncio.gather(
+            *(self._discard(connection) for connection in idle),
+            return_exceptions=True,
+        )
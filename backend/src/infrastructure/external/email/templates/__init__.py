@@ -0,0 +1,49 @@
+"""Email bodies, as Jinja2 templates compiled once per process.
+
+Each email kind has a NAME.txt and a NAME.html template extending the
+shared layouts. EmailTemplates loads and compiles all of them up front
+(the email service builds it at startup), so sending only runs the
+compiled render functions. HTML bodies are autoescaped; text bodies are
+not.
+"""
+
+from dataclasses import dataclass
+
+from jinja2 import Environment, PackageLoader, StrictUndefined, select_autoescape
+
+TEMPLATE_NAMES = (
+    "verification",
+    "password_reset",
+    "notification",
+    "notification_digest",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedEmail:
+    text: str
+    html: str
+
+
+class EmailTemplates:
+    def __init__(self):
+        environment = Environment(
+            loader=PackageLoader(__name__, ""),
+            autoescape=select_autoescape(["html"]),
+            undefined=StrictUndefined,
+            # Templates ship with the code; never stat them for changes
+            auto_reload=False,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        self._templates = {
+            (name, kind): environment.get_template(f"{name}.{kind}")
+            for name in TEMPLATE_NAMES
+            for kind in ("txt", "html")
+        }
+
+    def render(self, name: str, **context) -> RenderedEmail:
+        return RenderedEmail(
+            text=self._templates[name, "txt"].render(context),
+            html=self._templates[name, "html"].render(context),
+        )
@@ -1,11 +1,39 @@
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config.settings import get_settings
-from .infrastructure.database.session import init_db
+from .infrastructure.cache.profile_store import (
+    keep_profile_store_current,
+    profile_store,
+)
+from .infrastructure.cache.unread_counter_cache import get_unread_counter_cache
+from .infrastructure.database.partitioning import partition_maintenance_loop
+from .infrastructure.database.pool_metrics import pool_metrics
+from .infrastructure.database.session import (
+    engine,
+    init_db,
+    replica_engine,
+    replica_pool_metrics,
+)
+from .infrastructure.database.unread_counters import (
+    mirror_unread_counters,
+    unread_counter_reconciliation_loop,
+)
+from .infrastructure.external.email.notification_digests import (
+    notification_digest_loop,
+)
+from .infrastructure.external.email.outbox_dispatcher import (
+    email_outbox_dispatch_loop,
+)
+from .infrastructure.external.email.smtp_email_service import get_email_service
+from .presentation.api.compression import CompressionMiddleware
+from .presentation.api.dependencies import get_current_active_user
+from .presentation.api.responses import ORJSONResponse
 from .presentation.api.v1.auth import router as auth_router
+from .presentation.api.v1.matching import router as matching_router
 from .presentation.api.v1.profile import router as profile_router
 
 settings = get_settings()
@@ -15,9 +43,26 @@ settings = get_settings()
 async def lifespan(app: FastAPI):
     # Startup
     await init_db()
+    background_tasks = [
+        asyncio.create_task(partition_maintenance_loop(engine)),
+        asyncio.create_task(
+            mirror_unread_counters(engine, get_unread_counter_cache())
+        ),
+        asyncio.create_task(unread_counter_reconciliation_loop(engine)),
+        asyncio.create_task(
+            email_outbox_dispatch_loop(engine, get_email_service())
+        ),
+        asyncio.create_task(notification_digest_loop(engine)),
+    ]
+    if settings.PROFILE_STORE_ENABLED:
+        background_tasks.append(
+            asyncio.create_task(keep_profile_store_current(engine, profile_store))
+        )
     yield
     # Shutdown
-    pass
+    for task in background_tasks:
+        task.cancel()
+    await get_email_service().close()
 
 
 app = FastAPI(
@@ -25,6 +70,7 @@ app = FastAPI(
     version=settings.VERSION,
     description=settings.DESCRIPTION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -36,9 +82,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Response compression
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
+
 # Include routers
 app.include_router(auth_router, prefix=settings.API_V1_STR)
 app.include_router(profile_router, prefix=settings.API_V1_STR)
+app.include_router(matching_router, prefix=settings.API_V1_STR)
 
 
 # Health check endpoint
@@ -47,6 +102,16 @@ async def health_check():
     return {"status": "healthy", "version": settings.VERSION}
 
 
+# Connection pool metrics for sizing the pool against real load; they
+# reveal deployment internals, so only authenticated users may read them
+@app.get("/health/db-pool", dependencies=[Depends(get_current_active_user)])
+async def db_pool_metrics():
+    metrics = {"primary": pool_metrics.snapshot(engine)}
+    if replica_engine is not None:
+        metrics["replica"] = replica_pool_metrics.snapshot(replica_engine)
+    return metrics
+
+
 # API routes will be added here
 @app.get("/")
 async def root():
@@ -0,0 +1,175 @@
+"""Compress response bodies with brotli or gzip, as the client accepts.
+
+Listings (search, suggestions, message history) are tens of kilobytes of
+repetitive JSON and shrink several times over. Bodies below the minimum
+size are sent as-is, where the framing overhead and CPU are not worth it,
+as are responses that already carry a Content-Encoding or whose media
+type is compressed already (images, archives).
+
+brotli is optional (pip install brotli); without it only gzip is offered.
+"""
+
+import zlib
+from collections.abc import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Media types whose payload is already compressed
+_COMPRESSED_TYPES = ("image/", "video/", "audio/", "font/woff")
+_COMPRESSED_SUBTYPES = ("zip", "gzip", "x-7z-compressed", "x-bzip2", "pdf")
+
+
+def _accepted_encodings(headers: Headers) -> set[str]:
+    """Encodings listed in Accept-Encoding without q=0"""
+    accepted = set()
+    for part in headers.get("accept-encoding", "").split(","):
+        name, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+
+def _is_compressed_type(content_type: str) -> bool:
+    media_type = content_type.split(";")[0].strip().lower()
+    return media_type.startswith(_COMPRESSED_TYPES) or media_type.endswith(
+        _COMPRESSED_SUBTYPES
+    )
+
+
+class _Gzip:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _Brotli:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class CompressionMiddleware:
+    """ASGI middleware negotiating br (when installed) or gzip per request"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders: dict[str, Callable[[], _Gzip | _Brotli]] = {}
+        # In order of preference
+        if brotli is not None:
+            self.encoders["br"] = lambda: _Brotli(brotli_quality)
+        self.encoders["gzip"] = lambda: _Gzip(gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = _accepted_encodings(Headers(scope=scope))
+        encoding = next((name for name in self.encoders if name in accepted), None)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            send, encoding, self.encoders[encoding], self.minimum_size
+        )
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    """Holds back the response start until the first body chunk decides
+    whether the response is worth compressing"""
+
+    def __init__(
+        self,
+        send: Send,
+        encoding: str,
+        encoder: Callable[[], _Gzip | _Brotli],
+        minimum_size: int,
+    ):
+        self.send = send
+        self.encoding = encoding
+        self.encoder = encoder
+        self.minimum_size = minimum_size
+        self.start: Message | None = None
+        self.compressor: _Gzip | _Brotli | None = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            if "content-encoding" in headers or _is_compressed_type(
+                headers.get("content-type", "")
+            ):
+                self.passthrough = True
+                await self.send(message)
+            else:
+                self.start = message
+            return
+
+        if self.passthrough or message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start is not None:
+            start, self.start = self.start, None
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+
+            self.compressor = self.encoder()
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            del headers["Content-Length"]
+            if not more_body:
+                body = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            await self.send(start)
+
+        # Streaming: flush each chunk so clients see data as it is produced
+        compressor = self.compressor
+        assert compressor is not None  # set when the first chunk was sent
+        chunk = compressor.compress(body)
+        chunk += compressor.flush() if more_body else compressor.finish()
+        await self.send(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body}
+        )
@@ -1,6 +1,6 @@
 from typing import Any
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,10 +9,11 @@ from ...core.repositories.user_repository import UserRepository
 from ...infrastructure.database.repositories.user_repository_impl import (
     UserRepositoryImpl,
 )
-from ...infrastructure.database.session import get_db
+from ...infrastructure.database.session import get_db, replica_session_factory
 from ...infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
 from ...shared.exceptions import AuthenticationException
 from ...shared.security import get_current_user_from_token
+from ..schemas.profile_schemas import ProfileResponse
 
 security = HTTPBearer()
 
@@ -24,7 +25,7 @@ async def get_user_repository(db: AsyncSession = Depends(get_db)) -> UserReposit
 
 async def get_uow(db: AsyncSession = Depends(get_db)) -> AbstractUnitOfWork:
     """Dependency to get Unit of Work"""
-    return SqlAlchemyUnitOfWork(db)
+    return SqlAlchemyUnitOfWork(db, replica_session_factory)
 
 
 async def get_current_user(
@@ -50,6 +51,9 @@ async def get_current_user(
                     detail="User account is inactive",
                 )
 
+            # Attribute this request's writes to the user for read-your-writes
+            uow.user_id = user.id
+
             return {
                 "user_id": user.id,
                 "username": user.username,
@@ -79,3 +83,24 @@ async def get_current_active_user(
             detail="User account is not active",
         )
     return current_user
+
+
+def get_profile_fields(
+    fields: str | None = Query(
+        None,
+        description="Comma-separated profile fields to return (default: all)",
+        examples=["user_id,age,location,pictures"],
+    ),
+) -> frozenset[str] | None:
+    """Dependency parsing a ?fields= sparse fieldset of ProfileResponse"""
+    if fields is None:
+        return None
+
+    requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    unknown = requested - ProfileResponse.model_fields.keys()
+    if not requested or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown profile fields: {', '.join(sorted(unknown)) or fields}",
+        )
+    return requested
@@ -0,0 +1,52 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from ...config.settings import get_settings
+from ...core.value_objects.base import ValueObject
+
+
+def _default(value: Any) -> Any:
+    """Types orjson does not serialize natively"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, ValueObject):
+        return value._serialize()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Used as the app's default response class, so routes returning plain
+    data still go through response_model validation, only the final
+    encoding is faster. datetimes, enums and dataclasses are handled by
+    orjson itself.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default)
+
+
+def validated_response(
+    content: BaseModel | list[BaseModel], status_code: int = 200
+) -> Any:
+    """Return DTOs that are already validated without revalidating them.
+
+    FastAPI validates and re-encodes whatever a route returns against its
+    response_model. DTOs built by our own from_entity constructors have
+    just been validated, so by default they are rendered directly;
+    response_model then only documents the route. With
+    SKIP_RESPONSE_REVALIDATION disabled the content is returned as-is and
+    FastAPI processes it as usual.
+    """
+    if not get_settings().SKIP_RESPONSE_REVALIDATION:
+        return content
+
+    if isinstance(content, list):
+        body = [item.model_dump() for item in content]
+    else:
+        body = content.model_dump()
+    return ORJSONResponse(body, status_code=status_code)
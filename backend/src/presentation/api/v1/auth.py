@@ -1,12 +1,16 @@
+import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 
 from ....application.use_cases.auth.login_user import LoginUserUseCase
 from ....application.use_cases.auth.register_user import RegisterUserUseCase
 from ....application.use_cases.auth.reset_password import ResetPasswordUseCase
 from ....application.use_cases.auth.verify_email import VerifyEmailUseCase
+from ....config.settings import get_settings
 from ....core.repositories.unit_of_work import AbstractUnitOfWork
+from ....infrastructure.database.session import async_session_factory
+from ....infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
 from ....shared.exceptions import (
     AuthenticationException,
     DuplicateResourceException,
@@ -29,9 +33,22 @@ from ...schemas.auth_schemas import (
     VerificationResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
+async def touch_last_seen(user_id: int) -> None:
+    """Bump last_seen on a fresh session, once the login response is sent"""
+    uow = SqlAlchemyUnitOfWork(async_session_factory())
+    try:
+        async with uow:
+            await uow.users.touch_last_seen(user_id)
+            await uow.commit()
+    except Exception:
+        logger.exception("Failed to update last_seen for user %s", user_id)
+
+
 @router.post(
     "/register", response_model=RegisterResponse, status_code=status.HTTP_201_CREATED
 )
@@ -75,12 +92,18 @@ async def register(
 @router.post("/login", response_model=TokenResponse)
 async def login(
     login_data: UserLoginRequest,
+    background_tasks: BackgroundTasks,
     uow: AbstractUnitOfWork = Depends(get_uow),
 ):
     """Login user and return tokens"""
     try:
+        defer_last_seen = get_settings().LOGIN_DEFER_LAST_SEEN
         use_case = LoginUserUseCase(uow)
-        result = await use_case.execute(login_data.dict())
+        result = await use_case.execute(
+            login_data.dict(), update_last_seen=not defer_last_seen
+        )
+        if defer_last_seen:
+            background_tasks.add_task(touch_last_seen, result["user"]["id"])
 
         return TokenResponse(
             access_token=result["access_token"],
@@ -0,0 +1,94 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from ....application.use_cases.matching.browse_profiles import (
+    ProfilePage,
+    SearchProfilesUseCase,
+    SuggestProfilesUseCase,
+)
+from ....core.repositories.unit_of_work import AbstractUnitOfWork
+from ....infrastructure.cache.profile_store import profile_store
+from ....shared.exceptions import NotFoundException, ValidationException
+from ...api.dependencies import get_current_user, get_profile_fields, get_uow
+from ...api.responses import ORJSONResponse, validated_response
+from ...schemas.profile_schemas import (
+    ProfileResponse,
+    ProfileSearchRequest,
+    ProfileSearchResponse,
+)
+
+router = APIRouter(prefix="/matching", tags=["Matching"])
+
+
+def _page_response(page: ProfilePage, fields: frozenset[str] | None):
+    # Projections hold only the requested fields, so they cannot be
+    # validated against ProfileResponse and are rendered as they are
+    if fields is not None:
+        return ORJSONResponse(
+            {
+                "profiles": page.profiles,
+                "total": page.total,
+                "next_cursor": page.next_cursor,
+            }
+        )
+
+    return validated_response(
+        ProfileSearchResponse(
+            profiles=[ProfileResponse.from_entity(p) for p in page.profiles],
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
+    )
+
+
+@router.get("/suggestions", response_model=ProfileSearchResponse)
+async def get_suggestions(
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor of the last page"),
+    fields: frozenset[str] | None = Depends(get_profile_fields),
+    current_user: dict[str, Any] = Depends(get_current_user),
+    uow: AbstractUnitOfWork = Depends(get_uow),
+):
+    """Get compatible profiles near the current user, best matches first."""
+    try:
+        use_case = SuggestProfilesUseCase(uow, profile_store)
+        page = await use_case.execute(current_user["user_id"], limit, cursor, fields)
+
+        return _page_response(page, fields)
+
+    except ValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except NotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+
+@router.get("/search", response_model=ProfileSearchResponse)
+async def search_profiles(
+    search: ProfileSearchRequest = Depends(),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor of the last page"),
+    fields: frozenset[str] | None = Depends(get_profile_fields),
+    current_user: dict[str, Any] = Depends(get_current_user),
+    uow: AbstractUnitOfWork = Depends(get_uow),
+):
+    """Search profiles around a point, nearest and best matching first."""
+    try:
+        use_case = SearchProfilesUseCase(uow, profile_store)
+        page = await use_case.execute(
+            user_id=current_user["user_id"],
+            latitude=search.latitude,
+            longitude=search.longitude,
+            radius_km=search.radius_km,
+            age_min=search.age_min,
+            age_max=search.age_max,
+            gender=search.gender,
+            limit=limit,
+            cursor=cursor,
+            fields=fields,
+        )
+
+        return _page_response(page, fields)
+
+    except ValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -19,7 +19,8 @@ from ....shared.exceptions import (
     NotFoundException,
     ValidationException,
 )
-from ...api.dependencies import get_current_user, get_uow
+from ...api.dependencies import get_current_user, get_profile_fields, get_uow
+from ...api.responses import ORJSONResponse, validated_response
 from ...schemas.profile_schemas import (
     ImageReorderRequest,
     ImageUploadResponse,
@@ -58,7 +59,9 @@ async def create_profile(
             interests=profile_data.interests,
         )
 
-        return ProfileResponse.from_entity(profile)
+        return validated_response(
+            ProfileResponse.from_entity(profile), status.HTTP_201_CREATED
+        )
 
     except ValidationException as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -68,15 +71,21 @@ async def create_profile(
 
 @router.get("/me", response_model=ProfileResponse)
 async def get_my_profile(
+    fields: frozenset[str] | None = Depends(get_profile_fields),
     current_user: User = Depends(get_current_user),
     uow: AbstractUnitOfWork = Depends(get_uow),
 ):
-    """Get the current user's profile."""
+    """Get the current user's profile, or only the requested fields."""
     try:
         use_case = GetProfileUseCase(uow)
+        if fields is not None:
+            return ORJSONResponse(
+                await use_case.execute_projection(current_user.id, fields)
+            )
+
         profile = await use_case.execute(current_user.id)
 
-        return ProfileResponse.from_entity(profile)
+        return validated_response(ProfileResponse.from_entity(profile))
 
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
@@ -104,7 +113,7 @@ async def update_my_profile(
             interests=profile_data.interests,
         )
 
-        return ProfileResponse.from_entity(profile)
+        return validated_response(ProfileResponse.from_entity(profile))
 
     except ValidationException as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
@@ -117,15 +126,21 @@ async def update_my_profile(
 @router.get("/{user_id}", response_model=ProfileResponse)
 async def get_user_profile(
     user_id: int,
+    fields: frozenset[str] | None = Depends(get_profile_fields),
     current_user: User = Depends(get_current_user),
     uow: AbstractUnitOfWork = Depends(get_uow),
 ):
-    """Get another user's profile."""
+    """Get another user's profile, or only the requested fields."""
     try:
         use_case = GetUserProfileUseCase(uow)
+        if fields is not None:
+            return ORJSONResponse(
+                await use_case.execute_projection(current_user.id, user_id, fields)
+            )
+
         profile = await use_case.execute(current_user.id, user_id)
 
-        return ProfileResponse.from_entity(profile)
+        return validated_response(ProfileResponse.from_entity(profile))
 
     except NotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
@@ -186,9 +186,12 @@ class ProfileSearchRequest(BaseModel):
 
 
 class ProfileSearchResponse(BaseModel):
-    """Response schema for profile search results."""
+    """Response schema for a page of ranked profiles (search, suggestions)."""
 
     profiles: list[ProfileResponse] = Field(
         ..., description="List of matching profiles"
     )
     total: int = Field(..., description="Total number of results")
+    next_cursor: str | None = Field(
+        None, description="Cursor of the next page, absent on the last page"
+    )
@@ -0,0 +1,98 @@
+"""The hot lookups of the repositories are served by their indexes.
+
+Test tables are nearly empty, where a sequential scan is always cheapest,
+so sequential scans are disabled to see which index the planner would
+pick at production sizes.
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+pytestmark = pytest.mark.asyncio
+
+# (lookup, index the plan must use). Partitioned tables are scanned through
+# each partition's copy of the index, named <partition>_<columns>_idx.
+HOT_LOOKUPS = [
+    (
+        "SELECT * FROM user_profiles WHERE user_id = 1",
+        "ix_user_profiles_user_id",
+    ),
+    (
+        "SELECT * FROM verification_tokens"
+        " WHERE user_id = 1 AND token_type = 'password_reset'",
+        "ix_verification_tokens_user_id_token_type",
+    ),
+    (
+        "SELECT * FROM likes WHERE user_id = 1 AND target_user_id = 2",
+        "ix_likes_user_id_target_user_id",
+    ),
+    (
+        "SELECT * FROM likes WHERE target_user_id = 1"
+        " ORDER BY created_at DESC LIMIT 20",
+        "ix_likes_target_user_id_created_at",
+    ),
+    (
+        "SELECT * FROM matches WHERE user1_id = 1 AND user2_id = 2",
+        "ix_matches_user1_id_user2_id",
+    ),
+    ("SELECT * FROM matches WHERE user2_id = 1", "ix_matches_user2_id"),
+    (
+        "SELECT * FROM blocked_users WHERE user_id = 1 AND blocked_user_id = 2",
+        "ix_blocked_users_user_id_blocked_user_id",
+    ),
+    (
+        "SELECT * FROM blocked_users WHERE blocked_user_id = 1",
+        "ix_blocked_users_blocked_user_id",
+    ),
+    (
+        "SELECT * FROM reports WHERE reported_user_id = 1",
+        "ix_reports_reported_user_id",
+    ),
+    (
+        "SELECT * FROM conversations WHERE match_id = 1",
+        "ix_conversations_match_id",
+    ),
+    (
+        "SELECT * FROM conversations WHERE user2_id = 1",
+        "ix_conversations_user2_id",
+    ),
+    (
+        "SELECT * FROM visits WHERE visited_user_id = 1"
+        " ORDER BY created_at DESC LIMIT 20",
+        "_visited_user_id_created_at_idx",
+    ),
+    (
+        "SELECT * FROM visits WHERE visitor_id = 1"
+        " ORDER BY created_at DESC LIMIT 20",
+        "_visitor_id_created_at_idx",
+    ),
+    (
+        "SELECT * FROM messages WHERE conversation_id = 1"
+        " ORDER BY created_at DESC LIMIT 50",
+        "_conversation_id_created_at_idx",
+    ),
+    (
+        "SELECT count(*) FROM messages WHERE receiver_id = 1 AND status <> 'read'",
+        "_receiver_id_idx",
+    ),
+    (
+        "SELECT * FROM notifications WHERE user_id = 1"
+        " ORDER BY created_at DESC LIMIT 20",
+        "_user_id_created_at_idx",
+    ),
+    (
+        "SELECT count(*) FROM notifications WHERE user_id = 1 AND NOT read",
+        "_user_id_idx",
+    ),
+]
+
+
+@pytest.mark.parametrize(("lookup", "index"), HOT_LOOKUPS)
+async def test_lookup_uses_index(engine: AsyncEngine, lookup: str, index: str):
+    async with engine.connect() as conn:
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(await conn.scalars(text(f"EXPLAIN {lookup}")))
+        await conn.rollback()
+
+    assert index in plan, plan
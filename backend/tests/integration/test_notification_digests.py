@@ -0,0 +1,142 @@
+"""Notification emails are buffered per user and flushed as one digest"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.application.services.notification_emails import queue_notification_email
+from src.config.settings import get_settings
+from src.core.entities.chat import Notification, NotificationPriority
+from src.core.entities.email_outbox import EmailKind
+from src.infrastructure.database.models.email_outbox_model import EmailOutboxModel
+from src.infrastructure.database.models.notification_digest_model import (
+    NotificationDigestEntryModel,
+)
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+from src.infrastructure.external.email.notification_digests import (
+    flush_due_digests,
+    notification_digest_loop,
+)
+
+USERNAMES = ("digest_due", "digest_fresh")
+
+
+@pytest_asyncio.fixture
+async def user_ids(engine):
+    async with engine.begin() as conn:
+        ids = (
+            await conn.scalars(
+                insert(UserModel)
+                .values(
+                    [
+                        {
+                            "username": username,
+                            "email": f"{username}@example.com",
+                            "password_hash": "hash",
+                            "first_name": "Digest",
+                            "last_name": "Tester",
+                        }
+                        for username in USERNAMES
+                    ]
+                )
+                .returning(UserModel.id)
+            )
+        ).all()
+    yield ids
+    emails = [f"{username}@example.com" for username in USERNAMES]
+    async with engine.begin() as conn:
+        await conn.execute(
+            delete(EmailOutboxModel).where(
+                EmailOutboxModel.payload["email"].astext.in_(emails)
+            )
+        )
+        # Digest entries go with their users
+        await conn.execute(delete(UserModel).where(UserModel.id.in_(ids)))
+
+
+async def _queue(engine, user_id: int, title: str, **fields) -> None:
+    uow = SqlAlchemyUnitOfWork(async_sessionmaker(engine, expire_on_commit=False)())
+    async with uow:
+        notification = Notification(
+            user_id=user_id, type="like", title=title, content=f"{title}!", **fields
+        )
+        assert await queue_notification_email(uow, notification)
+        await uow.commit()
+
+
+async def _outbox_payloads(engine, email: str) -> list[tuple[str, dict]]:
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(EmailOutboxModel.kind, EmailOutboxModel.payload)
+            .where(EmailOutboxModel.payload["email"].astext == email)
+            .order_by(EmailOutboxModel.id)
+        )
+        return [tuple(row) for row in result]
+
+
+@pytest.mark.asyncio
+async def test_due_notifications_are_flushed_as_one_digest(engine, user_ids):
+    due_user, fresh_user = user_ids
+    await _queue(engine, due_user, "First like")
+    await _queue(engine, due_user, "Second like")
+    await _queue(engine, fresh_user, "Fresh like")
+    await _queue(engine, fresh_user, "Urgent", priority=NotificationPriority.URGENT)
+
+    window = get_settings().NOTIFICATION_DIGEST_WINDOW_MINUTES
+    async with engine.begin() as conn:
+        # Age the first user's entries past the window
+        await conn.execute(
+            update(NotificationDigestEntryModel)
+            .where(NotificationDigestEntryModel.user_id == due_user)
+            .values(
+                created_at=NotificationDigestEntryModel.created_at
+                - timedelta(minutes=window + 1)
+            )
+        )
+
+    assert await flush_due_digests(engine) >= 1
+
+    [(kind, payload)] = await _outbox_payloads(engine, "digest_due@example.com")
+    assert kind == EmailKind.NOTIFICATION_DIGEST.value
+    assert [entry["title"] for entry in payload["notifications"]] == [
+        "First like",
+        "Second like",
+    ]
+    # The urgent notification skipped the buffer, the other one still waits
+    assert await _outbox_payloads(engine, "digest_fresh@example.com") == [
+        (
+            EmailKind.NOTIFICATION.value,
+            {
+                "email": "digest_fresh@example.com",
+                "subject": "Urgent",
+                "message": "Urgent!",
+            },
+        )
+    ]
+    async with engine.connect() as conn:
+        remaining = (
+            await conn.scalars(
+                select(NotificationDigestEntryModel.user_id).where(
+                    NotificationDigestEntryModel.user_id.in_(user_ids)
+                )
+            )
+        ).all()
+    assert remaining == [fresh_user]
+
+
+@pytest.mark.asyncio
+async def test_disabled_digests_drain_the_buffer_and_stop(
+    engine, user_ids, monkeypatch
+):
+    await _queue(engine, user_ids[0], "Buffered like")
+    monkeypatch.setattr(get_settings(), "NOTIFICATION_DIGEST_WINDOW_MINUTES", 0)
+
+    await asyncio.wait_for(notification_digest_loop(engine), timeout=5)
+
+    [(kind, _)] = await _outbox_payloads(engine, "digest_due@example.com")
+    assert kind == EmailKind.NOTIFICATION.value
@@ -0,0 +1,146 @@
+"""The outbox dispatcher sends outside the claiming transaction"""
+
+import asyncio
+from smtplib import SMTPRecipientsRefused
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, insert, select, text, update
+
+from src.config.settings import get_settings
+from src.core.entities.email_outbox import EmailKind, OutboxStatus
+from src.infrastructure.database.models.email_outbox_model import EmailOutboxModel
+from src.infrastructure.external.email.outbox_dispatcher import dispatch_batch
+
+RECIPIENTS = ["outbox_ok@example.com", "outbox_bad@example.com"]
+
+
+class RecordingEmailService:
+    """Fails for one recipient and checks no outbox row is locked mid-send"""
+
+    def __init__(self, engine, failing_email: str | None = None):
+        self.engine = engine
+        self.failing_email = failing_email
+        self.sent: list[str] = []
+
+    async def send_notification_email(self, email, subject, message):
+        async with self.engine.connect() as conn:
+            await conn.execute(text("SET LOCAL lock_timeout = '100ms'"))
+            await conn.execute(
+                select(EmailOutboxModel.id).with_for_update(nowait=True)
+            )
+        if email == self.failing_email:
+            raise SMTPRecipientsRefused({email: (550, b"No such user")})
+        self.sent.append(email)
+        return True
+
+
+@pytest_asyncio.fixture
+async def email_ids(engine):
+    async with engine.begin() as conn:
+        # Earlier pending rows would be claimed too; defer them out of reach
+        await conn.execute(
+            text(
+                "UPDATE email_outbox SET available_at = available_at + "
+                "interval '100 years' WHERE status = 'pending'"
+            )
+        )
+        ids = (
+            await conn.scalars(
+                insert(EmailOutboxModel)
+                .values(
+                    [
+                        {
+                            "kind": EmailKind.NOTIFICATION.value,
+                            "payload": {
+                                "email": email,
+                                "subject": "Hi",
+                                "message": "Hello",
+                            },
+                        }
+                        for email in RECIPIENTS
+                    ]
+                )
+                .returning(EmailOutboxModel.id)
+            )
+        ).all()
+    yield ids
+    async with engine.begin() as conn:
+        await conn.execute(delete(EmailOutboxModel).where(EmailOutboxModel.id.in_(ids)))
+        await conn.execute(
+            text(
+                "UPDATE email_outbox SET available_at = available_at - "
+                "interval '100 years' WHERE status = 'pending'"
+            )
+        )
+
+
+async def _rows(engine, email_ids):
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(
+                EmailOutboxModel.status,
+                EmailOutboxModel.attempts,
+                EmailOutboxModel.last_error,
+            )
+            .where(EmailOutboxModel.id.in_(email_ids))
+            .order_by(EmailOutboxModel.id)
+        )
+        return result.all()
+
+
+@pytest.mark.asyncio
+async def test_dispatch_records_sent_and_failed_emails(engine, email_ids):
+    email_service = RecordingEmailService(engine, failing_email=RECIPIENTS[1])
+
+    assert await dispatch_batch(engine, email_service) == 2
+
+    assert email_service.sent == RECIPIENTS[:1]
+    sent, failed = await _rows(engine, email_ids)
+    assert (sent.status, sent.attempts) == (OutboxStatus.SENT.value, 1)
+    # Still pending for a retry, with the SMTP error itself recorded
+    assert (failed.status, failed.attempts) == (OutboxStatus.PENDING.value, 1)
+    assert "SMTPRecipientsRefused" in failed.last_error
+    assert "No such user" in failed.last_error
+
+
+@pytest.mark.asyncio
+async def test_sends_past_half_the_lease_are_abandoned(
+    engine, email_ids, monkeypatch
+):
+    class HangingEmailService:
+        async def send_notification_email(self, email, subject, message):
+            await asyncio.sleep(10)
+
+    monkeypatch.setattr(get_settings(), "EMAIL_OUTBOX_LEASE_SECONDS", 1)
+
+    await asyncio.wait_for(dispatch_batch(engine, HangingEmailService()), 5)
+
+    for row in await _rows(engine, email_ids):
+        assert (row.status, row.attempts) == (OutboxStatus.PENDING.value, 1)
+        assert row.last_error == "Not sent before the claim deadline"
+
+
+@pytest.mark.asyncio
+async def test_outcome_is_not_recorded_once_claimed_again(engine, email_ids):
+    class ReclaimingEmailService(RecordingEmailService):
+        async def send_notification_email(self, email, subject, message):
+            # Another dispatcher claims the row after this lease ran out
+            async with self.engine.begin() as conn:
+                await conn.execute(
+                    update(EmailOutboxModel)
+                    .where(EmailOutboxModel.payload["email"].astext == email)
+                    .values(attempts=EmailOutboxModel.attempts + 1)
+                )
+            return await super().send_notification_email(email, subject, message)
+
+    email_service = ReclaimingEmailService(engine, failing_email=RECIPIENTS[1])
+
+    await dispatch_batch(engine, email_service)
+
+    for row in await _rows(engine, email_ids):
+        assert (row.status, row.attempts, row.last_error) == (
+            OutboxStatus.PENDING.value,
+            2,
+            None,
+        )
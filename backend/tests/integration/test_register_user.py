@@ -0,0 +1,61 @@
+"""A new user commits together with the email queued for it, or not at all"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core.entities.email_outbox import EmailKind, OutboxEmail
+from src.core.entities.user import User, UserStatus
+from src.core.value_objects.email import Email
+from src.infrastructure.database.models.email_outbox_model import EmailOutboxModel
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.repositories.email_outbox_repository_impl import (
+    EmailOutboxRepositoryImpl,
+)
+from src.infrastructure.database.unit_of_work import SqlAlchemyUnitOfWork
+
+USERNAME = "outbox_rollback"
+
+
+async def _failing_enqueue(self, email):
+    # kind is NOT NULL, so the insert fails inside the signup transaction
+    await self.session.execute(
+        insert(EmailOutboxModel).values(kind=None, payload=email.payload)
+    )
+
+
+@pytest.mark.asyncio
+async def test_failing_outbox_insert_rolls_back_the_user(engine, monkeypatch):
+    monkeypatch.setattr(EmailOutboxRepositoryImpl, "enqueue", _failing_enqueue)
+    now = datetime.now(UTC).replace(tzinfo=None)
+    uow = SqlAlchemyUnitOfWork(async_sessionmaker(engine, expire_on_commit=False)())
+
+    with pytest.raises(IntegrityError):
+        async with uow:
+            await uow.users.create(
+                User(
+                    username=USERNAME,
+                    email=Email(f"{USERNAME}@example.com"),
+                    password_hash="hash",
+                    first_name="Outbox",
+                    last_name="Rollback",
+                    status=UserStatus.PENDING_VERIFICATION,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+            await uow.email_outbox.enqueue(
+                OutboxEmail(kind=EmailKind.VERIFICATION, payload={})
+            )
+            await uow.commit()
+
+    async with engine.begin() as conn:
+        user_id = await conn.scalar(
+            select(UserModel.id).where(UserModel.username == USERNAME)
+        )
+        if user_id is not None:  # keep the database clean for other runs
+            await conn.execute(delete(UserModel).where(UserModel.id == user_id))
+    assert user_id is None
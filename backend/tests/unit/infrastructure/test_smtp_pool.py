@@ -0,0 +1,152 @@
+"""SMTPConnectionPool against an in-process aiosmtpd server"""
+
+import asyncio
+import socket
+
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+
+from src.infrastructure.external.email.smtp_pool import SMTPConnectionPool
+
+SENDER = "noreply@example.com"
+REFUSED = "nobody@example.com"
+MESSAGE = b"Subject: Hi\r\n\r\nHello\r\n"
+
+
+class RecordingHandler:
+    """Accepts everything except mail to REFUSED and counts what it sees.
+
+    Hooks run on the controller's thread; the tests only read the counts
+    once their sends have completed.
+    """
+
+    def __init__(self):
+        self.sessions = 0
+        self.messages = 0
+        self.noops = 0
+        self.resets = 0
+        self.drop_on_noop = False
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        session.host_name = hostname
+        self.sessions += 1
+        return responses
+
+    async def handle_NOOP(self, server, session, envelope, arg):
+        self.noops += 1
+        if self.drop_on_noop:
+            # What a server says when it closes an idle client
+            return "421 Idle timeout, closing connection"
+        return "250 OK"
+
+    async def handle_RSET(self, server, session, envelope):
+        self.resets += 1
+        return "250 OK"
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address == REFUSED:
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages += 1
+        return "250 Message accepted"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def handler():
+    return RecordingHandler()
+
+
+@pytest.fixture
+def port(handler):
+    port = _free_port()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield port
+    controller.stop()
+
+
+def _pool(port: int, **options) -> SMTPConnectionPool:
+    return SMTPConnectionPool(hostname="127.0.0.1", port=port, timeout=5, **options)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sends_reuse_at_most_size_connections(handler, port):
+    pool = _pool(port, size=2)
+    try:
+        await asyncio.gather(
+            *(
+                pool.sendmail(SENDER, [f"user{i}@example.com"], MESSAGE)
+                for i in range(20)
+            )
+        )
+    finally:
+        await pool.close()
+
+    assert handler.messages == 20
+    assert pool.connections_opened <= 2
+    assert handler.sessions == pool.connections_opened
+
+
+@pytest.mark.asyncio
+async def test_idle_session_dropped_by_the_server_is_replaced(handler, port):
+    # Every reuse is probed with NOOP
+    pool = _pool(port, size=1, health_check_after=0)
+    try:
+        await pool.sendmail(SENDER, ["first@example.com"], MESSAGE)
+        handler.drop_on_noop = True
+        await pool.sendmail(SENDER, ["second@example.com"], MESSAGE)
+    finally:
+        await pool.close()
+
+    assert handler.noops == 1
+    assert pool.connections_opened == 2
+    assert handler.messages == 2
+
+
+@pytest.mark.asyncio
+async def test_refused_recipient_only_resets_the_session(handler, port):
+    pool = _pool(port, size=1)
+    try:
+        with pytest.raises(aiosmtplib.SMTPRecipientsRefused):
+            await pool.sendmail(SENDER, [REFUSED], MESSAGE)
+        await pool.sendmail(SENDER, ["someone@example.com"], MESSAGE)
+    finally:
+        await pool.close()
+
+    assert handler.resets >= 1
+    assert pool.connections_opened == 1
+    assert handler.messages == 1
+
+
+@pytest.mark.asyncio
+async def test_send_is_retried_on_a_new_connection_after_a_disconnect(
+    handler, port
+):
+    pool = _pool(port, size=1)
+    attempts = []
+
+    async def send(client: aiosmtplib.SMTP) -> None:
+        attempts.append(client)
+        if len(attempts) == 1:
+            raise aiosmtplib.SMTPServerDisconnected("Connection lost")
+        await client.sendmail(SENDER, ["retried@example.com"], MESSAGE)
+
+    try:
+        await pool._with_retry(send)
+    finally:
+        await pool.close()
+
+    assert len(attempts) == 2
+    assert attempts[0] is not attempts[1]
+    assert pool.connections_opened == 2
+    assert handler.messages == 1